@@ -1,10 +1,26 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from api.dependencies import shutdown_monitor
+from api.routes.monitoring import router as monitoring_router
 from api.routes.predict import router
+from credit_risk.utils.threads import apply_thread_budget, serving_threads
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Cap native thread pools in the serving process before any model is
+    # loaded; importing the app (tests, benchmarks) leaves them untouched
+    apply_thread_budget(serving_threads())
+    yield
+    shutdown_monitor()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Credit Risk Prediction API",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     @app.get("/")
@@ -16,6 +32,7 @@ def create_app() -> FastAPI:
         }
 
     app.include_router(router)
+    app.include_router(monitoring_router)
     return app
 
 
@@ -1,9 +1,14 @@
-import joblib
+import os
 from pathlib import Path
 from functools import lru_cache
 from typing import Dict, Any
 
+from credit_risk.models.predict import load_serving_artifacts
+from credit_risk.monitoring.bins import FeatureBins
+from credit_risk.monitoring.monitor import PredictionMonitor
+from credit_risk.utils.config import monitoring_config, serving_config
 from credit_risk.utils.logging import get_logger
+from credit_risk.utils.paths import monitoring_dir
 
 logger = get_logger(__name__)
 
@@ -13,7 +18,10 @@ logger = get_logger(__name__)
 MODEL_NAME = "xgboost"
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-MODEL_DIR = PROJECT_ROOT / "models" / MODEL_NAME
+MODEL_DIR = Path(
+    os.environ.get(serving_config.MODEL_DIR_ENV) or PROJECT_ROOT / "models" / MODEL_NAME
+)
+MONITORING_DIR = Path(os.environ.get(monitoring_config.DIR_ENV) or monitoring_dir)
 
 MODEL_PATH = MODEL_DIR / "model.pkl"
 FEATURE_BUILDER_PATH = MODEL_DIR / "feature_builder.pkl"
@@ -37,16 +45,29 @@ def load_artifacts() -> Dict[str, Any]:
     if not FEATURE_BUILDER_PATH.exists():
         raise FileNotFoundError("feature_builder.pkl not found. Run training first.")
 
-    model = joblib.load(MODEL_PATH)
-    feature_builder = joblib.load(FEATURE_BUILDER_PATH)
+    # Low-latency paths: in-place booster prediction (XGBoost) or the
+    # fused NumPy scorer that replaces FeatureBuilder + model (logistic)
+    artifacts = load_serving_artifacts(MODEL_DIR)
 
     logger.info("Model and FeatureBuilder loaded successfully")
 
-    return {
-        "model": model,
-        "feature_builder": feature_builder,
-        "model_name": MODEL_NAME,
-    }
+    # Live score / decision / input histograms, flushed to data/monitoring/.
+    # With a drift baseline, inputs are binned on its edges so PSI / CSI
+    # come from the same counts.
+    baseline = artifacts["drift_baseline"]
+    if baseline is not None:
+        feature_bins = baseline.bins
+    else:
+        feature_bins = FeatureBins.from_feature_builder(artifacts["feature_builder"])
+
+    monitor = PredictionMonitor(
+        feature_bins,
+        model_name=MODEL_NAME,
+        output_dir=MONITORING_DIR / MODEL_NAME,
+        drift_baseline=baseline,
+    ).start()
+
+    return {**artifacts, "model_name": MODEL_NAME, "monitor": monitor}
 
 
 # -------------------------------------------------
@@ -54,3 +75,11 @@ def load_artifacts() -> Dict[str, Any]:
 # -------------------------------------------------
 def get_artifacts() -> Dict[str, Any]:
     return load_artifacts()
+
+
+def shutdown_monitor():
+    """
+    Flush the monitor on shutdown, if the artifacts were ever loaded.
+    """
+    if load_artifacts.cache_info().currsize:
+        load_artifacts()["monitor"].stop()
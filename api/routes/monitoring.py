@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.dependencies import get_artifacts
+from credit_risk.utils.config import drift_config
+from credit_risk.utils.logging import dropped_log_records
+
+router = APIRouter()
+
+
+# -------------------------------------------------
+# LIVE MONITORING SNAPSHOT
+# -------------------------------------------------
+def _monitor(artifacts: dict):
+    monitor = artifacts.get("monitor")
+    if monitor is None:
+        raise HTTPException(status_code=503, detail="Monitoring is not enabled")
+    return monitor
+
+
+@router.get("/monitoring/snapshot")
+def monitoring_snapshot(artifacts: dict = Depends(get_artifacts)):
+    return {
+        **_monitor(artifacts).snapshot(),
+        "dropped_log_records": dropped_log_records(),
+    }
+
+
+# -------------------------------------------------
+# DRIFT AGAINST THE TRAINING BASELINE
+# -------------------------------------------------
+@router.get("/monitoring/drift")
+def monitoring_drift(
+    warning: float = drift_config.PSI_WARNING,
+    alert: float = drift_config.PSI_ALERT,
+    artifacts: dict = Depends(get_artifacts),
+):
+    report = _monitor(artifacts).drift_report(warning=warning, alert=alert)
+    if report is None:
+        raise HTTPException(
+            status_code=404, detail="No drift baseline for the served model"
+        )
+    return {
+        "warning": warning,
+        "alert": alert,
+        "features": report.to_dict("records"),
+    }
@@ -13,34 +13,34 @@ from api.schemas import (
     RiskCategory,
 )
 from api.dependencies import get_artifacts
-from credit_risk.utils.logging import get_logger
+from credit_risk.models.decision import RECOMMENDATIONS, risk_bucket
+from credit_risk.models.predict import predict_default_proba
+from credit_risk.utils.logging import get_logger, sampled_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Per-route sampling (CREDIT_RISK_LOG_SAMPLE); %-style args are only
+# formatted for records that are kept, off the request thread in json mode
+single_log = sampled_logger(logger, "/predict")
+batch_log = sampled_logger(logger, "/predict/batch")
+
 # -------------------------------------------------
 # Business thresholds
+# Bands come from thresholds.json when the model directory has one
+# (scripts/optimize_thresholds.py), otherwise from DecisionConfig.
 # -------------------------------------------------
-LOW_RISK_THRESHOLD = 0.30
-HIGH_RISK_THRESHOLD = 0.60
+RISK_CATEGORIES = [RiskCategory.LOW, RiskCategory.MEDIUM, RiskCategory.HIGH]
 
 
-def classify_risk(prob: float) -> RiskCategory:
-    if prob < LOW_RISK_THRESHOLD:
-        return RiskCategory.LOW
-    elif prob < HIGH_RISK_THRESHOLD:
-        return RiskCategory.MEDIUM
-    else:
-        return RiskCategory.HIGH
+def decision_bands(probs, rows: list, artifacts: dict):
+    buckets = risk_bucket(probs, **artifacts.get("thresholds", {}))
 
+    monitor = artifacts.get("monitor")
+    if monitor is not None:
+        monitor.record(probs, buckets, rows)
 
-def decision(prob: float) -> str:
-    if prob < LOW_RISK_THRESHOLD:
-        return "Approve"
-    elif prob < HIGH_RISK_THRESHOLD:
-        return "Review"
-    else:
-        return "Reject"
+    return [(RISK_CATEGORIES[b], str(RECOMMENDATIONS[b])) for b in buckets]
 
 
 # -------------------------------------------------
@@ -51,26 +51,24 @@ def predict_single(
     loan: LoanRequest,
     artifacts: dict = Depends(get_artifacts),
 ):
-    logger.info("Received single prediction request")
+    single_log.info("Received single prediction request")
 
     # 1. Convert request to DataFrame
-    df = pd.DataFrame([loan.model_dump()])
-
-    # 2. Feature engineering
-    feature_builder = artifacts["feature_builder"]
-    X, _ = feature_builder.build_features(df, fit=False)
+    rows = [loan.model_dump()]
+    df = pd.DataFrame(rows)
 
-    # 3. Model prediction
-    model = artifacts["model"]
-    prob = float(model.predict_proba(X)[0, 1])
+    # 2. Feature engineering + model prediction
+    probs = predict_default_proba(df, artifacts)
+    prob = float(probs[0])
+    category, action = decision_bands(probs, rows, artifacts)[0]
 
-    # 4. Build response
+    # 3. Build response
     return PredictionResponse(
         loan_id=None,
         default_probability=round(prob, 4),
         default_prediction=int(prob >= 0.5),
-        risk_category=classify_risk(prob),
-        recommendation=decision(prob),
+        risk_category=category,
+        recommendation=action,
     )
 
 
@@ -82,25 +80,24 @@ def predict_batch(
     batch: BatchLoanRequest,
     artifacts: dict = Depends(get_artifacts),
 ):
-    logger.info(f"Received batch request with {len(batch.loans)} loans")
-
-    df = pd.DataFrame([loan.model_dump() for loan in batch.loans])
+    batch_log.info("Received batch request with %d loans", len(batch.loans))
 
-    feature_builder = artifacts["feature_builder"]
-    X, _ = feature_builder.build_features(df, fit=False)
+    rows = [loan.model_dump() for loan in batch.loans]
+    df = pd.DataFrame(rows)
 
-    model = artifacts["model"]
-    probs = model.predict_proba(X)[:, 1]
+    probs = predict_default_proba(df, artifacts)
 
     predictions = []
-    for idx, prob in enumerate(probs):
+    for idx, (prob, (category, action)) in enumerate(
+        zip(probs, decision_bands(probs, rows, artifacts))
+    ):
         predictions.append(
             PredictionResponse(
                 loan_id=idx,
                 default_probability=round(float(prob), 4),
                 default_prediction=int(prob >= 0.5),
-                risk_category=classify_risk(prob),
-                recommendation=decision(prob),
+                risk_category=category,
+                recommendation=action,
             )
         )
 
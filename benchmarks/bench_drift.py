@@ -0,0 +1,79 @@
+"""
+Memory and throughput of streamed drift computation.
+
+    python benchmarks/bench_drift.py --rows 10000000
+
+Writes a synthetic scored portfolio to a temporary Parquet file in
+chunks, then streams it through `drift_from_parquet`. Peak RSS should
+stay flat as --rows grows: only bin counts are kept.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from credit_risk.data.synthetic import synthetic_cleaned_loans
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.monitoring.drift import DriftBaseline, drift_from_parquet
+from credit_risk.utils.memory import current_rss_mb
+from credit_risk.utils.profiling import _RssSampler
+
+CHUNK_ROWS = 500_000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch-rows", type=int, default=100_000)
+    return parser.parse_args()
+
+
+def _write_portfolio(path: Path, n_rows: int):
+    writer = None
+    for start in range(0, n_rows, CHUNK_ROWS):
+        chunk = synthetic_cleaned_loans(min(CHUNK_ROWS, n_rows - start), seed=start)
+        chunk["default_probability"] = np.random.default_rng(start).beta(
+            2, 5, len(chunk)
+        )
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema)
+        writer.write_table(table, row_group_size=CHUNK_ROWS)
+    writer.close()
+
+
+def main():
+    args = parse_args()
+
+    reference = synthetic_cleaned_loans(200_000)
+    feature_builder = FeatureBuilder()
+    feature_builder.build_features(reference, fit=True)
+    baseline = DriftBaseline.build(
+        reference, np.random.default_rng(1).beta(2, 5, len(reference)), feature_builder
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "portfolio.parquet"
+        _write_portfolio(path, args.rows)
+        del reference
+
+        rss_before = current_rss_mb()
+        start = time.perf_counter()
+        with _RssSampler() as sampler:
+            report = drift_from_parquet(path, baseline, batch_rows=args.batch_rows)
+        seconds = time.perf_counter() - start
+
+    print(report.report().head(10).to_string(index=False))
+    print(
+        f"\n{args.rows:,} rows in {seconds:.1f}s ({args.rows / seconds:,.0f} rows/s), "
+        f"RSS {rss_before:.0f} MB before, {sampler.peak:.0f} MB peak"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Cost of request logging: per call, and as /predict throughput.
+
+    cd benchmarks
+    PYTHONPATH=../src:.. python bench_logging.py --requests 2000
+
+Modes: logging off (level WARNING), plain (format + write on the request
+thread), json (queued, formatted and written by the listener thread) and
+json with 1% sampling of the route's info messages. Output goes to
+/dev/null so only the logging path is timed, not the terminal.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from api.app import create_app
+from api.dependencies import get_artifacts
+from credit_risk.utils.logging import configure_logging, get_logger, sampled_logger
+from timing import time_call
+
+MODES = {
+    "off": {"mode": "plain", "level": "WARNING", "sample_rates": {}},
+    "plain": {"mode": "plain", "level": "INFO", "sample_rates": {}},
+    "json": {"mode": "json", "level": "INFO", "sample_rates": {}},
+    "json sampled": {
+        "mode": "json",
+        "level": "INFO",
+        "sample_rates": {"/bench": 0.01, "/predict": 0.01, "/predict/batch": 0.01},
+    },
+}
+
+
+class ConstantFeatureBuilder:
+    def build_features(self, df, fit=False):
+        return np.zeros((len(df), 1)), None
+
+
+class ConstantModel:
+    def predict_proba(self, X):
+        return np.column_stack([np.full(len(X), 0.8), np.full(len(X), 0.2)])
+
+
+PAYLOAD = {
+    "issue_d": "Jan-2018",
+    "earliest_cr_line": "May-2002",
+    "fico_range_low": 650,
+    "fico_range_high": 700,
+    "loan_amnt": 10000.0,
+    "int_rate": 12.5,
+    "installment": 250.0,
+    "annual_inc": 60000.0,
+    "dti": 18.0,
+    "revol_bal": 5000.0,
+    "revol_util": 35.0,
+    "open_acc": 8,
+    "total_acc": 20,
+    "mort_acc": 1,
+    "emp_length_num": 5.0,
+    "pub_rec": 0,
+    "pub_rec_bankruptcies": 0,
+    "emp_length_missing": 0,
+    "revol_util_missing": 0,
+    "mort_acc_missing": 0,
+    "term": "36 months",
+    "grade": "B",
+    "sub_grade": "B2",
+    "home_ownership": "RENT",
+    "verification_status": "Verified",
+    "purpose": "debt_consolidation",
+    "application_type": "Individual",
+    "initial_list_status": "w",
+    "addr_state": "CA",
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    return parser.parse_args()
+
+
+def requests_per_second(client, n_requests: int) -> float:
+    for _ in range(20):
+        client.post("/predict", json=PAYLOAD)
+    start = time.perf_counter()
+    for _ in range(n_requests):
+        client.post("/predict", json=PAYLOAD)
+    return n_requests / (time.perf_counter() - start)
+
+
+def main():
+    args = parse_args()
+
+    app = create_app()
+    app.dependency_overrides[get_artifacts] = lambda: {
+        "model": ConstantModel(),
+        "feature_builder": ConstantFeatureBuilder(),
+        "model_name": "xgboost",
+    }
+    client = TestClient(app)
+    logger = get_logger("credit_risk.bench")
+    route_log = sampled_logger(logger, "/bench")
+
+    results = []
+    stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        for name, settings in MODES.items():
+            sys.stdout = devnull
+            try:
+                configure_logging(**settings)
+                call = time_call(
+                    route_log.info,
+                    "Received batch request with %d loans",
+                    100,
+                    repeats=args.calls,
+                )
+                rps = requests_per_second(client, args.requests)
+                # Drains the queue, so json pays for its writes in this mode
+                configure_logging(mode="plain", level="WARNING", sample_rates={})
+            finally:
+                sys.stdout = stdout
+            results.append((name, call["p50_us"], call["p99_us"], rps))
+
+    configure_logging(mode="plain", level="INFO", sample_rates={})
+    print(f"{'mode':<14}{'call p50 us':>14}{'call p99 us':>14}{'/predict rps':>14}")
+    for name, p50, p99, rps in results:
+        print(f"{name:<14}{p50:>14.2f}{p99:>14.2f}{rps:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Latency of FeatureBuilder + SGDClassifier vs the fused linear scorer.
+
+    python benchmarks/bench_logistic_inference.py [--model-dir models/logistic]
+
+Without --model-dir a model is fitted on synthetic loans.
+"""
+
+import argparse
+from pathlib import Path
+
+import joblib
+import pandas as pd
+
+from credit_risk.data.synthetic import synthetic_cleaned_loans
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.models.serving import FusedLinearScorer
+from credit_risk.utils.logging import get_logger
+from timing import time_call
+
+logger = get_logger(__name__)
+
+BATCH_SIZES = (1, 10, 100, 1000)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model-dir", type=Path, default=None)
+    parser.add_argument("--repeats", type=int, default=200)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.model_dir is not None:
+        model = joblib.load(args.model_dir / "model.pkl")
+        feature_builder = joblib.load(args.model_dir / "feature_builder.pkl")
+    else:
+        feature_builder = FeatureBuilder()
+        X, y = feature_builder.build_features(
+            synthetic_cleaned_loans(20_000), fit=True
+        )
+        model = LogisticSGDModel().train(X, y)
+
+    scorer = FusedLinearScorer.from_artifacts(model, feature_builder)
+
+    def sklearn_path(df):
+        X, _ = feature_builder.build_features(df, fit=False)
+        return model.predict_proba(X)[:, 1]
+
+    rows = []
+    for batch_size in BATCH_SIZES:
+        df = synthetic_cleaned_loans(batch_size, seed=1).drop(columns=["is_default"])
+        baseline = time_call(sklearn_path, df, repeats=args.repeats)
+        fused = time_call(scorer.predict_positive, df, repeats=args.repeats)
+        rows.append(
+            {
+                "batch_size": batch_size,
+                "sklearn_p50_us": baseline["p50_us"],
+                "fused_p50_us": fused["p50_us"],
+                "sklearn_p99_us": baseline["p99_us"],
+                "fused_p99_us": fused["p99_us"],
+                "speedup_p50": baseline["p50_us"] / fused["p50_us"],
+            }
+        )
+
+    print(pd.DataFrame(rows).round(1).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Evaluation cost of the previous metrics (pandas KS + separate sklearn AUC
+and confusion matrix) vs the single-sort engine and the histogram
+accumulator.
+
+    python benchmarks/bench_metrics.py --rows 1000000 10000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import confusion_matrix, roc_auc_score
+
+from credit_risk.evaluation.metrics import MetricsAccumulator, evaluate_classification
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--chunks", type=int, default=10)
+    return parser.parse_args()
+
+
+def legacy_evaluate(y_true, y_prob, threshold=0.5):
+    data = pd.DataFrame({"y_true": y_true, "y_prob": y_prob}).sort_values(
+        "y_prob", ascending=False
+    )
+    data["cum_good"] = (data["y_true"] == 0).cumsum() / (data["y_true"] == 0).sum()
+    data["cum_bad"] = (data["y_true"] == 1).cumsum() / (data["y_true"] == 1).sum()
+
+    return {
+        "roc_auc": roc_auc_score(y_true, y_prob),
+        "ks": (data["cum_bad"] - data["cum_good"]).abs().max(),
+        "confusion_matrix": confusion_matrix(y_true, (y_prob >= threshold).astype(int)),
+    }
+
+
+def histogram_evaluate(y_true, y_prob, n_chunks):
+    accumulator = MetricsAccumulator()
+    for idx in np.array_split(np.arange(len(y_true)), n_chunks):
+        accumulator.update(y_true[idx], y_prob[idx])
+    return accumulator.compute()
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for n in args.rows:
+        y = rng.integers(0, 2, n)
+        prob = 1 / (1 + np.exp(-rng.normal(y - 0.5, 1.0)))
+
+        legacy, legacy_s = _timed(legacy_evaluate, y, prob)
+        exact, exact_s = _timed(evaluate_classification, y, prob)
+        approx, approx_s = _timed(histogram_evaluate, y, prob, args.chunks)
+
+        rows.append(
+            {
+                "rows": n,
+                "legacy_s": legacy_s,
+                "single_sort_s": exact_s,
+                "histogram_s": approx_s,
+                "speedup_single_sort": legacy_s / exact_s,
+                "speedup_histogram": legacy_s / approx_s,
+                "auc_diff_exact": abs(exact["roc_auc"] - legacy["roc_auc"]),
+                "auc_diff_hist": abs(approx["roc_auc"] - legacy["roc_auc"]),
+                "ks_diff_hist": abs(approx["ks"] - legacy["ks"]),
+            }
+        )
+
+    with pd.option_context("display.float_format", "{:.3g}".format):
+        print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
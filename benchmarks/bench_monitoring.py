@@ -0,0 +1,70 @@
+"""
+Per-request cost of feeding the prediction monitor.
+
+    python benchmarks/bench_monitoring.py --requests 20000
+
+`record` is what a /predict request pays; `fold` runs on the monitor's
+background thread (and on snapshots) and is reported per request.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from credit_risk.data.synthetic import synthetic_cleaned_loans
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.decision import risk_bucket
+from credit_risk.monitoring.bins import FeatureBins
+from credit_risk.monitoring.monitor import PredictionMonitor
+from timing import time_call
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[1, 100])
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    loans = synthetic_cleaned_loans(20_000)
+    feature_builder = FeatureBuilder()
+    feature_builder.build_features(loans, fit=True)
+    bins = FeatureBins.from_feature_builder(feature_builder)
+
+    rows = []
+    for batch_size in args.batch_size:
+        monitor = PredictionMonitor(bins)
+        payload = loans.drop(columns=["is_default"]).head(batch_size)
+        records = payload.to_dict("records")
+        probs = np.random.default_rng(0).random(batch_size)
+        buckets = risk_bucket(probs)
+
+        record = time_call(
+            monitor.record, probs, buckets, records, repeats=args.requests, warmup=100
+        )
+
+        # Everything queued above is binned here, off the request path
+        n_queued = len(monitor._pending)
+        start = time.perf_counter()
+        monitor.fold()
+        fold_us = (time.perf_counter() - start) * 1e6 / n_queued
+
+        rows.append(
+            {
+                "batch_size": batch_size,
+                "record_p50_us": record["p50_us"],
+                "record_p99_us": record["p99_us"],
+                "fold_us_per_request": fold_us,
+            }
+        )
+
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Throughput and tail latency of concurrent scoring workers with and
+without the thread budget.
+
+    python benchmarks/bench_thread_budget.py --workers 1 2 4 --seconds 10
+
+Every worker process scores fixed-size batches with an XGBoost booster
+and a small BLAS product (standing in for NumPy / sklearn work) in a
+loop. "budgeted" applies credit_risk.utils.threads (cores / workers
+threads per process); "unbounded" leaves every library at one thread
+per core, the previous default.
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+from credit_risk.utils.threads import (
+    apply_thread_budget,
+    available_cores,
+    thread_budget,
+)
+
+POLICIES = ("budgeted", "unbounded")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--n-features", type=int, default=100)
+    return parser.parse_args()
+
+
+def _train_booster(path: Path, n_features: int):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(20_000, n_features)).astype(np.float32)
+    y = (X[:, :5].sum(axis=1) + rng.normal(size=len(X)) > 0).astype(int)
+    booster = xgb.train(
+        {"objective": "binary:logistic", "max_depth": 5},
+        xgb.DMatrix(X, label=y),
+        num_boost_round=300,
+    )
+    booster.save_model(path)
+
+
+def _worker(model_path, threads, batch_size, n_features, start_at, seconds):
+    if threads is not None:
+        apply_thread_budget(threads)
+
+    booster = xgb.Booster(model_file=model_path)
+    booster.set_param({"nthread": threads or available_cores()})
+
+    rng = np.random.default_rng()
+    X = rng.normal(size=(batch_size, n_features)).astype(np.float32)
+    gram = rng.normal(size=(batch_size, batch_size))
+
+    booster.inplace_predict(X)
+    time.sleep(max(0.0, start_at - time.time()))
+
+    latencies = []
+    end = time.time() + seconds
+    while time.time() < end:
+        start = time.perf_counter()
+        booster.inplace_predict(X)
+        gram @ gram
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    args = parse_args()
+    cores = available_cores()
+    ctx = mp.get_context("spawn")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = str(Path(tmp_dir) / "booster.ubj")
+        _train_booster(model_path, args.n_features)
+
+        for n_workers in args.workers:
+            for policy in POLICIES:
+                threads = (
+                    thread_budget(n_workers, cores).threads
+                    if policy == "budgeted"
+                    else None
+                )
+                # Leave time for the spawned workers to import and load
+                start_at = time.time() + 5
+                with ProcessPoolExecutor(n_workers, mp_context=ctx) as pool:
+                    futures = [
+                        pool.submit(
+                            _worker,
+                            model_path,
+                            threads,
+                            args.batch_size,
+                            args.n_features,
+                            start_at,
+                            args.seconds,
+                        )
+                        for _ in range(n_workers)
+                    ]
+                    latencies = np.concatenate([f.result() for f in futures])
+
+                rows.append(
+                    {
+                        "workers": n_workers,
+                        "policy": policy,
+                        "threads_per_worker": threads or cores,
+                        "rows_per_s": len(latencies) * args.batch_size / args.seconds,
+                        "p50_ms": np.percentile(latencies, 50) * 1e3,
+                        "p99_ms": np.percentile(latencies, 99) * 1e3,
+                    }
+                )
+
+    print(f"{cores} cores available")
+    print(pd.DataFrame(rows).round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Latency of the sklearn-wrapper path vs BoosterPredictor for small batches.
+
+    python benchmarks/bench_xgboost_inference.py [--model-dir models/xgboost]
+
+Without --model-dir a model is fitted on random data of the same shape
+as the production feature matrix.
+"""
+
+import argparse
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from credit_risk.models.serving import BoosterPredictor
+from credit_risk.models.xgboost_model import XGBoostModel
+from credit_risk.utils.logging import get_logger
+from timing import time_call
+
+logger = get_logger(__name__)
+
+BATCH_SIZES = (1, 10, 100, 1000)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model-dir", type=Path, default=None)
+    parser.add_argument("--n-features", type=int, default=100)
+    parser.add_argument("--n-threads", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=200)
+    return parser.parse_args()
+
+
+def _random_model(n_features: int) -> XGBoostModel:
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(20_000, n_features))
+    y = (X[:, :5].sum(axis=1) + rng.normal(size=len(X)) > 0).astype(int)
+    return XGBoostModel().train(X, y)
+
+
+def main():
+    args = parse_args()
+
+    if args.model_dir is not None:
+        model = joblib.load(args.model_dir / "model.pkl")
+    else:
+        model = _random_model(args.n_features)
+
+    predictor = BoosterPredictor.from_model(model, n_threads=args.n_threads)
+    rng = np.random.default_rng(1)
+
+    rows = []
+    for batch_size in BATCH_SIZES:
+        # The API hands over float64 output of the FeatureBuilder
+        X = rng.normal(size=(batch_size, predictor.n_features))
+        wrapper = time_call(model.predict_proba, X, repeats=args.repeats)
+        fast = time_call(predictor.predict_proba, X, repeats=args.repeats)
+        rows.append(
+            {
+                "batch_size": batch_size,
+                "wrapper_p50_us": wrapper["p50_us"],
+                "booster_p50_us": fast["p50_us"],
+                "wrapper_p99_us": wrapper["p99_us"],
+                "booster_p99_us": fast["p99_us"],
+                "speedup_p50": wrapper["p50_us"] / fast["p50_us"],
+            }
+        )
+
+    print(pd.DataFrame(rows).round(1).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
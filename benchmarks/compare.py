@@ -0,0 +1,100 @@
+"""
+Compare two benchmark suite result files and flag regressions.
+
+    python compare.py results/<baseline>.json results/<candidate>.json --tolerance 0.1
+
+A case regresses when candidate / baseline time exceeds 1 + tolerance.
+--metric picks the timing compared (default the median, `seconds`; e.g.
+`p99_seconds` for loadgen.py reports).
+Cases only present in one file are listed but never fail the check.
+Exits with status 1 if any case regressed.
+"""
+
+import argparse
+import json
+import sys
+
+import pandas as pd
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed slowdown as a fraction of the baseline time",
+    )
+    parser.add_argument("--metric", default="seconds")
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=1e-4,
+        help="Ignore cases faster than this in both files (timer noise)",
+    )
+    return parser.parse_args()
+
+
+def _load(path: str, metric: str) -> tuple:
+    with open(path) as f:
+        payload = json.load(f)
+    table = pd.DataFrame(payload["results"])
+    table["params"] = table["params"].map(lambda p: json.dumps(p, sort_keys=True))
+    if "rows" not in table:
+        table["rows"] = 0
+    if metric not in table:
+        table[metric] = float("nan")
+    table = table[["case", "rows", "params", metric]]
+    return payload["environment"], table.set_axis(
+        ["case", "rows", "params", "seconds"], axis=1
+    )
+
+
+def compare(baseline, candidate, tolerance: float, min_seconds: float):
+    table = baseline.merge(
+        candidate,
+        on=["case", "rows", "params"],
+        how="outer",
+        suffixes=("_baseline", "_candidate"),
+    )
+    table["ratio"] = table["seconds_candidate"] / table["seconds_baseline"]
+    noise = (table["seconds_baseline"] < min_seconds) & (
+        table["seconds_candidate"] < min_seconds
+    )
+    table["status"] = "ok"
+    table.loc[table["ratio"] > 1 + tolerance, "status"] = "REGRESSION"
+    table.loc[table["ratio"] < 1 - tolerance, "status"] = "faster"
+    table.loc[noise, "status"] = "ok"
+    table.loc[table["ratio"].isna(), "status"] = "missing"
+    return table.sort_values(["case", "rows", "params"]).reset_index(drop=True)
+
+
+def main():
+    args = parse_args()
+    base_env, baseline = _load(args.baseline, args.metric)
+    cand_env, candidate = _load(args.candidate, args.metric)
+
+    if base_env.get("cores") != cand_env.get("cores"):
+        print(
+            f"Warning: results come from {base_env.get('cores')} vs "
+            f"{cand_env.get('cores')} cores"
+        )
+
+    table = compare(baseline, candidate, args.tolerance, args.min_seconds)
+    print(
+        f"baseline {base_env['commit'][:12]}  candidate {cand_env['commit'][:12]}  "
+        f"{args.metric}  tolerance {args.tolerance:.0%}\n"
+    )
+    print(table.to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+
+    regressions = table[table["status"] == "REGRESSION"]
+    if len(regressions):
+        print(f"\n{len(regressions)} regression(s) above {args.tolerance:.0%}")
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
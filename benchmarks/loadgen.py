@@ -0,0 +1,394 @@
+"""
+Load test of the API against a local uvicorn server.
+
+    cd benchmarks
+    PYTHONPATH=../src:.. python loadgen.py --mode closed --concurrency 1 4 16
+    PYTHONPATH=../src:.. python loadgen.py --mode open --rates 50 100 200 400
+    PYTHONPATH=../src:.. python compare.py results/load-<old>.json \\
+        results/load-<new>.json --metric p99_seconds
+
+Starts `api.app:app` with uvicorn on 127.0.0.1 (a model trained on
+synthetic loans unless --model-dir is given), replays LoanRequest /
+BatchLoanRequest payloads and records latency percentiles, throughput
+and error rates per (mode, concurrency or rate, batch size).
+
+- closed loop: `concurrency` clients each send the next request as soon
+  as the previous one returns; throughput is what the server sustains
+- open loop: requests arrive at a fixed rate whatever the server does,
+  and latency is measured from the scheduled send time, so queueing
+  behind a slow server is counted (no coordinated omission)
+
+Payloads come from --payloads (JSON lines, each a LoanRequest or a
+BatchLoanRequest) or from `credit_risk.data.synthetic`. Everything runs
+offline on localhost.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from credit_risk.data.synthetic import request_rows, synthetic_cleaned_loans
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.artifacts import save_artifacts
+from credit_risk.models.registry import get_model
+from credit_risk.utils.config import monitoring_config, serving_config
+from suite import RESULTS_DIR, environment
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", choices=["closed", "open"], nargs="+")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument(
+        "--rates", type=float, nargs="+", default=[25, 50, 100, 200], help="Req/s"
+    )
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds per run")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds discarded")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--model-dir", type=Path, default=None)
+    parser.add_argument("--payloads", type=Path, default=None)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=1000,
+        help="Open loop: arrivals beyond this many outstanding requests fail",
+    )
+    parser.add_argument(
+        "--slo-ms", type=float, default=200.0, help="p99 target for the max rate"
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+    args.mode = args.mode or ["closed", "open"]
+    return args
+
+
+# -------------------------------------------------
+# Server
+# -------------------------------------------------
+def _train_synthetic_model(directory: Path) -> Path:
+    train_df = synthetic_cleaned_loans(50_000)
+    feature_builder = FeatureBuilder()
+    X, y = feature_builder.build_features(train_df, fit=True)
+    model = get_model("xgboost").train(X, y)
+    save_artifacts(directory, model=model, feature_builder=feature_builder)
+    return directory
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(model_dir: Path, monitoring_dir: Path, workers: int):
+    port = _free_port()
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(REPO_ROOT / "src"), str(REPO_ROOT)]),
+        serving_config.MODEL_DIR_ENV: str(model_dir),
+        monitoring_config.DIR_ENV: str(monitoring_dir),
+    }
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "api.app:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=REPO_ROOT,
+        env=env,
+    )
+    return process, f"http://127.0.0.1:{port}"
+
+
+def wait_until_ready(base_url: str, process, payload: bytes, timeout: float = 60.0):
+    """
+    Poll until a prediction succeeds (the first one loads the artifacts).
+    """
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+        try:
+            response = httpx.post(
+                f"{base_url}/predict",
+                content=payload,
+                headers={"content-type": "application/json"},
+                timeout=timeout,
+            )
+            if response.status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"API at {base_url} not ready after {timeout:.0f}s")
+
+
+# -------------------------------------------------
+# Payloads
+# -------------------------------------------------
+def load_loans(path: Path = None, n_loans: int = 5000) -> list:
+    if path is None:
+        return request_rows(synthetic_cleaned_loans(n_loans, seed=1))
+    loans = []
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            loans.extend(record["loans"] if "loans" in record else [record])
+    return loans
+
+
+def encode_requests(loans: list, batch_size: int) -> tuple:
+    """
+    (endpoint, request bodies): single loans to /predict, batches to
+    /predict/batch. Bodies are JSON-encoded once, up front.
+    """
+
+    if batch_size == 1:
+        return "/predict", [json.dumps(loan).encode() for loan in loans]
+    bodies = [
+        json.dumps({"loans": loans[start : start + batch_size]}).encode()
+        for start in range(0, len(loans) - batch_size + 1, batch_size)
+    ]
+    return "/predict/batch", bodies
+
+
+# -------------------------------------------------
+# Load generation
+# -------------------------------------------------
+class Recorder:
+    def __init__(self, measure_from: float):
+        self.measure_from = measure_from
+        self.latencies = []
+        self.errors = 0
+        self.error_kinds = {}
+        self.last_done = measure_from
+
+    def add(self, scheduled: float, ok: bool, kind: str = None):
+        if scheduled < self.measure_from:
+            return
+        now = time.perf_counter()
+        self.last_done = max(self.last_done, now)
+        if ok:
+            self.latencies.append(now - scheduled)
+        else:
+            self.errors += 1
+            self.error_kinds[kind] = self.error_kinds.get(kind, 0) + 1
+
+
+async def _send(client, endpoint, body, scheduled, recorder):
+    try:
+        response = await client.post(endpoint, content=body)
+        ok = response.status_code == 200
+        recorder.add(scheduled, ok, None if ok else f"http_{response.status_code}")
+    except httpx.TimeoutException:
+        recorder.add(scheduled, False, "timeout")
+    except httpx.TransportError as exc:
+        recorder.add(scheduled, False, type(exc).__name__)
+
+
+def _client(base_url: str, connections: int, timeout: float) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers={"content-type": "application/json"},
+        limits=httpx.Limits(
+            max_connections=connections, max_keepalive_connections=connections
+        ),
+        timeout=timeout,
+    )
+
+
+async def closed_loop(base_url, endpoint, bodies, concurrency, args) -> Recorder:
+    start = time.perf_counter()
+    recorder = Recorder(start + args.warmup)
+    end = start + args.warmup + args.duration
+
+    async def user(offset):
+        i = offset
+        while time.perf_counter() < end:
+            await _send(
+                client, endpoint, bodies[i % len(bodies)], time.perf_counter(), recorder
+            )
+            i += concurrency
+
+    async with _client(base_url, concurrency, args.timeout) as client:
+        await asyncio.gather(*(user(offset) for offset in range(concurrency)))
+    return recorder
+
+
+async def open_loop(base_url, endpoint, bodies, rate, args) -> Recorder:
+    start = time.perf_counter()
+    recorder = Recorder(start + args.warmup)
+    n_requests = int(rate * (args.warmup + args.duration))
+    in_flight = set()
+
+    async with _client(base_url, args.max_in_flight, args.timeout) as client:
+        for i in range(n_requests):
+            scheduled = start + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= args.max_in_flight:
+                recorder.add(scheduled, False, "max_in_flight")
+                continue
+            task = asyncio.create_task(
+                _send(client, endpoint, bodies[i % len(bodies)], scheduled, recorder)
+            )
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        await asyncio.gather(*in_flight)
+    return recorder
+
+
+def summarize(recorder: Recorder, duration: float, batch_size: int) -> dict:
+    latencies = np.array(recorder.latencies)
+    n_ok = len(latencies)
+    n_total = n_ok + recorder.errors
+    # Open loop: a backlog still draining after the run lowers throughput
+    duration = max(duration, recorder.last_done - recorder.measure_from)
+    summary = {
+        "requests": n_total,
+        "errors": recorder.errors,
+        "error_rate": recorder.errors / n_total if n_total else 0.0,
+        "error_kinds": recorder.error_kinds,
+        "throughput_rps": n_ok / duration,
+        "loans_per_s": n_ok * batch_size / duration,
+    }
+    if n_ok:
+        values = np.percentile(latencies, PERCENTILES)
+        summary["seconds"] = float(values[0])
+        for p, value in zip(PERCENTILES[1:], values[1:]):
+            summary[f"p{str(p).replace('.', '')}_seconds"] = float(value)
+        summary["max_seconds"] = float(latencies.max())
+    return summary
+
+
+def max_sustainable_rate(results: list, slo_seconds: float) -> dict:
+    """
+    Highest open-loop rate per batch size that kept up with arrivals
+    (95%), stayed under 1% errors and met the p99 target.
+    """
+
+    best = {}
+    for result in results:
+        params = result["params"]
+        if params["mode"] != "open" or "p99_seconds" not in result:
+            continue
+        sustained = (
+            result["throughput_rps"] >= 0.95 * params["rate"]
+            and result["error_rate"] < 0.01
+            and result["p99_seconds"] <= slo_seconds
+        )
+        batch_size = params["batch_size"]
+        if sustained and params["rate"] > best.get(batch_size, 0):
+            best[batch_size] = params["rate"]
+    return best
+
+
+def _describe(params: dict, summary: dict) -> str:
+    nan = float("nan")
+    return (
+        f"{json.dumps(params):<55} {summary['throughput_rps']:9.1f} req/s  "
+        f"p50 {summary.get('seconds', nan) * 1e3:8.1f} ms  "
+        f"p99 {summary.get('p99_seconds', nan) * 1e3:8.1f} ms  "
+        f"errors {summary['error_rate']:.1%}"
+    )
+
+
+def main():
+    args = parse_args()
+    loans = load_loans(args.payloads, n_loans=max(5000, 50 * max(args.batch_size)))
+
+    runs = []
+    if "closed" in args.mode:
+        runs += [("closed", {"concurrency": c}) for c in args.concurrency]
+    if "open" in args.mode:
+        runs += [("open", {"rate": r}) for r in args.rates]
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="credit_risk_load_") as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        model_dir = args.model_dir or _train_synthetic_model(tmp_dir / "model")
+        process, base_url = start_server(
+            model_dir, tmp_dir / "monitoring", args.workers
+        )
+        try:
+            wait_until_ready(base_url, process, json.dumps(loans[0]).encode())
+            for batch_size in args.batch_size:
+                endpoint, bodies = encode_requests(loans, batch_size)
+                for mode, load in runs:
+                    if mode == "closed":
+                        run = closed_loop(
+                            base_url, endpoint, bodies, load["concurrency"], args
+                        )
+                    else:
+                        run = open_loop(base_url, endpoint, bodies, load["rate"], args)
+                    recorder = asyncio.run(run)
+
+                    params = {"mode": mode, **load, "batch_size": batch_size}
+                    summary = summarize(recorder, args.duration, batch_size)
+                    results.append({"case": "load_test", "params": params, **summary})
+                    print(_describe(params, summary), flush=True)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    env = {
+        **environment(),
+        "workers": args.workers,
+        "duration": args.duration,
+        "model_dir": str(args.model_dir or "synthetic"),
+    }
+    max_rates = max_sustainable_rate(results, args.slo_ms / 1e3)
+
+    table = pd.json_normalize(results).drop(columns=["case"], errors="ignore")
+    print("\n" + table.to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+    for batch_size, rate in sorted(max_rates.items()):
+        print(
+            f"Max sustainable rate, batch {batch_size}: {rate:g} req/s "
+            f"(p99 <= {args.slo_ms:g} ms)"
+        )
+
+    output = args.output or RESULTS_DIR / f"load-{env['commit'][:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "environment": env,
+                "max_sustainable_rps": {str(b): r for b, r in max_rates.items()},
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nReport written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+Benchmark suite for the pipeline and serving hot paths.
+
+    cd benchmarks
+    PYTHONPATH=../src:.. python suite.py --rows 10000 100000 1000000
+    PYTHONPATH=../src:.. python compare.py results/<old>.json results/<new>.json
+
+Every case runs on synthetic loans (`credit_risk.data.synthetic`) with
+the real column schema. Results go to results/<commit>.json; compare.py
+flags cases that got slower than a tolerance between two result files.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+import xgboost
+
+from credit_risk.data.clean_data import DataCleaner
+from credit_risk.data.load_data import load_raw_data
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.data.synthetic import (
+    request_rows,
+    synthetic_cleaned_loans,
+    synthetic_raw_loans,
+    write_synthetic_csv,
+)
+from credit_risk.evaluation.metrics import evaluate_classification, ks_statistic
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.artifacts import save_artifacts
+from credit_risk.models.predict import load_serving_artifacts
+from credit_risk.models.registry import MODEL_REGISTRY, get_model
+from credit_risk.utils.threads import available_cores
+from timing import time_call
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+BATCH_SIZES = (1, 100, 10_000)
+API_BATCH_SIZES = (1, 100, 1000)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument(
+        "--cases", nargs="+", default=None, help="Subset of cases (default: all)"
+    )
+    parser.add_argument("--models", nargs="+", default=sorted(MODEL_REGISTRY))
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Runs per full-size case (median)"
+    )
+    parser.add_argument(
+        "--call-repeats", type=int, default=100, help="Calls per latency case"
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def _git(*args) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def environment() -> dict:
+    return {
+        "commit": _git("rev-parse", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cores": available_cores(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "xgboost": xgboost.__version__,
+    }
+
+
+def time_runs(func, repeats: int) -> dict:
+    """
+    Median / min wall time of `repeats` calls, in seconds.
+    """
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {"seconds": float(np.median(timings)), "min_seconds": float(min(timings))}
+
+
+def time_calls(func, repeats: int) -> dict:
+    """
+    Per-call latency of a fast `func`, in seconds (median, p99).
+    """
+
+    timing = time_call(func, repeats=repeats)
+    return {"seconds": timing["p50_us"] / 1e6, "p99_seconds": timing["p99_us"] / 1e6}
+
+
+class SuiteData:
+    """
+    Lazily built inputs of every case at one row count.
+    """
+
+    def __init__(self, n_rows: int, models, tmp_dir: Path):
+        self.n_rows = n_rows
+        self.model_names = models
+        self.tmp_dir = tmp_dir
+
+    @cached_property
+    def csv_path(self) -> Path:
+        return write_synthetic_csv(self.tmp_dir / f"raw_{self.n_rows}.csv", self.n_rows)
+
+    @cached_property
+    def raw(self) -> pd.DataFrame:
+        return synthetic_raw_loans(self.n_rows)
+
+    @cached_property
+    def cleaned(self) -> pd.DataFrame:
+        return synthetic_cleaned_loans(self.n_rows)
+
+    @cached_property
+    def splits(self):
+        return DataSplitter().split(self.cleaned)
+
+    @cached_property
+    def features(self):
+        train_df, val_df, _ = self.splits
+        feature_builder = FeatureBuilder()
+        X_train, y_train = feature_builder.build_features(train_df, fit=True)
+        X_val, y_val = feature_builder.build_features(val_df, fit=False)
+        return feature_builder, X_train, y_train, X_val, y_val
+
+    @cached_property
+    def models(self) -> dict:
+        _, X_train, y_train, _, _ = self.features
+        return {
+            name: get_model(name).train(X_train, y_train) for name in self.model_names
+        }
+
+    @cached_property
+    def scores(self):
+        rng = np.random.default_rng(0)
+        y = rng.random(self.n_rows) < 0.2
+        return y, np.clip(rng.normal(0.2 + 0.2 * y, 0.15), 0, 1)
+
+    @cached_property
+    def api_client(self):
+        from fastapi.testclient import TestClient
+
+        from api.app import create_app
+        from api.dependencies import get_artifacts
+
+        model_dir = self.tmp_dir / f"api_model_{self.n_rows}"
+        name = "xgboost" if "xgboost" in self.models else self.model_names[0]
+        save_artifacts(
+            model_dir, model=self.models[name], feature_builder=self.features[0]
+        )
+        # Served artifacts without the live monitor, so only the route is timed
+        artifacts = {**load_serving_artifacts(model_dir), "model_name": name}
+
+        app = create_app()
+        app.dependency_overrides[get_artifacts] = lambda: artifacts
+        return TestClient(app)
+
+
+def case_load_raw_data(data, args):
+    path = data.csv_path
+    yield {}, time_runs(lambda: load_raw_data(path=path), args.repeats)
+
+
+def case_clean(data, args):
+    raw = data.raw
+    yield {}, time_runs(lambda: DataCleaner().clean(raw), args.repeats)
+
+
+def case_split(data, args):
+    cleaned = data.cleaned
+    yield {}, time_runs(lambda: DataSplitter().split(cleaned), args.repeats)
+
+
+def case_features_fit(data, args):
+    train_df = data.splits[0]
+    yield {}, time_runs(
+        lambda: FeatureBuilder().build_features(train_df, fit=True), args.repeats
+    )
+
+
+def case_features_transform(data, args):
+    feature_builder = data.features[0]
+    val_df = data.splits[1]
+    yield {}, time_runs(
+        lambda: feature_builder.build_features(val_df, fit=False), args.repeats
+    )
+
+
+def case_train(data, args):
+    _, X_train, y_train, _, _ = data.features
+    for name in data.model_names:
+        yield {"model": name}, time_runs(
+            lambda: get_model(name).train(X_train, y_train), args.repeats
+        )
+
+
+def case_predict_proba(data, args):
+    X_val = data.features[3]
+    for name, model in data.models.items():
+        for batch_size in BATCH_SIZES:
+            if batch_size > len(X_val):
+                continue
+            X = X_val[:batch_size]
+            if batch_size < 1000:
+                timing = time_calls(lambda: model.predict_proba(X), args.call_repeats)
+            else:
+                timing = time_runs(lambda: model.predict_proba(X), args.repeats)
+            yield {"model": name, "batch_size": batch_size}, timing
+
+
+def case_metrics(data, args):
+    y, p = data.scores
+    yield {"function": "evaluate_classification"}, time_runs(
+        lambda: evaluate_classification(y, p), args.repeats
+    )
+    yield {"function": "ks_statistic"}, time_runs(
+        lambda: ks_statistic(y, p), args.repeats
+    )
+
+
+def case_api(data, args):
+    client = data.api_client
+    rows = request_rows(data.splits[1].head(max(API_BATCH_SIZES)))
+    yield {"endpoint": "/predict"}, time_calls(
+        lambda: client.post("/predict", json=rows[0]), args.call_repeats
+    )
+    for batch_size in API_BATCH_SIZES:
+        if batch_size > len(rows):
+            continue
+        payload = {"loans": rows[:batch_size]}
+        yield {"endpoint": "/predict/batch", "batch_size": batch_size}, time_calls(
+            lambda: client.post("/predict/batch", json=payload),
+            max(10, args.call_repeats // batch_size),
+        )
+
+
+CASES = {
+    "load_raw_data": case_load_raw_data,
+    "clean": case_clean,
+    "split": case_split,
+    "features_fit": case_features_fit,
+    "features_transform": case_features_transform,
+    "train": case_train,
+    "predict_proba": case_predict_proba,
+    "metrics": case_metrics,
+    "api": case_api,
+}
+
+
+def main():
+    args = parse_args()
+    cases = args.cases or list(CASES)
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        sys.exit(f"Unknown cases: {sorted(unknown)}; choose from {list(CASES)}")
+
+    env = environment()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="credit_risk_bench_") as tmp_dir:
+        for n_rows in args.rows:
+            data = SuiteData(n_rows, args.models, Path(tmp_dir))
+            for case in cases:
+                for params, timing in CASES[case](data, args):
+                    result = {"case": case, "rows": n_rows, "params": params, **timing}
+                    results.append(result)
+                    print(
+                        f"{case:<20} rows={n_rows:<10,} {json.dumps(params):<45} "
+                        f"{timing['seconds'] * 1e3:12.3f} ms",
+                        flush=True,
+                    )
+
+    output = args.output or RESULTS_DIR / f"{env['commit'][:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"environment": env, "results": results}, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
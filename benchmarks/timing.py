@@ -0,0 +1,29 @@
+"""
+Small timing helpers shared by the benchmark scripts.
+"""
+
+import time
+
+import numpy as np
+
+
+def time_call(func, *args, repeats: int = 200, warmup: int = 10) -> dict:
+    """
+    Latency of `func(*args)` in microseconds over `repeats` calls.
+    """
+
+    for _ in range(warmup):
+        func(*args)
+
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        timings[i] = time.perf_counter() - start
+
+    timings *= 1e6
+    return {
+        "p50_us": float(np.percentile(timings, 50)),
+        "p99_us": float(np.percentile(timings, 99)),
+        "mean_us": float(timings.mean()),
+    }
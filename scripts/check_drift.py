@@ -0,0 +1,73 @@
+import argparse
+import sys
+from pathlib import Path
+
+from credit_risk.models.artifacts import model_dir
+from credit_risk.models.predict import (
+    load_drift_baseline,
+    load_serving_artifacts,
+    predict_default_proba,
+)
+from credit_risk.models.registry import MODEL_REGISTRY
+from credit_risk.monitoring.drift import drift_from_parquet
+from credit_risk.utils.config import drift_config
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="PSI / CSI of Parquet data against the training baseline"
+    )
+    parser.add_argument("input", type=Path, help="Parquet file / dataset")
+    parser.add_argument("--model", choices=sorted(MODEL_REGISTRY), default="xgboost")
+    parser.add_argument(
+        "--score-col",
+        default="default_probability",
+        help="Score column; rows are scored with the model when it is absent",
+    )
+    parser.add_argument("--batch-rows", type=int, default=drift_config.BATCH_ROWS)
+    parser.add_argument("--warning", type=float, default=drift_config.PSI_WARNING)
+    parser.add_argument("--alert", type=float, default=drift_config.PSI_ALERT)
+    parser.add_argument(
+        "--fail-on-alert",
+        action="store_true",
+        help="Exit with status 1 if any feature reaches the alert threshold",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    directory = model_dir(args.model)
+
+    baseline = load_drift_baseline(directory)
+    if baseline is None:
+        raise FileNotFoundError(
+            f"No drift baseline for {directory}. Re-run training to create one."
+        )
+
+    artifacts = load_serving_artifacts(directory)
+    accumulator = drift_from_parquet(
+        args.input,
+        baseline,
+        score_col=args.score_col,
+        score_fn=lambda df: predict_default_proba(df, artifacts),
+        batch_rows=args.batch_rows,
+    )
+
+    report = accumulator.report(warning=args.warning, alert=args.alert)
+    report_path = directory / drift_config.REPORT_FILENAME
+    report.to_csv(report_path, index=False)
+    logger.info(f"Drift report written to {report_path}")
+
+    print("\nDRIFT REPORT")
+    print(report.to_string(index=False))
+
+    if args.fail_on_alert and (report["status"] == "alert").any():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
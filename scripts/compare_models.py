@@ -1,9 +1,12 @@
+import argparse
+
 import joblib
 
 from credit_risk.data.load_data import load_cleaned_data
 from credit_risk.data.split_data import DataSplitter
 from credit_risk.features.build_features import FeatureBuilder
 from credit_risk.evaluation.model_comparison import compare_models
+from credit_risk.utils.config import bootstrap_config
 from credit_risk.utils.logging import get_logger
 from credit_risk.utils.paths import project_root
 
@@ -15,7 +18,20 @@ LOGISTIC_MODEL_PATH = project_root / "models" / "logistic" / "model.pkl"
 XGBOOST_MODEL_PATH = project_root / "models" / "xgboost" / "model.pkl"
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare trained models")
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=bootstrap_config.N_REPLICATES,
+        help="Bootstrap replicates for confidence intervals (0 to skip)",
+    )
+    parser.add_argument("--n-jobs", type=int, default=bootstrap_config.N_JOBS)
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
     logger.info("Starting model comparison")
 
     # -------------------------------------------------
@@ -76,6 +92,8 @@ def main():
         X=X_val,
         y=y_val,
         threshold=0.5,
+        n_bootstrap=args.bootstrap,
+        n_jobs=args.n_jobs,
     )
 
     print("\nMODEL COMPARISON (VALIDATION SET)")
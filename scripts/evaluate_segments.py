@@ -0,0 +1,60 @@
+import argparse
+
+from credit_risk.data.load_data import load_cleaned_data
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.evaluation.segments import segment_metrics
+from credit_risk.models.artifacts import MODELS_DIR, model_dir
+from credit_risk.models.predict import load_serving_artifacts, predict_default_proba
+from credit_risk.models.registry import MODEL_REGISTRY
+from credit_risk.utils.config import data_config, segment_config
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SEGMENTS_PATH = MODELS_DIR / "segments" / segment_config.FILENAME
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Metrics per portfolio segment")
+    parser.add_argument(
+        "--models", nargs="+", choices=sorted(MODEL_REGISTRY), default=["xgboost"]
+    )
+    parser.add_argument(
+        "--split", choices=["val", "test"], default="test", help="Split to evaluate"
+    )
+    parser.add_argument("--by", nargs="+", default=list(segment_config.COLUMNS))
+    parser.add_argument("--min-count", type=int, default=segment_config.MIN_COUNT)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    df = load_cleaned_data()
+    _, val_df, test_df = DataSplitter().split(df)
+    eval_df = val_df if args.split == "val" else test_df
+    logger.info(f"Evaluating segments on the {args.split} split: {eval_df.shape}")
+
+    scores = {
+        name: predict_default_proba(eval_df, load_serving_artifacts(model_dir(name)))
+        for name in args.models
+    }
+
+    table = segment_metrics(
+        eval_df,
+        eval_df[data_config.TARGET_COL].to_numpy(),
+        scores,
+        by=args.by,
+        min_count=args.min_count,
+    )
+
+    SEGMENTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    table.to_csv(SEGMENTS_PATH, index=False)
+    logger.info(f"Segment metrics written to {SEGMENTS_PATH}")
+
+    print("\nSEGMENT METRICS")
+    print(table[~table["small_segment"]].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+
+from credit_risk.data.load_data import load_cleaned_data
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.evaluation.thresholds import optimize_thresholds, save_thresholds
+from credit_risk.models.artifacts import file_digest, model_dir
+from credit_risk.models.predict import load_serving_artifacts, predict_default_proba
+from credit_risk.models.registry import MODEL_REGISTRY
+from credit_risk.utils.config import data_config, threshold_config
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Choose approve / review / reject thresholds on validation data"
+    )
+    parser.add_argument("--model", choices=sorted(MODEL_REGISTRY), default="xgboost")
+    parser.add_argument(
+        "--max-review-rate", type=float, default=threshold_config.MAX_REVIEW_RATE
+    )
+    parser.add_argument(
+        "--review-cost", type=float, default=threshold_config.REVIEW_COST
+    )
+    parser.add_argument(
+        "--loss-given-default",
+        type=float,
+        default=threshold_config.LOSS_GIVEN_DEFAULT,
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    directory = model_dir(args.model)
+
+    df = load_cleaned_data()
+    _, val_df, _ = DataSplitter().split(df)
+    logger.info(f"Validation shape: {val_df.shape}")
+
+    # Same (calibrated) probabilities the API applies the thresholds to
+    y_prob = predict_default_proba(val_df, load_serving_artifacts(directory))
+
+    chosen, curve = optimize_thresholds(
+        y_true=val_df[data_config.TARGET_COL].to_numpy(),
+        y_prob=y_prob,
+        loan_amnt=val_df["loan_amnt"].to_numpy(),
+        int_rate=val_df["int_rate"].to_numpy(),
+        loss_given_default=args.loss_given_default,
+        review_cost=args.review_cost,
+        max_review_rate=args.max_review_rate,
+    )
+
+    save_thresholds(
+        chosen,
+        directory / threshold_config.FILENAME,
+        model_digest=file_digest(directory / "model.pkl"),
+    )
+    curve.to_csv(directory / "profit_curve.csv", index=False)
+
+    print("\nCHOSEN DECISION BANDS")
+    print(f"Approve below {chosen['low_risk_threshold']:.4f}")
+    print(f"Reject from   {chosen['high_risk_threshold']:.4f}")
+    for key, value in chosen["metrics"].items():
+        print(f"{key:>24}: " + ("n/a" if value is None else f"{value:,.4f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+
+import joblib
+
+from credit_risk.data.load_data import load_cleaned_data
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.evaluation.permutation import permutation_importance
+from credit_risk.models.artifacts import file_digest, model_dir
+from credit_risk.models.registry import MODEL_REGISTRY
+from credit_risk.utils.config import permutation_config
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Permutation importance per original field"
+    )
+    parser.add_argument("--model", choices=sorted(MODEL_REGISTRY), default="xgboost")
+    parser.add_argument(
+        "--split", choices=["val", "test"], default="val", help="Split to permute"
+    )
+    parser.add_argument("--repeats", type=int, default=permutation_config.N_REPEATS)
+    parser.add_argument("--n-jobs", type=int, default=permutation_config.N_JOBS)
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Recompute even if a result is cached"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    directory = model_dir(args.model)
+
+    model = joblib.load(directory / "model.pkl")
+    feature_builder = joblib.load(directory / "feature_builder.pkl")
+
+    df = load_cleaned_data()
+    _, val_df, test_df = DataSplitter().split(df)
+    eval_df = val_df if args.split == "val" else test_df
+    X, y = feature_builder.build_features(eval_df, fit=False)
+    logger.info(f"Permuting {args.model} on the {args.split} split: {X.shape}")
+
+    cache_dir = None if args.no_cache else directory / permutation_config.CACHE_DIRNAME
+    table = permutation_importance(
+        model,
+        feature_builder,
+        X,
+        y,
+        n_repeats=args.repeats,
+        n_jobs=args.n_jobs,
+        model_digest=file_digest(directory / "model.pkl"),
+        cache_dir=cache_dir,
+    )
+
+    output_path = directory / permutation_config.FILENAME
+    table.to_csv(output_path, index=False)
+    logger.info(f"Permutation importance written to {output_path}")
+
+    print("\nPERMUTATION IMPORTANCE")
+    print(table.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+
+from credit_risk.data.load_data import load_cleaned_data
+from credit_risk.evaluation.backtest import generate_windows, run_backtest
+from credit_risk.models.registry import MODEL_REGISTRY
+from credit_risk.utils.config import backtest_config, data_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.paths import project_root
+
+logger = get_logger(__name__)
+
+BACKTEST_DIR = project_root / "models" / "backtests"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Walk-forward backtest")
+    parser.add_argument("--model", choices=sorted(MODEL_REGISTRY), default="xgboost")
+    parser.add_argument(
+        "--mode", choices=["expanding", "sliding"], default=backtest_config.MODE
+    )
+    parser.add_argument(
+        "--train-months", type=int, default=backtest_config.TRAIN_MONTHS
+    )
+    parser.add_argument(
+        "--test-months", type=int, default=backtest_config.TEST_MONTHS
+    )
+    parser.add_argument(
+        "--step-months", type=int, default=backtest_config.STEP_MONTHS
+    )
+    parser.add_argument("--n-jobs", type=int, default=backtest_config.N_JOBS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    logger.info("Loading cleaned dataset")
+    df = load_cleaned_data()
+
+    windows = generate_windows(
+        df[data_config.DATE_COL],
+        mode=args.mode,
+        train_months=args.train_months,
+        test_months=args.test_months,
+        step_months=args.step_months,
+    )
+    logger.info(f"Generated {len(windows)} {args.mode} windows")
+
+    output_path = (
+        BACKTEST_DIR
+        / f"{args.model}_{args.mode}_{backtest_config.RESULTS_FILENAME}"
+    )
+
+    results = run_backtest(
+        df=df,
+        model_name=args.model,
+        windows=windows,
+        output_path=output_path,
+        n_jobs=args.n_jobs,
+    )
+
+    print("\nWALK-FORWARD BACKTEST")
+    print(
+        results[
+            ["train_end", "test_end", "status", "n_train", "n_test", "roc_auc", "ks"]
+        ]
+    )
+
+    logger.info("Backtest completed successfully")
+
+
+if __name__ == "__main__":
+    main()
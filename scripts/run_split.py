@@ -1,6 +1,7 @@
 from credit_risk.data.load_data import load_raw_data
 from credit_risk.data.clean_data import DataCleaner
 from credit_risk.data.split_data import DataSplitter
+from credit_risk.data.partitioned_data import write_partitioned_dataset
 from credit_risk.utils.paths import processed_dir, samples_dir
 from credit_risk.utils.logging import get_logger
 
@@ -26,11 +27,15 @@ def main():
     df_clean.to_parquet(cleaned_path, index=False)
     logger.info(f"Saved cleaned data to {cleaned_path}")
 
-    # 4. Time-based split
+    # 4. SAVE time-partitioned dataset (issue_year / issue_month)
+    partitioned_path = write_partitioned_dataset(df_clean)
+    logger.info(f"Saved partitioned data to {partitioned_path}")
+
+    # 5. Time-based split
     splitter = DataSplitter()
     train_df, val_df, test_df = splitter.split(df_clean)
 
-    # 5. Save splits
+    # 6. Save splits
     train_df.to_parquet(samples_dir / "train.parquet", index=False)
     val_df.to_parquet(samples_dir / "val.parquet", index=False)
     test_df.to_parquet(samples_dir / "test.parquet", index=False)
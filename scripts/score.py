@@ -0,0 +1,44 @@
+import argparse
+import json
+from pathlib import Path
+
+from credit_risk.models.artifacts import model_dir
+from credit_risk.models.batch_scoring import score_file
+from credit_risk.models.registry import MODEL_REGISTRY
+from credit_risk.utils.config import batch_scoring_config
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Score a portfolio file (Parquet or CSV) offline"
+    )
+    parser.add_argument("input", type=Path, help="Parquet file / dataset or CSV")
+    parser.add_argument("output", type=Path, help="Output Parquet dataset directory")
+    parser.add_argument("--model", choices=sorted(MODEL_REGISTRY), default="xgboost")
+    parser.add_argument("--n-jobs", type=int, default=batch_scoring_config.N_JOBS)
+    parser.add_argument(
+        "--id-col", default=None, help="Input column copied to the output"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    report = score_file(
+        input_path=args.input,
+        output_dir=args.output,
+        model_dir=model_dir(args.model),
+        n_jobs=args.n_jobs,
+        id_col=args.id_col,
+    )
+
+    print("\nBATCH SCORING REPORT")
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,17 @@
-import json
-import joblib
+import argparse
 from pathlib import Path
 
 from credit_risk.data.load_data import load_cleaned_data
 from credit_risk.data.split_data import DataSplitter
 from credit_risk.features.build_features import FeatureBuilder
 from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.models.serving import FUSED_SCORER_FILENAME, FusedLinearScorer
+from credit_risk.models.artifacts import metrics_to_json, publish_model_artifacts
 from credit_risk.models.train import train_model
 from credit_risk.evaluation.metrics import evaluate_classification
 from credit_risk.utils.logging import get_logger
+from credit_risk.utils.threads import apply_thread_budget, thread_budget
+from credit_risk.utils.profiling import StageProfiler
 from credit_risk.utils.paths import project_root
 
 logger = get_logger(__name__)
@@ -16,54 +19,88 @@ logger = get_logger(__name__)
 MODEL_DIR = project_root / "models" / "logistic"
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
-MODEL_PATH = MODEL_DIR / "model.pkl"
-FEATURE_BUILDER_PATH = MODEL_DIR / "feature_builder.pkl"
-METRICS_PATH = MODEL_DIR / "metrics.json"
+PROFILE_PATH = MODEL_DIR / "profile.json"
+FUSED_SCORER_PATH = MODEL_DIR / FUSED_SCORER_FILENAME
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train the logistic SGD model")
+    parser.add_argument(
+        "--profile-slowest",
+        action="store_true",
+        help="Sample the stack of the slowest stage into profile.json",
+    )
+    parser.add_argument(
+        "--trace-allocations",
+        action="store_true",
+        help="Record tracemalloc peaks per stage (slows allocation-heavy stages)",
+    )
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+    apply_thread_budget(thread_budget().threads)
+
+    profiler = StageProfiler(
+        trace_allocations=args.trace_allocations,
+        profile_slowest=args.profile_slowest,
+    )
+
     logger.info("Loading cleaned dataset")
-    df = load_cleaned_data()
+    with profiler.stage("load_cleaned_data") as stage:
+        df = stage.record(load_cleaned_data())
 
-    splitter = DataSplitter()
-    train_df, val_df, _ = splitter.split(df)
+    with profiler.stage("split") as stage:
+        splitter = DataSplitter()
+        train_df, val_df, _ = stage.record(splitter.split(df))
 
     # Feature Engineering (FIT)
 
     feature_builder = FeatureBuilder()
-    X_train, y_train = feature_builder.build_features(train_df, fit=True)
-    X_val, y_val = feature_builder.build_features(val_df, fit=False)
+    with profiler.stage("build_features_fit") as stage:
+        X_train, y_train = stage.record(
+            feature_builder.build_features(train_df, fit=True)
+        )
+    with profiler.stage("build_features_transform") as stage:
+        X_val, y_val = stage.record(feature_builder.build_features(val_df, fit=False))
 
     # Model Training
 
-    model = LogisticSGDModel()
-    model = train_model(model, X_train, y_train)
+    with profiler.stage("train"):
+        model = LogisticSGDModel()
+        model = train_model(model, X_train, y_train)
 
     # Validation
 
-    y_val_proba = model.predict_proba(X_val)[:, 1]  # BUG 4 + 5 FIX
+    with profiler.stage("predict_proba") as stage:
+        y_val_proba = stage.record(model.predict_proba(X_val)[:, 1])  # BUG 4 + 5 FIX
 
-    metrics = evaluate_classification(
-        y_true=y_val,
-        y_prob=y_val_proba,
-        threshold=0.5,
-    )
+    with profiler.stage("evaluate_classification"):
+        metrics = evaluate_classification(
+            y_true=y_val,
+            y_prob=y_val_proba,
+            threshold=0.5,
+        )
 
-    # Save Artifacts
+    # Save Artifacts, with the calibrator (applied at serving time) and the
+    # drift baseline (training inputs, served validation scores) bound to them
+
+    with profiler.stage("publish_artifacts"):
+        publish_model_artifacts(
+            MODEL_DIR,
+            model=model,
+            feature_builder=feature_builder,
+            metrics=metrics_to_json(metrics),
+            y_val=y_val,
+            y_val_proba=y_val_proba,
+            train_df=train_df,
+        )
 
-    joblib.dump(model, MODEL_PATH)
-    joblib.dump(feature_builder, FEATURE_BUILDER_PATH)
+    # sklearn-free export of the fitted pipeline + model
+    FusedLinearScorer.from_artifacts(model, feature_builder).save(FUSED_SCORER_PATH)
 
-    with open(METRICS_PATH, "w") as f:
-        json.dump(
-            {
-                "roc_auc": metrics["roc_auc"],
-                "ks": metrics["ks"],
-                "confusion_matrix": metrics["confusion_matrix"].tolist(),
-            },
-            f,
-            indent=4,
-        )
+    profiler.write(PROFILE_PATH)
 
     logger.info("Logistic training pipeline completed successfully")
 
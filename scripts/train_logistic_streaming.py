@@ -0,0 +1,147 @@
+import argparse
+import time
+
+import joblib
+import numpy as np
+
+from credit_risk.data.partitioned_data import (
+    PartitionedDataset,
+    default_dataset_path,
+    month_filter,
+)
+from credit_risk.data.shards import ParquetShardSource, cached_feature_shards, prefetch
+from credit_risk.evaluation.metrics import evaluate_classification
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.artifacts import metrics_to_json, publish_model_artifacts
+from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.utils.config import streaming_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.threads import apply_thread_budget, thread_budget
+from credit_risk.utils.memory import peak_rss_mb
+from credit_risk.utils.paths import cache_dir, project_root
+
+logger = get_logger(__name__)
+
+MODEL_DIR = project_root / "models" / "logistic"
+MODEL_DIR.mkdir(parents=True, exist_ok=True)
+
+MODEL_PATH = MODEL_DIR / "model.pkl"
+FEATURE_BUILDER_PATH = MODEL_DIR / "feature_builder.pkl"
+
+
+def parse_month(value):
+    year, month = value.split("-")
+    return int(year), int(month)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Out-of-core logistic SGD training over Parquet row groups"
+    )
+    parser.add_argument("--epochs", type=int, default=streaming_config.N_EPOCHS)
+    parser.add_argument(
+        "--cache-shards",
+        action="store_true",
+        help="Transform row groups once into cached .npy feature shards",
+    )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Continue from models/logistic (frozen feature builder)",
+    )
+    parser.add_argument(
+        "--since",
+        type=parse_month,
+        default=None,
+        help="Only train on months >= YYYY-MM (e.g. a newly matured month)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    apply_thread_budget(thread_budget().threads)
+
+    dataset_path = default_dataset_path()
+    cutoffs = PartitionedDataset(dataset_path).split_cutoffs()
+
+    train_source = ParquetShardSource(
+        dataset_path, filter=month_filter(args.since, cutoffs.train_end)
+    )
+    val_source = ParquetShardSource(
+        dataset_path, filter=month_filter(cutoffs.train_end, cutoffs.val_end)
+    )
+
+    # -------------------------------------------------
+    # Model + feature builder (fresh or warm start)
+    # -------------------------------------------------
+    # The sample also serves as the drift baseline's training window
+    sample_df = train_source.sample(
+        streaming_config.FIT_SAMPLE_ROWS, seed=streaming_config.SEED
+    )
+    if args.warm_start:
+        logger.info(f"Warm-starting from {MODEL_PATH}")
+        model = joblib.load(MODEL_PATH)
+        feature_builder = joblib.load(FEATURE_BUILDER_PATH)
+    else:
+        feature_builder = FeatureBuilder()
+        feature_builder.build_features(sample_df, fit=True)
+        model = LogisticSGDModel()
+
+    # -------------------------------------------------
+    # Streaming training
+    # -------------------------------------------------
+    if args.cache_shards:
+        shards = cached_feature_shards(
+            train_source,
+            feature_builder,
+            cache_dir / streaming_config.SHARD_DIRNAME / "logistic",
+        )
+        load_shard = shards.read
+    else:
+
+        def load_shard(index):
+            return feature_builder.build_features(train_source.read(index), fit=False)
+
+    start = time.perf_counter()
+    model.train_streaming(load_shard, n_shards=len(train_source), n_epochs=args.epochs)
+    train_seconds = time.perf_counter() - start
+
+    # -------------------------------------------------
+    # Validation (streamed, only scores are kept)
+    # -------------------------------------------------
+    def score_shard(index):
+        X, y = feature_builder.build_features(val_source.read(index), fit=False)
+        return model.predict_proba(X)[:, 1], np.asarray(y)
+
+    scored = list(prefetch(score_shard, range(len(val_source))))
+    y_val_proba = np.concatenate([p for p, _ in scored])
+    y_val = np.concatenate([y for _, y in scored])
+
+    metrics = evaluate_classification(y_true=y_val, y_prob=y_val_proba, threshold=0.5)
+
+    # Save Artifacts
+
+    streaming = {
+        "epochs": args.epochs,
+        "train_shards": len(train_source),
+        "warm_start": args.warm_start,
+        "train_seconds": train_seconds,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    publish_model_artifacts(
+        MODEL_DIR,
+        model=model,
+        feature_builder=feature_builder,
+        metrics=metrics_to_json(metrics, streaming=streaming),
+        y_val=y_val,
+        y_val_proba=y_val_proba,
+        train_df=sample_df,
+    )
+
+    logger.info(f"Peak RSS during streaming training: {peak_rss_mb():.0f} MB")
+    logger.info("Streaming logistic training completed successfully")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+
+from credit_risk.data.load_data import load_cleaned_data
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.models.artifacts import MODELS_DIR
+from credit_risk.models.orchestrator import train_models
+from credit_risk.models.registry import MODEL_REGISTRY
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+COMPARISON_PATH = MODELS_DIR / "comparison.csv"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Train several models from one data / feature pass"
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        choices=sorted(MODEL_REGISTRY),
+        default=sorted(MODEL_REGISTRY),
+    )
+    parser.add_argument("--n-jobs", type=int, default=None)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    logger.info("Loading cleaned dataset")
+    df = load_cleaned_data()
+
+    splitter = DataSplitter()
+    train_df, val_df, _ = splitter.split(df)
+    del df
+
+    comparison_df = train_models(args.models, train_df, val_df, n_jobs=args.n_jobs)
+    comparison_df.to_csv(COMPARISON_PATH, index=False)
+
+    print("\nMODEL COMPARISON (VALIDATION SET)")
+    print(comparison_df)
+
+    logger.info(f"Comparison written to {COMPARISON_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import json
+
+from credit_risk.data.load_data import load_cleaned_data
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.tuning.study import Study
+from credit_risk.tuning.successive_halving import (
+    SEARCH_SPACES,
+    SuccessiveHalvingSearch,
+    prepare_tuning_data,
+)
+from credit_risk.utils.config import tuning_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.paths import cache_dir, project_root
+
+logger = get_logger(__name__)
+
+STUDY_DIR = project_root / "models" / "tuning"
+TUNING_DATA_DIR = cache_dir / "tuning"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Hyperparameter search")
+    parser.add_argument("--model", choices=sorted(SEARCH_SPACES), default="xgboost")
+    parser.add_argument(
+        "--study", default=None, help="Study name (resumes if it exists)"
+    )
+    parser.add_argument("--hyperband", action="store_true")
+    parser.add_argument("--n-configs", type=int, default=tuning_config.N_CONFIGS)
+    parser.add_argument("--n-workers", type=int, default=tuning_config.N_WORKERS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    method = "hyperband" if args.hyperband else "sha"
+
+    # -------------------------------------------------
+    # Features are built once and shared by all trials
+    # -------------------------------------------------
+    # Cached per split / feature code fingerprint, reused across studies
+    df = load_cleaned_data()
+    train_df, val_df, _ = DataSplitter().split(df)
+    del df
+    data_dir = prepare_tuning_data(train_df, val_df, TUNING_DATA_DIR)
+    del train_df, val_df
+
+    # The default name includes the data key, so new data starts a new study;
+    # resuming a study with different data or settings is refused
+    study_name = args.study or f"{args.model}_{method}_{data_dir.name}"
+    study = Study(study_name, STUDY_DIR / f"{study_name}.sqlite3")
+    search = SuccessiveHalvingSearch(
+        model_name=args.model,
+        data_dir=data_dir,
+        study=study,
+        n_workers=args.n_workers,
+    )
+
+    best = search.run_hyperband() if args.hyperband else search.run(args.n_configs)
+    study.close()
+
+    best_path = project_root / "models" / args.model / "best_params.json"
+    with open(best_path, "w") as f:
+        json.dump(best, f, indent=4)
+
+    print("\nBEST TRIAL")
+    print(json.dumps(best, indent=4))
+
+    logger.info(f"Best parameters written to {best_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+from pathlib import Path
+from typing import Optional
+
 import pandas as pd
 
 from credit_risk.utils.paths import raw_dir, processed_dir
@@ -39,13 +42,15 @@ USE_COLS = [
 ]
 
 
-def load_raw_data(chunk_size: int = 200_000) -> pd.DataFrame:
+def load_raw_data(
+    chunk_size: int = 200_000, path: Optional[Path] = None
+) -> pd.DataFrame:
     """
     Load raw LendingClub CSV using chunked reading
     to avoid out-of-memory errors.
     """
 
-    path = raw_dir / data_config.RAW_FILENAME
+    path = Path(path) if path is not None else raw_dir / data_config.RAW_FILENAME
     if not path.exists():
         raise FileNotFoundError(path)
 
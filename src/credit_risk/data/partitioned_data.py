@@ -0,0 +1,265 @@
+"""
+Time-partitioned Parquet storage for the cleaned dataset.
+
+The cleaned frame is written as a Hive-partitioned dataset
+(issue_year=YYYY/issue_month=M/...). Split cutoffs are computed from
+partition row counts (Parquet footers only) and each stage reads just
+the partitions and columns it needs through pyarrow dataset filters.
+"""
+
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from credit_risk.data.split_data import parse_issue_date
+from credit_risk.utils.config import data_config, split_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.paths import processed_dir
+
+logger = get_logger(__name__)
+
+YEAR_COL = "issue_year"
+MONTH_COL = "issue_month"
+
+PARTITION_SCHEMA = pa.schema([(YEAR_COL, pa.int16()), (MONTH_COL, pa.int8())])
+
+SPLITS = ("train", "val", "test")
+
+# (year, month) of a calendar month
+YearMonth = Tuple[int, int]
+
+
+def default_dataset_path() -> Path:
+    return processed_dir / data_config.PARTITIONED_DIRNAME
+
+
+def _partitioning():
+    return ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+
+
+def write_partitioned_dataset(df: pd.DataFrame, path: Optional[Path] = None) -> Path:
+    """
+    Write the cleaned frame as a Hive-partitioned Parquet dataset
+    keyed by issue year / month.
+
+    Rows with an unparseable issue date are dropped (they cannot be
+    assigned to a time window). The dataset is written to a temporary
+    directory that replaces `path` once complete, so partitions missing
+    from `df` do not survive from an earlier write.
+    """
+
+    path = Path(path) if path is not None else default_dataset_path()
+
+    issue_d = parse_issue_date(df[data_config.DATE_COL])
+    valid = issue_d.notna()
+    if not valid.all():
+        logger.warning(f"Dropping {(~valid).sum():,} rows with unparseable issue_d")
+
+    out = df.loc[valid].copy()
+    out[YEAR_COL] = issue_d[valid].dt.year.astype("int16")
+    out[MONTH_COL] = issue_d[valid].dt.month.astype("int8")
+
+    table = pa.Table.from_pandas(out, preserve_index=False)
+
+    logger.info(f"Writing partitioned dataset to {path}")
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    ds.write_dataset(
+        table,
+        tmp_path,
+        format="parquet",
+        partitioning=_partitioning(),
+    )
+    shutil.rmtree(path, ignore_errors=True)
+    tmp_path.rename(path)
+    logger.info(f"Partitioned dataset written: {len(out):,} rows")
+
+    return path
+
+
+@dataclass(frozen=True)
+class SplitCutoffs:
+    """
+    Exclusive upper bounds (year, month) of the train and validation windows.
+    Test covers everything from val_end onwards.
+    """
+
+    train_end: YearMonth
+    val_end: YearMonth
+
+    def bounds(self, split: str) -> Tuple[Optional[YearMonth], Optional[YearMonth]]:
+        if split == "train":
+            return None, self.train_end
+        if split == "val":
+            return self.train_end, self.val_end
+        if split == "test":
+            return self.val_end, None
+        raise ValueError(f"Unknown split '{split}'. Expected one of {SPLITS}")
+
+
+def month_filter(start: Optional[YearMonth], end: Optional[YearMonth]):
+    """
+    Build a partition filter for the half-open month range [start, end).
+    """
+
+    year = ds.field(YEAR_COL)
+    month = ds.field(MONTH_COL)
+
+    expr = None
+    if start is not None:
+        y, m = start
+        expr = (year > y) | ((year == y) & (month >= m))
+    if end is not None:
+        y, m = end
+        upper = (year < y) | ((year == y) & (month < m))
+        expr = upper if expr is None else expr & upper
+
+    return expr
+
+
+class PartitionedDataset:
+    """
+    Reader for the time-partitioned cleaned dataset.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else default_dataset_path()
+        if not self.path.exists():
+            raise FileNotFoundError(
+                f"Partitioned data not found at {self.path}. "
+                "Run scripts/run_split.py first."
+            )
+
+        self.dataset = ds.dataset(
+            self.path, format="parquet", partitioning=_partitioning()
+        )
+
+    def partitions(self) -> pd.DataFrame:
+        """
+        Row count per (issue_year, issue_month) partition, in time order.
+
+        Only Parquet footers are read.
+        """
+
+        rows = []
+        for fragment in self.dataset.get_fragments():
+            keys = ds.get_partition_keys(fragment.partition_expression)
+            rows.append(
+                {
+                    YEAR_COL: keys[YEAR_COL],
+                    MONTH_COL: keys[MONTH_COL],
+                    "num_rows": fragment.count_rows(),
+                }
+            )
+
+        if not rows:
+            return pd.DataFrame(columns=[YEAR_COL, MONTH_COL, "num_rows"])
+
+        return (
+            pd.DataFrame(rows)
+            .groupby([YEAR_COL, MONTH_COL], as_index=False)["num_rows"]
+            .sum()
+            .sort_values([YEAR_COL, MONTH_COL])
+            .reset_index(drop=True)
+        )
+
+    def split_cutoffs(self) -> SplitCutoffs:
+        """
+        Time cutoffs matching DataSplitter's row fractions at month granularity.
+
+        A month is never split across windows: it goes to the window that
+        contains the midpoint of its rows.
+        """
+
+        parts = self.partitions()
+        if parts.empty:
+            raise ValueError(f"Partitioned dataset at {self.path} is empty")
+
+        n = parts["num_rows"].sum()
+        train_end = int(n * split_config.TRAIN_FRAC)
+        val_end = int(n * (split_config.TRAIN_FRAC + split_config.VAL_FRAC))
+
+        midpoint = parts["num_rows"].cumsum() - parts["num_rows"] / 2
+        months = list(zip(parts[YEAR_COL], parts[MONTH_COL]))
+
+        def first_month_at_or_after(pos: int) -> YearMonth:
+            idx = int((midpoint < pos).sum())
+            if idx >= len(months):
+                last_year, last_month = months[-1]
+                return (last_year + last_month // 12, last_month % 12 + 1)
+            return tuple(int(v) for v in months[idx])
+
+        cutoffs = SplitCutoffs(
+            train_end=first_month_at_or_after(train_end),
+            val_end=first_month_at_or_after(val_end),
+        )
+        logger.info(
+            f"Split cutoffs → train < {cutoffs.train_end}, "
+            f"val < {cutoffs.val_end}, test >= {cutoffs.val_end}"
+        )
+        return cutoffs
+
+    def load(
+        self,
+        start: Optional[YearMonth] = None,
+        end: Optional[YearMonth] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Load rows issued in [start, end), reading only the matching
+        partitions and the requested columns.
+
+        Rows come back in issue-month order with issue_d parsed to datetime,
+        matching DataSplitter output.
+        """
+
+        read_cols = None
+        if columns is not None:
+            read_cols = list(dict.fromkeys([*columns, YEAR_COL, MONTH_COL]))
+
+        table = self.dataset.to_table(
+            columns=read_cols, filter=month_filter(start, end)
+        )
+        df = table.to_pandas()
+
+        df = df.sort_values([YEAR_COL, MONTH_COL], kind="stable")
+        drop_cols = [
+            c for c in (YEAR_COL, MONTH_COL) if columns is None or c not in columns
+        ]
+        df = df.drop(columns=drop_cols).reset_index(drop=True)
+
+        if data_config.DATE_COL in df.columns:
+            df[data_config.DATE_COL] = parse_issue_date(df[data_config.DATE_COL])
+
+        logger.info(f"Loaded partitions [{start}, {end}) → {df.shape}")
+        return df
+
+    def load_split(
+        self,
+        split: str,
+        columns: Optional[List[str]] = None,
+        cutoffs: Optional[SplitCutoffs] = None,
+    ) -> pd.DataFrame:
+        """
+        Load a single time window ('train', 'val' or 'test').
+        """
+
+        cutoffs = cutoffs or self.split_cutoffs()
+        start, end = cutoffs.bounds(split)
+        return self.load(start=start, end=end, columns=columns)
+
+    def load_splits(self, columns: Optional[List[str]] = None):
+        """
+        Load train / val / test windows, computing cutoffs once.
+        """
+
+        cutoffs = self.split_cutoffs()
+        return tuple(
+            self.load_split(split, columns=columns, cutoffs=cutoffs)
+            for split in SPLITS
+        )
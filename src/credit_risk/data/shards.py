@@ -0,0 +1,213 @@
+"""
+Bounded-memory data sources for out-of-core training.
+
+A shard is one Parquet row group (ParquetShardSource) or one cached,
+already-transformed (X, y) pair of .npy files (FeatureShardSource).
+Consumers only ever hold a shard or two in memory; `prefetch` loads
+the next shard on a background thread while the current one is used.
+"""
+
+import hashlib
+import pickle
+import queue
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ParquetShardSource:
+    """
+    Row groups of a Parquet file or (partitioned) dataset directory,
+    optionally restricted by a pyarrow filter expression.
+    """
+
+    def __init__(self, path, filter=None, columns=None, partitioning="hive"):
+        self.path = Path(path)
+        self.filter = filter
+        self.columns = columns
+        self.dataset = ds.dataset(
+            self.path, format="parquet", partitioning=partitioning
+        )
+
+        self.fragments = [
+            row_group
+            for fragment in self.dataset.get_fragments(filter=filter)
+            for row_group in fragment.split_by_row_group(filter=filter)
+        ]
+
+        logger.info(f"Parquet shard source {self.path}: {len(self)} row groups")
+
+    def __len__(self) -> int:
+        return len(self.fragments)
+
+    def num_rows(self) -> int:
+        return sum(f.count_rows(filter=self.filter) for f in self.fragments)
+
+    def read(self, index: int) -> pd.DataFrame:
+        table = self.fragments[index].to_table(
+            schema=self.dataset.schema, columns=self.columns, filter=self.filter
+        )
+        return table.to_pandas()
+
+    def sample(self, max_rows: int, seed: Optional[int] = None) -> pd.DataFrame:
+        """
+        Concatenate randomly chosen row groups up to roughly `max_rows` rows
+        (used to fit the FeatureBuilder without loading everything).
+        """
+
+        rng = np.random.default_rng(seed)
+        frames, rows = [], 0
+        for index in rng.permutation(len(self)):
+            frame = self.read(int(index))
+            frames.append(frame)
+            rows += len(frame)
+            if rows >= max_rows:
+                break
+
+        return pd.concat(frames, ignore_index=True)
+
+
+class FeatureShardSource:
+    """
+    Cached feature shards written by `write_feature_shards`:
+    X_00000.npy / y_00000.npy pairs, memory-mapped on read.
+    """
+
+    def __init__(self, shard_dir):
+        self.shard_dir = Path(shard_dir)
+        self.x_paths = sorted(self.shard_dir.glob("X_*.npy"))
+        if not self.x_paths:
+            raise FileNotFoundError(f"No feature shards found in {self.shard_dir}")
+
+    def __len__(self) -> int:
+        return len(self.x_paths)
+
+    def read(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        x_path = self.x_paths[index]
+        y_path = x_path.with_name(x_path.name.replace("X_", "y_", 1))
+        return np.load(x_path, mmap_mode="r"), np.load(y_path, mmap_mode="r")
+
+
+def write_feature_shards(
+    source: ParquetShardSource, feature_builder, shard_dir
+) -> FeatureShardSource:
+    """
+    Transform every row group with a fitted FeatureBuilder and cache it
+    as float32 .npy shards, one row group at a time. Shards are written
+    to a temporary directory that replaces `shard_dir` once complete.
+    """
+
+    shard_dir = Path(shard_dir)
+    tmp_dir = shard_dir.with_name(f".{shard_dir.name}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    def transform(index):
+        return feature_builder.build_features(source.read(index), fit=False)
+
+    for index, (X, y) in enumerate(prefetch(transform, range(len(source)))):
+        np.save(tmp_dir / f"X_{index:05d}.npy", np.asarray(X, dtype=np.float32))
+        np.save(tmp_dir / f"y_{index:05d}.npy", np.asarray(y, dtype=np.int8))
+
+    shutil.rmtree(shard_dir, ignore_errors=True)
+    tmp_dir.rename(shard_dir)
+
+    logger.info(f"Wrote {len(source)} feature shards to {shard_dir}")
+    return FeatureShardSource(shard_dir)
+
+
+def shard_cache_key(source: ParquetShardSource, feature_builder) -> str:
+    """
+    Digest of the fitted FeatureBuilder and of the source's row groups
+    (file, size, mtime, row group ids, filter, columns).
+    """
+
+    digest = hashlib.sha256(pickle.dumps(feature_builder))
+    for fragment in source.fragments:
+        stat = Path(fragment.path).stat()
+        row_groups = [row_group.id for row_group in fragment.row_groups]
+        digest.update(
+            f"{fragment.path}:{stat.st_size}:{stat.st_mtime_ns}:{row_groups}".encode()
+        )
+    digest.update(f"{source.filter}:{source.columns}".encode())
+    return digest.hexdigest()[:16]
+
+
+def cached_feature_shards(
+    source: ParquetShardSource, feature_builder, cache_root
+) -> FeatureShardSource:
+    """
+    Feature shards of `source` under cache_root/<shard_cache_key>, written
+    on a miss. Shards of other builders or source versions are removed.
+    """
+
+    cache_root = Path(cache_root)
+    shard_dir = cache_root / shard_cache_key(source, feature_builder)
+    if shard_dir.exists():
+        logger.info(f"Reusing feature shards in {shard_dir}")
+        return FeatureShardSource(shard_dir)
+
+    if cache_root.exists():
+        for stale in cache_root.iterdir():
+            if stale.is_dir():
+                shutil.rmtree(stale)
+    return write_feature_shards(source, feature_builder, shard_dir)
+
+
+class _Failure:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def prefetch(func: Callable, items: Iterable, depth: int = 1) -> Iterator:
+    """
+    Yield func(item) for each item, computing up to `depth` results ahead
+    on a background thread.
+    """
+
+    results = queue.Queue(maxsize=max(1, depth))
+    done = object()
+    stop = threading.Event()
+
+    def put(value) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        try:
+            for item in items:
+                if not put(func(item)):
+                    return
+        except BaseException as exc:
+            put(_Failure(exc))
+            return
+        put(done)
+
+    thread = threading.Thread(target=worker, name="shard-prefetch", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            value = results.get()
+            if value is done:
+                return
+            if isinstance(value, _Failure):
+                raise value.exc
+            yield value
+    finally:
+        stop.set()
+        thread.join()
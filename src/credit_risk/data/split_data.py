@@ -5,14 +5,17 @@ from credit_risk.utils.config import split_config, data_config
 logger = get_logger(__name__)
 
 
+def parse_issue_date(values) -> pd.Series:
+    """
+    Parse LendingClub 'Mon-YYYY' issue dates (unparseable values become NaT).
+    """
+    return pd.to_datetime(values, format="%b-%Y", errors="coerce")
+
+
 class DataSplitter:
     def split(self, df: pd.DataFrame):
         df = df.copy()
-        df[data_config.DATE_COL] = pd.to_datetime(
-            df[data_config.DATE_COL],
-            format="%b-%Y",
-            errors="coerce",
-        )
+        df[data_config.DATE_COL] = parse_issue_date(df[data_config.DATE_COL])
 
         df = df.sort_values(data_config.DATE_COL)
 
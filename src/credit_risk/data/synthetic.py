@@ -0,0 +1,267 @@
+"""
+Synthetic LendingClub loans for benchmarks and load tests.
+
+Rows follow the raw CSV schema (`load_data.USE_COLS`, same string
+formats: ' 36 months', 'Mon-YYYY' dates, '10+ years', '123xx') with
+marginal distributions close to the 2007-2018 accepted-loans file:
+grade mix, interest rate by sub-grade, loan amounts, incomes, FICO
+bands, state / purpose shares and a default rate of about 20% among
+finished loans that rises with sub-grade, term and DTI. Generation is
+vectorized and seeded, so the same (n_rows, seed) always gives the same
+frame; `write_synthetic_csv` writes large files chunk by chunk.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from credit_risk.data.clean_data import DataCleaner
+from credit_risk.data.load_data import USE_COLS
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+GRADE_SHARES = {"A": 0.19, "B": 0.29, "C": 0.285, "D": 0.15, "E": 0.06, "F": 0.018}
+GRADE_SHARES["G"] = 1 - sum(GRADE_SHARES.values())
+
+SUB_GRADES = np.array([f"{grade}{i}" for grade in GRADE_SHARES for i in range(1, 6)])
+
+# fmt: off
+STATE_SHARES = {
+    "CA": 0.139, "TX": 0.082, "NY": 0.082, "FL": 0.071, "IL": 0.040,
+    "NJ": 0.036, "PA": 0.034, "OH": 0.033, "GA": 0.033, "VA": 0.028,
+    "NC": 0.028, "MI": 0.026, "AZ": 0.024, "MD": 0.024, "MA": 0.023,
+    "CO": 0.022, "WA": 0.021, "MN": 0.018, "IN": 0.016, "TN": 0.016,
+    "MO": 0.016, "NV": 0.015, "CT": 0.015, "WI": 0.013, "AL": 0.012,
+    "OR": 0.012, "SC": 0.012, "LA": 0.011, "KY": 0.010, "OK": 0.009,
+    "KS": 0.008, "AR": 0.008, "UT": 0.008, "NM": 0.005, "HI": 0.005,
+    "MS": 0.005, "NH": 0.005, "RI": 0.004, "WV": 0.004, "MT": 0.003,
+    "DE": 0.003, "DC": 0.002, "AK": 0.002, "WY": 0.002, "SD": 0.002,
+    "VT": 0.002, "NE": 0.002, "ME": 0.002, "ND": 0.001, "ID": 0.001,
+}
+# fmt: on
+
+PURPOSE_SHARES = {
+    "debt_consolidation": 0.57,
+    "credit_card": 0.22,
+    "home_improvement": 0.066,
+    "other": 0.058,
+    "major_purchase": 0.022,
+    "medical": 0.011,
+    "small_business": 0.01,
+    "car": 0.01,
+    "moving": 0.007,
+    "vacation": 0.007,
+    "house": 0.005,
+    "wedding": 0.002,
+    "renewable_energy": 0.001,
+    "educational": 0.001,
+}
+
+EMP_LENGTH_SHARES = {
+    "< 1 year": 0.08,
+    "1 year": 0.066,
+    "2 years": 0.09,
+    "3 years": 0.08,
+    "4 years": 0.06,
+    "5 years": 0.062,
+    "6 years": 0.046,
+    "7 years": 0.042,
+    "8 years": 0.045,
+    "9 years": 0.038,
+    "10+ years": 0.33,
+}
+
+HOME_OWNERSHIP_SHARES = {"MORTGAGE": 0.49, "RENT": 0.397, "OWN": 0.112, "ANY": 0.001}
+VERIFICATION_SHARES = {"Source Verified": 0.39, "Verified": 0.28, "Not Verified": 0.33}
+
+# Loans still running in the raw file; DataCleaner drops them
+OPEN_STATUS_SHARES = {
+    "Current": 0.93,
+    "Late (31-120 days)": 0.03,
+    "In Grace Period": 0.02,
+    "Late (16-30 days)": 0.02,
+}
+FINISHED_SHARE = 0.6
+
+ISSUE_MONTHS = pd.period_range("2007-06", "2018-12", freq="M")
+# Share of missing values in the raw columns that have them
+MISSING_SHARES = {
+    "emp_length": 0.065,
+    "dti": 0.001,
+    "revol_util": 0.001,
+    "mort_acc": 0.022,
+    "pub_rec_bankruptcies": 0.0005,
+    "title": 0.01,
+}
+
+
+def _choice(rng, shares: Dict[str, float], n_rows: int) -> np.ndarray:
+    labels = np.array(list(shares), dtype=object)
+    p = np.array(list(shares.values()))
+    return labels[rng.choice(len(labels), n_rows, p=p / p.sum())]
+
+
+def _month_labels(periods) -> np.ndarray:
+    return np.asarray(periods.strftime("%b-%Y"), dtype=object)
+
+
+def _with_missing(rng, values: np.ndarray, share: float) -> np.ndarray:
+    values = values.astype(object if values.dtype == object else np.float64)
+    values[rng.random(len(values)) < share] = np.nan
+    return values
+
+
+def synthetic_raw_loans(
+    n_rows: int, seed: int = 0, finished_only: bool = False
+) -> pd.DataFrame:
+    """
+    `n_rows` loans in the raw CSV schema. With `finished_only`, every loan
+    is 'Fully Paid' or 'Charged Off', so DataCleaner keeps all of them.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    # Volume grows over time, as in the real book
+    month_weights = np.exp(0.03 * np.arange(len(ISSUE_MONTHS)))
+    issue_idx = rng.choice(
+        len(ISSUE_MONTHS), n_rows, p=month_weights / month_weights.sum()
+    )
+    history_months = (36 + rng.gamma(4.0, 48.0, n_rows)).astype(np.int64)
+    earliest = ISSUE_MONTHS[issue_idx] - history_months
+
+    grade = rng.choice(len(GRADE_SHARES), n_rows, p=list(GRADE_SHARES.values()))
+    sub_grade_idx = 5 * grade + rng.integers(0, 5, n_rows)
+
+    term_months = np.where(rng.random(n_rows) < 0.1 + 0.012 * sub_grade_idx, 60, 36)
+    int_rate = np.clip(
+        5.3 + 0.72 * sub_grade_idx + rng.normal(0, 0.6, n_rows), 5.31, 30.99
+    ).round(2)
+    loan_amnt = (
+        np.clip(rng.lognormal(9.4, 0.6, n_rows), 1000, 40000) / 25
+    ).round() * 25
+    monthly_rate = int_rate / 1200
+    installment = (
+        loan_amnt * monthly_rate / (1 - (1 + monthly_rate) ** -term_months)
+    ).round(2)
+
+    fico_low = np.minimum(660 + 5 * rng.gamma(1.6, 4.8, n_rows).astype(np.int64), 845)
+    open_acc = rng.poisson(10.6, n_rows) + 1
+    pub_rec = rng.choice(4, n_rows, p=[0.84, 0.13, 0.02, 0.01])
+    dti = np.clip(rng.gamma(4.5, 4.0, n_rows), 0, 99.9).round(2)
+
+    default_logit = (
+        -2.55
+        + 0.09 * sub_grade_idx
+        + 0.4 * (term_months == 60)
+        + 0.01 * (dti - 18)
+        - 0.01 * (fico_low - 695)
+    )
+    defaulted = rng.random(n_rows) < 1 / (1 + np.exp(-default_logit))
+    loan_status = np.where(defaulted, "Charged Off", "Fully Paid").astype(object)
+    if not finished_only:
+        still_open = rng.random(n_rows) >= FINISHED_SHARE
+        loan_status[still_open] = _choice(rng, OPEN_STATUS_SHARES, still_open.sum())
+
+    purpose = _choice(rng, PURPOSE_SHARES, n_rows)
+    titles = {p: p.replace("_", " ").capitalize() for p in PURPOSE_SHARES}
+
+    df = pd.DataFrame(
+        {
+            "addr_state": _choice(rng, STATE_SHARES, n_rows),
+            "annual_inc": np.clip(rng.lognormal(11.05, 0.5, n_rows), 4000, 9e6).round(),
+            "application_type": np.where(
+                rng.random(n_rows) < 0.953, "Individual", "Joint App"
+            ),
+            "dti": _with_missing(rng, dti, MISSING_SHARES["dti"]),
+            "earliest_cr_line": _month_labels(earliest),
+            "emp_length": _with_missing(
+                rng,
+                _choice(rng, EMP_LENGTH_SHARES, n_rows),
+                MISSING_SHARES["emp_length"],
+            ),
+            "fico_range_high": fico_low + 4,
+            "fico_range_low": fico_low,
+            "home_ownership": _choice(rng, HOME_OWNERSHIP_SHARES, n_rows),
+            "initial_list_status": np.where(rng.random(n_rows) < 0.65, "w", "f"),
+            "installment": installment,
+            "int_rate": int_rate,
+            "issue_d": _month_labels(ISSUE_MONTHS[issue_idx]),
+            "loan_amnt": loan_amnt,
+            "loan_status": loan_status,
+            "mort_acc": _with_missing(
+                rng, rng.poisson(1.6, n_rows), MISSING_SHARES["mort_acc"]
+            ),
+            "open_acc": open_acc,
+            "pub_rec": pub_rec,
+            "pub_rec_bankruptcies": _with_missing(
+                rng,
+                pub_rec * (rng.random(n_rows) < 0.8),
+                MISSING_SHARES["pub_rec_bankruptcies"],
+            ),
+            "purpose": purpose,
+            "revol_bal": np.clip(rng.lognormal(9.2, 1.0, n_rows), 0, 2e6).round(),
+            "revol_util": _with_missing(
+                rng,
+                (rng.beta(2.0, 2.2, n_rows) * 100).round(1),
+                MISSING_SHARES["revol_util"],
+            ),
+            "sub_grade": SUB_GRADES[sub_grade_idx],
+            "term": np.where(term_months == 60, " 60 months", " 36 months"),
+            "title": _with_missing(
+                rng, pd.Series(purpose).map(titles).to_numpy(), MISSING_SHARES["title"]
+            ),
+            "total_acc": open_acc + rng.poisson(13, n_rows),
+            "verification_status": _choice(rng, VERIFICATION_SHARES, n_rows),
+            "zip_code": np.char.add(
+                rng.integers(100, 1000, n_rows).astype(str), "xx"
+            ).astype(object),
+        }
+    )
+    return df[USE_COLS]
+
+
+def synthetic_cleaned_loans(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    `n_rows` finished loans passed through DataCleaner, i.e. the schema of
+    cleaned_data.parquet.
+    """
+
+    raw = synthetic_raw_loans(n_rows, seed, finished_only=True)
+    return DataCleaner().clean(raw).reset_index(drop=True)
+
+
+def write_synthetic_csv(
+    path: Path, n_rows: int, seed: int = 0, chunk_rows: int = 1_000_000
+) -> Path:
+    """
+    Raw CSV of `n_rows` synthetic loans, generated `chunk_rows` at a time
+    so memory does not grow with `n_rows`.
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for i, start in enumerate(range(0, n_rows, chunk_rows)):
+        chunk = synthetic_raw_loans(min(chunk_rows, n_rows - start), seed=[seed, i])
+        chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    logger.info(f"Wrote {n_rows:,} synthetic loans to {path}")
+    return path
+
+
+def request_rows(df: pd.DataFrame) -> List[dict]:
+    """
+    Cleaned rows (before or after DataSplitter parsed issue_d) as API
+    LoanRequest payloads.
+    """
+
+    df = df.drop(columns=["is_default", "zip_code"], errors="ignore")
+    if pd.api.types.is_datetime64_any_dtype(df["issue_d"]):
+        df = df.assign(issue_d=df["issue_d"].dt.strftime("%b-%Y"))
+    df = df.assign(
+        term=df["term"].str.strip(),
+        mort_acc=df["mort_acc"].astype(int),
+        pub_rec_bankruptcies=df["pub_rec_bankruptcies"].astype(int),
+    )
+    return df.to_dict(orient="records")
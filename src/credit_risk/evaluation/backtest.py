@@ -0,0 +1,296 @@
+"""
+Walk-forward (rolling-origin) backtesting.
+
+Expanding or sliding windows are generated from issue_d. Every window
+fits its own FeatureBuilder and model on the training period and is
+evaluated on the following test period. Windows run in a process pool
+and completed windows are checkpointed so an interrupted run resumes
+where it stopped. Checkpoints carry a fingerprint of the model
+parameters, the data and the code, and are only reused by a run with the
+same fingerprint.
+"""
+
+import hashlib
+import inspect
+import json
+import multiprocessing as mp
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from credit_risk.data.split_data import parse_issue_date
+from credit_risk.evaluation.metrics import evaluate_classification
+from credit_risk.features import build_features
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.registry import get_model
+from credit_risk.utils.config import backtest_config, data_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.pool import worker_pool
+
+logger = get_logger(__name__)
+
+# Per-process state. In the parent it holds the data before forking so
+# workers inherit it copy-on-write instead of receiving a pickled copy.
+_WORKER_STATE = {}
+
+
+@dataclass(frozen=True)
+class BacktestWindow:
+    window_id: int
+    train_start: pd.Timestamp
+    train_end: pd.Timestamp  # exclusive, also the test start
+    test_end: pd.Timestamp  # exclusive
+
+    def key(self) -> str:
+        return "|".join(
+            str(v.date()) for v in (self.train_start, self.train_end, self.test_end)
+        )
+
+
+def generate_windows(
+    dates,
+    mode: str = backtest_config.MODE,
+    train_months: int = backtest_config.TRAIN_MONTHS,
+    test_months: int = backtest_config.TEST_MONTHS,
+    step_months: int = backtest_config.STEP_MONTHS,
+) -> List[BacktestWindow]:
+    """
+    Generate walk-forward windows over monthly issue dates.
+
+    mode="expanding" keeps the training start fixed at the first month;
+    mode="sliding" uses a training period of exactly `train_months`.
+    Only windows with a complete test period are returned.
+    """
+
+    if mode not in ("expanding", "sliding"):
+        raise ValueError(f"Unknown backtest mode '{mode}'")
+
+    dates = parse_issue_date(pd.Series(dates)).dropna()
+    if dates.empty:
+        return []
+
+    first = dates.min().to_period("M").to_timestamp()
+    last = dates.max().to_period("M").to_timestamp()
+    horizon = last + pd.DateOffset(months=1)
+
+    windows = []
+    train_end = first + pd.DateOffset(months=train_months)
+    while train_end + pd.DateOffset(months=test_months) <= horizon:
+        train_start = (
+            first
+            if mode == "expanding"
+            else train_end - pd.DateOffset(months=train_months)
+        )
+        windows.append(
+            BacktestWindow(
+                window_id=len(windows),
+                train_start=train_start,
+                train_end=train_end,
+                test_end=train_end + pd.DateOffset(months=test_months),
+            )
+        )
+        train_end = train_end + pd.DateOffset(months=step_months)
+
+    return windows
+
+
+def _init_worker(df: Optional[pd.DataFrame]):
+    if df is not None:
+        _WORKER_STATE["df"] = df
+
+
+def _slice(df: pd.DataFrame, start, end) -> pd.DataFrame:
+    dates = df[data_config.DATE_COL].to_numpy()
+    lo = np.searchsorted(dates, np.datetime64(start), side="left")
+    hi = np.searchsorted(dates, np.datetime64(end), side="left")
+    return df.iloc[lo:hi]
+
+
+def _window_row(window: BacktestWindow, status: str = "ok") -> dict:
+    return {
+        "window_id": window.window_id,
+        "key": window.key(),
+        "train_start": str(window.train_start.date()),
+        "train_end": str(window.train_end.date()),
+        "test_end": str(window.test_end.date()),
+        "status": status,
+        "roc_auc": np.nan,
+        "ks": np.nan,
+    }
+
+
+def _run_window(window: BacktestWindow, model_name: str) -> dict:
+    df = _WORKER_STATE["df"]
+
+    train_df = _slice(df, window.train_start, window.train_end)
+    test_df = _slice(df, window.train_end, window.test_end)
+
+    row = _window_row(window)
+    row["n_train"] = len(train_df)
+    row["n_test"] = len(test_df)
+    if train_df.empty or test_df.empty:
+        return row
+
+    start = time.perf_counter()
+
+    feature_builder = FeatureBuilder()
+    X_train, y_train = feature_builder.build_features(train_df, fit=True)
+    X_test, y_test = feature_builder.build_features(test_df, fit=False)
+
+    model = get_model(model_name)
+    model.train(X_train, y_train)
+
+    y_prob = model.predict_proba(X_test)[:, 1]
+
+    if y_test.nunique() == 2:
+        metrics = evaluate_classification(y_true=y_test, y_prob=y_prob)
+        row["roc_auc"] = float(metrics["roc_auc"])
+        row["ks"] = float(metrics["ks"])
+
+    row["train_default_rate"] = float(y_train.mean())
+    row["test_default_rate"] = float(y_test.mean())
+    row["fit_seconds"] = round(time.perf_counter() - start, 3)
+
+    return row
+
+
+def run_fingerprint(df: pd.DataFrame, model_name: str) -> str:
+    """
+    Digest of everything a window's metrics depend on besides its dates:
+    the model parameters, the data, and the backtest, feature and model
+    code.
+    """
+
+    model = get_model(model_name)
+    params = model.model.get_params()
+    params.pop("n_jobs", None)  # resolved from the thread budget
+
+    digest = hashlib.sha256(
+        json.dumps(
+            {"model": model_name, "params": params}, sort_keys=True, default=str
+        ).encode()
+    )
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().data)
+    code = (__file__, inspect.getfile(build_features), inspect.getfile(type(model)))
+    for path in code:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _load_checkpoint(path: Path, run: str) -> dict:
+    done = {}
+    if not path.exists():
+        return done
+
+    stale = 0
+    with open(path) as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                # Partially written line from an interrupted run
+                continue
+            if row.get("run") != run:
+                stale += 1
+                continue
+            done[row["key"]] = row
+    if stale:
+        logger.info(f"Ignoring {stale} checkpointed windows from other runs")
+    return done
+
+
+def run_backtest(
+    df: pd.DataFrame,
+    model_name: str,
+    windows: List[BacktestWindow],
+    output_path: Path,
+    n_jobs: int = backtest_config.N_JOBS,
+) -> pd.DataFrame:
+    """
+    Train and evaluate one model per window and return the per-window
+    metrics table (also written to `output_path` as CSV).
+
+    Completed windows are appended to `<output_path>.jsonl` as they
+    finish; windows already present there for the same `run_fingerprint`
+    are not recomputed. A window
+    that raises is logged and reported with status "failed" (and its
+    error) but not checkpointed, so the next run retries it.
+    """
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    checkpoint_path = output_path.with_suffix(".jsonl")
+
+    run = run_fingerprint(df, model_name)
+    done = _load_checkpoint(checkpoint_path, run)
+    failed = {}
+    pending = [w for w in windows if w.key() not in done]
+    logger.info(
+        f"Backtest {model_name}: {len(windows)} windows, "
+        f"{len(windows) - len(pending)} already completed"
+    )
+
+    if pending:
+        df = df.copy()
+        df[data_config.DATE_COL] = parse_issue_date(df[data_config.DATE_COL])
+        df = df.dropna(subset=[data_config.DATE_COL])
+        df = df.sort_values(data_config.DATE_COL, kind="stable")
+
+        n_jobs = max(1, min(n_jobs, len(pending)))
+
+        if "fork" in mp.get_all_start_methods():
+            ctx = mp.get_context("fork")
+            _WORKER_STATE["df"] = df
+            initargs = (None,)
+        else:
+            ctx = mp.get_context()
+            initargs = (df,)
+
+        try:
+            with worker_pool(
+                n_jobs, _init_worker, initargs, mp_context=ctx
+            ) as pool, open(checkpoint_path, "a") as checkpoint:
+                futures = {
+                    pool.submit(_run_window, w, model_name): w for w in pending
+                }
+                for future in as_completed(futures):
+                    window = futures[future]
+                    try:
+                        row = {**future.result(), "run": run}
+                    except Exception as exc:
+                        logger.exception(f"Window {window.window_id} failed")
+                        row = _window_row(window, status="failed")
+                        row["error"] = f"{type(exc).__name__}: {exc}"
+                        failed[row["key"]] = row
+                        continue
+                    checkpoint.write(json.dumps(row) + "\n")
+                    checkpoint.flush()
+                    done[row["key"]] = row
+                    logger.info(
+                        f"Window {row['window_id']} ({row['train_end']}) → "
+                        f"AUC={row['roc_auc']:.4f}, KS={row['ks']:.4f}"
+                    )
+        finally:
+            _WORKER_STATE.pop("df", None)
+
+    if failed:
+        logger.warning(f"{len(failed)} of {len(windows)} windows failed")
+
+    keys = {w.key() for w in windows}
+    rows = [row for key, row in {**done, **failed}.items() if key in keys]
+    results = (
+        pd.DataFrame(rows)
+        .sort_values("train_end")
+        .drop(columns=["key", "run"], errors="ignore")
+        .reset_index(drop=True)
+    )
+    results.insert(0, "model", model_name)
+    results.to_csv(output_path, index=False)
+    logger.info(f"Backtest results written to {output_path}")
+
+    return results
@@ -1,23 +1,150 @@
-import pandas as pd
-from sklearn.metrics import roc_auc_score, confusion_matrix
+"""
+Classification metrics for default scores.
 
+The exact path sorts the scores once and derives AUC, KS, Gini and the
+confusion matrix from the same cumulative counts. The histogram path
+(`MetricsAccumulator`) bins scores into fixed bins; accumulators can be
+updated chunk by chunk and merged across shards, and report a bound on
+their approximation error.
+"""
 
-def ks_statistic(y_true, y_prob):
-    data = pd.DataFrame({"y_true": y_true, "y_prob": y_prob}).sort_values(
-        "y_prob", ascending=False
-    )
+import numpy as np
 
-    data["cum_good"] = (data["y_true"] == 0).cumsum() / (data["y_true"] == 0).sum()
-    data["cum_bad"] = (data["y_true"] == 1).cumsum() / (data["y_true"] == 1).sum()
 
-    return (data["cum_bad"] - data["cum_good"]).abs().max()
+def _as_arrays(y_true, y_prob):
+    y_true = np.asarray(y_true).astype(bool, copy=False)
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    if y_true.shape != y_prob.shape:
+        raise ValueError(f"Shape mismatch: {y_true.shape} vs {y_prob.shape}")
+    # NaN sorts last and casts to an arbitrary bin, which would skew AUC / KS
+    if not np.isfinite(y_prob).all():
+        raise ValueError("y_prob contains NaN or infinite scores")
+    return y_true, y_prob
 
 
-def evaluate_classification(y_true, y_prob, threshold=0.5):
-    y_pred = (y_prob >= threshold).astype(int)
+def _check_both_classes(n_pos, n_neg):
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError(
+            "Only one class present in y_true. AUC / KS are not defined in that case."
+        )
+
+
+def _curve_metrics(tp, fp) -> dict:
+    """
+    AUC / KS / Gini from cumulative (tp, fp) counts at descending
+    thresholds, one entry per tie group (or bin).
+    """
 
+    n_pos, n_neg = tp[-1], fp[-1]
+    _check_both_classes(n_pos, n_neg)
+
+    tpr = np.concatenate([[0.0], tp / n_pos])
+    fpr = np.concatenate([[0.0], fp / n_neg])
+
+    auc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2)
     return {
-        "roc_auc": roc_auc_score(y_true, y_prob),
-        "ks": ks_statistic(y_true, y_prob),
-        "confusion_matrix": confusion_matrix(y_true, y_pred),
+        "roc_auc": auc,
+        "ks": float(np.max(np.abs(tpr - fpr))),
+        "gini": 2 * auc - 1,
     }
+
+
+def _confusion(n_pos, n_neg, tp, fp) -> np.ndarray:
+    # Same layout as sklearn.metrics.confusion_matrix: [[tn, fp], [fn, tp]]
+    return np.array([[n_neg - fp, fp], [n_pos - tp, tp]], dtype=np.int64)
+
+
+def evaluate_classification(y_true, y_prob, threshold=0.5):
+    """
+    AUC, KS, Gini and the confusion matrix at `threshold` from a single
+    sort of the scores. Ties are handled as one group, as in roc_auc_score.
+    """
+
+    y_true, y_prob = _as_arrays(y_true, y_prob)
+
+    order = np.argsort(-y_prob, kind="stable")
+    scores = y_prob[order]
+    labels = y_true[order]
+
+    tp_all = np.cumsum(labels)
+    fp_all = np.arange(1, len(labels) + 1) - tp_all
+
+    # Last row of every tie group
+    ends = np.r_[np.flatnonzero(np.diff(scores)), len(scores) - 1]
+    metrics = _curve_metrics(tp_all[ends], fp_all[ends])
+
+    # Rows predicted positive: scores >= threshold (a prefix of the sort)
+    n_pred = int(np.searchsorted(-scores, -threshold, side="right"))
+    tp = int(tp_all[n_pred - 1]) if n_pred else 0
+    metrics["confusion_matrix"] = _confusion(
+        int(tp_all[-1]), int(fp_all[-1]), tp, n_pred - tp
+    )
+    return metrics
+
+
+def ks_statistic(y_true, y_prob):
+    return evaluate_classification(y_true, y_prob)["ks"]
+
+
+class MetricsAccumulator:
+    """
+    Fixed-bin histogram of positive / negative counts over [0, 1].
+
+    `update` with chunks, `merge` accumulators from parallel shards, then
+    `compute`. Scores in the same bin are treated as tied, so AUC is off
+    by at most `auc_error_bound` and KS by at most `ks_error_bound`.
+    The confusion matrix is exact when `threshold` is a bin edge.
+    """
+
+    def __init__(self, n_bins: int = 10_000):
+        self.n_bins = n_bins
+        self.pos = np.zeros(n_bins, dtype=np.int64)
+        self.neg = np.zeros(n_bins, dtype=np.int64)
+
+    def _bins(self, y_prob) -> np.ndarray:
+        bins = (y_prob * self.n_bins).astype(np.int64)
+        return np.clip(bins, 0, self.n_bins - 1)
+
+    def update(self, y_true, y_prob) -> "MetricsAccumulator":
+        y_true, y_prob = _as_arrays(y_true, y_prob)
+        bins = self._bins(y_prob)
+        self.pos += np.bincount(bins[y_true], minlength=self.n_bins)
+        self.neg += np.bincount(bins[~y_true], minlength=self.n_bins)
+        return self
+
+    def merge(self, other: "MetricsAccumulator") -> "MetricsAccumulator":
+        if other.n_bins != self.n_bins:
+            raise ValueError("Cannot merge accumulators with different bin counts")
+        self.pos += other.pos
+        self.neg += other.neg
+        return self
+
+    def __add__(self, other: "MetricsAccumulator") -> "MetricsAccumulator":
+        return MetricsAccumulator(self.n_bins).merge(self).merge(other)
+
+    @property
+    def count(self) -> int:
+        return int(self.pos.sum() + self.neg.sum())
+
+    def compute(self, threshold: float = 0.5) -> dict:
+        # Highest bin first, i.e. descending scores
+        tp = np.cumsum(self.pos[::-1])
+        fp = np.cumsum(self.neg[::-1])
+        n_pos, n_neg = int(tp[-1]), int(fp[-1])
+
+        metrics = _curve_metrics(tp, fp)
+
+        first_bin = int(np.ceil(threshold * self.n_bins))
+        metrics["confusion_matrix"] = _confusion(
+            n_pos,
+            n_neg,
+            int(self.pos[first_bin:].sum()),
+            int(self.neg[first_bin:].sum()),
+        )
+        metrics["auc_error_bound"] = float(
+            np.sum(self.pos * self.neg) / (2 * n_pos * n_neg)
+        )
+        metrics["ks_error_bound"] = float(
+            max((self.pos / n_pos).max(), (self.neg / n_neg).max())
+        )
+        return metrics
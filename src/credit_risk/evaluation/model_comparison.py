@@ -7,6 +7,12 @@ Model comparison utilities
 import pandas as pd
 from typing import Dict
 
+from credit_risk.evaluation.bootstrap import (
+    METRICS,
+    bootstrap_metrics,
+    confidence_interval,
+    paired_difference,
+)
 from credit_risk.evaluation.metrics import evaluate_classification
 from credit_risk.utils.logging import get_logger
 
@@ -18,6 +24,8 @@ def compare_models(
     X,
     y,
     threshold: float = 0.5,
+    n_bootstrap: int = 0,
+    n_jobs: int = None,
 ) -> pd.DataFrame:
     """
     Compare multiple classification models on the same dataset.
@@ -32,14 +40,20 @@ def compare_models(
         True labels
     threshold : float
         Classification threshold
+    n_bootstrap : int
+        Bootstrap replicates for confidence intervals (0 disables them)
+    n_jobs : int
+        Worker processes for the bootstrap
 
     Returns
     -------
     pd.DataFrame
-        Comparison table with metrics
+        Comparison table with metrics. With `n_bootstrap`, also CI columns
+        and a paired test of each model's AUC against the best model.
     """
 
     results = []
+    scores = {}
 
     for model_name, model in models.items():
         logger.info(f"Evaluating model: {model_name}")
@@ -50,6 +64,7 @@ def compare_models(
 
         # Slice positive class probability
         y_prob = y_prob_2d[:, 1]
+        scores[model_name] = y_prob
 
         # Evaluate metrics
 
@@ -68,5 +83,35 @@ def compare_models(
         )
 
     comparison_df = pd.DataFrame(results).sort_values(by="roc_auc", ascending=False)
+    comparison_df = comparison_df.reset_index(drop=True)
 
-    return comparison_df.reset_index(drop=True)
+    if n_bootstrap:
+        comparison_df = _add_bootstrap_columns(
+            comparison_df, y, scores, n_bootstrap, n_jobs
+        )
+
+    return comparison_df
+
+
+def _add_bootstrap_columns(comparison_df, y, scores, n_bootstrap, n_jobs):
+    kwargs = {"n_jobs": n_jobs} if n_jobs else {}
+    replicates = bootstrap_metrics(y, scores, n_replicates=n_bootstrap, **kwargs)
+
+    best = comparison_df.loc[0, "model"]
+    rows = []
+    for model_name in comparison_df["model"]:
+        row = {}
+        for metric in METRICS:
+            low, high = confidence_interval(replicates[model_name][metric])
+            row[f"{metric}_ci_low"] = low
+            row[f"{metric}_ci_high"] = high
+
+        if model_name != best:
+            test = paired_difference(replicates, best, model_name, "roc_auc")
+            row["roc_auc_gap_to_best"] = test["diff_mean"]
+            row["gap_ci_low"] = test["diff_ci_low"]
+            row["gap_ci_high"] = test["diff_ci_high"]
+            row["p_value_vs_best"] = test["p_value"]
+        rows.append(row)
+
+    return pd.concat([comparison_df, pd.DataFrame(rows)], axis=1)
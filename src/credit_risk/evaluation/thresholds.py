@@ -0,0 +1,146 @@
+"""
+Choice of the approve / review / reject bands.
+
+Loans are approved below the low threshold, sent to manual review
+between the two and rejected above the high threshold. Scores are
+sorted once; every quantity of a band pair is a difference of prefix
+sums at the two cut points, so all candidate pairs are evaluated at
+once on a (n_candidates, n_candidates) grid instead of re-scoring the
+portfolio per threshold.
+
+Value model: an approved loan earns `int_rate * INTEREST_YEARS` of its
+amount if repaid and loses `LOSS_GIVEN_DEFAULT` of it on default. A
+review costs `REVIEW_COST` and is assumed to approve the loans that
+repay and decline the ones that default.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from credit_risk.utils.config import threshold_config
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _candidate_cuts(sorted_scores: np.ndarray, n_candidates: int) -> np.ndarray:
+    """
+    Row counts k (rows [:k] fall below the threshold) at tie-group starts,
+    thinned to at most `n_candidates` evenly spaced in rank.
+    """
+
+    n = len(sorted_scores)
+    cuts = np.r_[0, np.flatnonzero(np.diff(sorted_scores)) + 1, n]
+    if len(cuts) > n_candidates:
+        keep = np.linspace(0, len(cuts) - 1, n_candidates).round().astype(np.int64)
+        cuts = cuts[np.unique(keep)]
+    return cuts
+
+
+def optimize_thresholds(
+    y_true,
+    y_prob,
+    loan_amnt,
+    int_rate,
+    loss_given_default: float = threshold_config.LOSS_GIVEN_DEFAULT,
+    interest_years: float = threshold_config.INTEREST_YEARS,
+    review_cost: float = threshold_config.REVIEW_COST,
+    max_review_rate: float = threshold_config.MAX_REVIEW_RATE,
+    n_candidates: int = threshold_config.N_CANDIDATES,
+) -> Tuple[dict, pd.DataFrame]:
+    """
+    Most profitable (low, high) band pair within the review capacity.
+
+    `int_rate` is in percent, as in the LendingClub data. Returns the
+    chosen thresholds with their metrics, and the profit curve: for every
+    candidate low threshold, the best high threshold and its metrics.
+    """
+
+    y_true = np.asarray(y_true).astype(bool)
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    amount = np.asarray(loan_amnt, dtype=np.float64)
+    rate = np.asarray(int_rate, dtype=np.float64) / 100
+    n = len(y_prob)
+
+    order = np.argsort(y_prob, kind="stable")
+    scores, bad = y_prob[order], y_true[order]
+    gain = np.where(bad, 0.0, amount[order] * rate[order] * interest_years)
+    loss = np.where(bad, amount[order] * loss_given_default, 0.0)
+
+    # Prefix sums over the ascending sort (entry k covers rows [:k])
+    gain_cum = np.r_[0.0, np.cumsum(gain)]
+    loss_cum = np.r_[0.0, np.cumsum(loss)]
+    bad_cum = np.r_[0, np.cumsum(bad)]
+
+    cuts = _candidate_cuts(scores, n_candidates)
+    thresholds = np.r_[scores, 1.0][cuts]
+
+    # Grid of (low cut i, high cut j): approve [:i], review [i:j], reject [j:]
+    low, high = cuts[:, None], cuts[None, :]
+    n_review = high - low
+    profit = (
+        gain_cum[low]
+        - loss_cum[low]
+        + (gain_cum[high] - gain_cum[low])
+        - review_cost * n_review
+    )
+    feasible = (n_review >= 0) & (n_review <= max_review_rate * n)
+    profit = np.where(feasible, profit, -np.inf)
+
+    best_high = np.argmax(profit, axis=1)
+    rows = np.arange(len(cuts))
+    approved, reviewed = cuts, cuts[best_high] - cuts
+
+    # Undefined (NaN) when nobody is approved
+    approved_default_rate = np.divide(
+        bad_cum[cuts],
+        approved,
+        out=np.full(len(cuts), np.nan),
+        where=approved > 0,
+    )
+    curve = pd.DataFrame(
+        {
+            "low_threshold": thresholds,
+            "high_threshold": thresholds[best_high],
+            "approval_rate": approved / n,
+            "review_rate": reviewed / n,
+            "reject_rate": 1 - (approved + reviewed) / n,
+            "approved_default_rate": approved_default_rate,
+            "expected_loss": loss_cum[cuts],
+            "profit": profit[rows, best_high],
+        }
+    )
+
+    best = curve.loc[curve["profit"].idxmax()].to_dict()
+    chosen = {
+        "low_risk_threshold": float(best.pop("low_threshold")),
+        "high_risk_threshold": float(best.pop("high_threshold")),
+        # None rather than NaN, which is not valid JSON
+        "metrics": {
+            key: float(value) if np.isfinite(value) else None
+            for key, value in best.items()
+        },
+    }
+    logger.info(
+        f"Chosen bands: approve < {chosen['low_risk_threshold']:.4f} <= review < "
+        f"{chosen['high_risk_threshold']:.4f} <= reject "
+        f"(approval {best['approval_rate']:.1%}, review {best['review_rate']:.1%})"
+    )
+    return chosen, curve
+
+
+def save_thresholds(chosen: dict, path: Path, model_digest: Optional[str] = None):
+    with open(path, "w") as f:
+        json.dump(
+            {**chosen, "model_digest": model_digest}, f, indent=4, allow_nan=False
+        )
+    logger.info(f"Thresholds saved to {path}")
+
+
+def load_thresholds(path: Path) -> dict:
+    with open(path) as f:
+        return json.load(f)
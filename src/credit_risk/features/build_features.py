@@ -8,6 +8,23 @@ from credit_risk.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def add_core_features(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+
+    df["issue_d"] = pd.to_datetime(df["issue_d"], errors="coerce")
+    df["earliest_cr_line"] = pd.to_datetime(df["earliest_cr_line"], errors="coerce")
+
+    df["issue_year"] = df["issue_d"].dt.year
+    df["issue_month"] = df["issue_d"].dt.month
+    df["earliest_cr_year"] = df["earliest_cr_line"].dt.year
+
+    df["fico_avg"] = (df["fico_range_low"] + df["fico_range_high"]) / 2
+
+    return df.drop(
+        columns=["issue_d", "earliest_cr_line", "fico_range_low", "fico_range_high"]
+    )
+
+
 class FeatureBuilder:
     def __init__(self):
         self.preprocessor = None
@@ -50,20 +67,7 @@ class FeatureBuilder:
         ]
 
     def _add_core_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-
-        df["issue_d"] = pd.to_datetime(df["issue_d"], errors="coerce")
-        df["earliest_cr_line"] = pd.to_datetime(df["earliest_cr_line"], errors="coerce")
-
-        df["issue_year"] = df["issue_d"].dt.year
-        df["issue_month"] = df["issue_d"].dt.month
-        df["earliest_cr_year"] = df["earliest_cr_line"].dt.year
-
-        df["fico_avg"] = (df["fico_range_low"] + df["fico_range_high"]) / 2
-
-        return df.drop(
-            columns=["issue_d", "earliest_cr_line", "fico_range_low", "fico_range_high"]
-        )
+        return add_core_features(df)
 
     def build_features(self, df: pd.DataFrame, fit: bool = True):
         logger.info("Building features")
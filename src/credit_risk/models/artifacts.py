@@ -0,0 +1,134 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+import joblib
+
+from credit_risk.evaluation.calibration import fit_calibrator
+from credit_risk.monitoring.drift import DriftBaseline
+from credit_risk.utils.config import calibration_config, drift_config, threshold_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.paths import project_root
+
+logger = get_logger(__name__)
+
+MODELS_DIR = project_root / "models"
+
+# Files stamped with the digest of the model.pkl they were derived from
+BOUND_ARTIFACTS = (
+    calibration_config.FILENAME,
+    drift_config.FILENAME,
+    threshold_config.FILENAME,
+)
+
+
+def model_dir(model_name: str) -> Path:
+    return MODELS_DIR / model_name
+
+
+def file_digest(path: Path) -> str:
+    """
+    SHA-256 of a file, used to tie auxiliary artifacts to a model.pkl.
+    """
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def metrics_to_json(metrics: dict, **extra) -> dict:
+    """
+    JSON-serializable form of `evaluate_classification` output.
+    """
+
+    payload = {
+        "roc_auc": metrics["roc_auc"],
+        "ks": metrics["ks"],
+        "confusion_matrix": metrics["confusion_matrix"].tolist(),
+    }
+    payload.update(extra)
+    return payload
+
+
+def save_artifacts(directory: Path, model=None, feature_builder=None, metrics=None):
+    """
+    Write model.pkl / feature_builder.pkl / metrics.json into `directory`.
+    """
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    if model is not None:
+        joblib.dump(model, directory / "model.pkl")
+    if feature_builder is not None:
+        joblib.dump(feature_builder, directory / "feature_builder.pkl")
+    if metrics is not None:
+        with open(directory / "metrics.json", "w") as f:
+            json.dump(metrics, f, indent=4)
+
+
+def _remove_stale(directory: Path, filename: str, reason: str):
+    path = directory / filename
+    if path.exists():
+        path.unlink()
+        logger.warning(f"Removed {path}: {reason}")
+
+
+def publish_model_artifacts(
+    directory: Path,
+    model=None,
+    feature_builder=None,
+    metrics: dict = None,
+    y_val=None,
+    y_val_proba=None,
+    train_df=None,
+) -> Optional[dict]:
+    """
+    Write a model with the artifacts bound to it.
+
+    Saves model.pkl / feature_builder.pkl / metrics.json like `save_artifacts`,
+    then refits the calibrator on (`y_val`, `y_val_proba`) and the drift
+    baseline on `train_df`, both stamped with the new model.pkl digest.
+    Whatever cannot be refit is deleted instead of being left bound to the
+    previous model; thresholds.json is always deleted, since it has to be
+    re-chosen by optimize_thresholds.py on the new scores.
+
+    Returns the calibration report, or None if no calibrator was fitted.
+    """
+
+    directory = Path(directory)
+
+    calibrator, report = None, None
+    if y_val is not None and y_val_proba is not None:
+        calibrator, report = fit_calibrator(y_val, y_val_proba)
+        if metrics is not None:
+            metrics = {**metrics, "calibration": report}
+
+    save_artifacts(directory, model, feature_builder, metrics)
+    digest = file_digest(directory / "model.pkl")
+
+    if calibrator is None:
+        _remove_stale(directory, calibration_config.FILENAME, "no validation scores")
+    else:
+        calibrator.model_digest = digest
+        calibrator.save(directory / calibration_config.FILENAME)
+
+    if calibrator is None or train_df is None:
+        _remove_stale(directory, drift_config.FILENAME, "no calibrated baseline")
+    else:
+        if feature_builder is None:
+            feature_builder = joblib.load(directory / "feature_builder.pkl")
+        baseline = DriftBaseline.build(
+            train_df, calibrator.transform(y_val_proba), feature_builder
+        )
+        baseline.model_digest = digest
+        baseline.save(directory / drift_config.FILENAME)
+
+    _remove_stale(
+        directory, threshold_config.FILENAME, "re-run optimize_thresholds.py"
+    )
+
+    return report
@@ -0,0 +1,29 @@
+"""
+Business decision rules on top of default probabilities.
+"""
+
+import numpy as np
+
+from credit_risk.utils.config import decision_config
+
+RISK_CATEGORIES = np.array(["Low Risk", "Medium Risk", "High Risk"])
+RECOMMENDATIONS = np.array(["Approve", "Review", "Reject"])
+
+
+def risk_bucket(
+    probs,
+    low: float = decision_config.LOW_RISK_THRESHOLD,
+    high: float = decision_config.HIGH_RISK_THRESHOLD,
+) -> np.ndarray:
+    """
+    0 / 1 / 2 for low / medium / high risk (lower bounds inclusive).
+    """
+    return np.searchsorted([low, high], np.asarray(probs), side="right")
+
+
+def risk_category(probs, **thresholds) -> np.ndarray:
+    return RISK_CATEGORIES[risk_bucket(probs, **thresholds)]
+
+
+def recommendation(probs, **thresholds) -> np.ndarray:
+    return RECOMMENDATIONS[risk_bucket(probs, **thresholds)]
@@ -1,6 +1,14 @@
+import numpy as np
 from sklearn.linear_model import SGDClassifier
+from credit_risk.data.shards import prefetch
 from credit_risk.models.base import BaseModel
-from credit_risk.utils.config import model_config
+from credit_risk.utils.config import model_config, streaming_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.memory import current_rss_mb
+
+logger = get_logger(__name__)
+
+CLASSES = np.array([0, 1])
 
 
 class LogisticSGDModel(BaseModel):
@@ -11,6 +19,48 @@ class LogisticSGDModel(BaseModel):
         self.model.fit(X, y)
         return self
 
+    def partial_train(self, X, y):
+        """
+        One incremental SGD pass over (X, y). Continues from the current
+        weights if the model is already fitted (warm start).
+        """
+        self.model.partial_fit(X, y, classes=CLASSES)
+        return self
+
+    def train_streaming(
+        self,
+        load_shard,
+        n_shards: int,
+        n_epochs: int = streaming_config.N_EPOCHS,
+        prefetch_depth: int = streaming_config.PREFETCH_DEPTH,
+        seed: int = streaming_config.SEED,
+    ):
+        """
+        Out-of-core training: `load_shard(i)` returns (X, y) for shard i.
+
+        Every epoch visits the shards in a new random order and shuffles
+        rows within each shard. Only the current shard and `prefetch_depth`
+        upcoming shards are held in memory.
+        """
+
+        rng = np.random.default_rng(seed)
+
+        for epoch in range(1, n_epochs + 1):
+            order = rng.permutation(n_shards)
+            n_rows = 0
+
+            for X, y in prefetch(load_shard, order, depth=prefetch_depth):
+                perm = rng.permutation(len(y))
+                self.partial_train(np.asarray(X)[perm], np.asarray(y)[perm])
+                n_rows += len(y)
+
+            logger.info(
+                f"Epoch {epoch}/{n_epochs}: {n_rows:,} rows, "
+                f"RSS={current_rss_mb():.0f} MB"
+            )
+
+        return self
+
     def predict(self, X):
         return self.model.predict(X)
 
@@ -0,0 +1,169 @@
+"""
+Train several models from a single data / feature pass.
+
+Features are built once, written as .npy files and memory-mapped
+read-only by one worker process per model, so every model trains on
+the same matrices without copies being pickled to the workers. Wall
+time is close to the slowest model instead of the sum of all of them.
+"""
+
+import inspect
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from credit_risk.evaluation.metrics import evaluate_classification
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.artifacts import (
+    BOUND_ARTIFACTS,
+    MODELS_DIR,
+    metrics_to_json,
+    publish_model_artifacts,
+    save_artifacts,
+)
+from credit_risk.models.registry import get_model
+from credit_risk.models.train import train_model
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.pool import (
+    load_shared_matrices,
+    worker_pool,
+    write_shared_matrices,
+)
+
+logger = get_logger(__name__)
+
+MATRIX_FILES = ("X_train", "y_train", "X_val", "y_val")
+
+
+def _publish(staging_dir: Path, output_dir: Path):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Bound artifacts not refitted for the new model.pkl must not survive it
+    for filename in BOUND_ARTIFACTS:
+        if not (staging_dir / filename).exists():
+            (output_dir / filename).unlink(missing_ok=True)
+    for path in staging_dir.iterdir():
+        os.replace(path, output_dir / path.name)
+
+
+def _train_and_evaluate(model_name: str, matrix_dir: str, output_dir: str) -> dict:
+    data = load_shared_matrices(matrix_dir, MATRIX_FILES)
+
+    model = get_model(model_name)
+
+    # Only models that accept an eval_set get the validation window
+    use_eval_set = "eval_set" in inspect.signature(model.train).parameters
+
+    start = time.perf_counter()
+    model = train_model(
+        model,
+        data["X_train"],
+        data["y_train"],
+        X_val=data["X_val"] if use_eval_set else None,
+        y_val=data["y_val"] if use_eval_set else None,
+    )
+    train_seconds = time.perf_counter() - start
+
+    y_val_proba = model.predict_proba(data["X_val"])[:, 1]
+    metrics = evaluate_classification(
+        y_true=data["y_val"], y_prob=y_val_proba, threshold=0.5
+    )
+
+    extra = {"train_seconds": train_seconds}
+    if getattr(model, "training_summary", None):
+        extra["training"] = model.training_summary
+
+    payload = metrics_to_json(metrics, **extra)
+    save_artifacts(output_dir, model=model)
+
+    # Validation scores go back to the parent, which calibrates the model
+    return {"model": model_name, **payload, "y_val_proba": y_val_proba}
+
+
+def train_models(
+    model_names: List[str],
+    train_df: pd.DataFrame,
+    val_df: pd.DataFrame,
+    n_jobs: int = None,
+    output_root: Path = MODELS_DIR,
+) -> pd.DataFrame:
+    """
+    Featurize once, train `model_names` concurrently and write each
+    model's artifacts to `output_root/<model_name>/`.
+
+    Returns the comparison table, best model first.
+    """
+
+    output_root = Path(output_root)
+
+    start = time.perf_counter()
+
+    feature_builder = FeatureBuilder()
+    X_train, y_train = feature_builder.build_features(train_df, fit=True)
+    X_val, y_val = feature_builder.build_features(val_df, fit=False)
+    logger.info(f"Features built once: train={X_train.shape}, val={X_val.shape}")
+
+    n_jobs = max(1, min(n_jobs or len(model_names), len(model_names)))
+
+    # Workers write into a staging directory; model.pkl and its feature
+    # builder are only moved into `output_root` once every model succeeded
+    output_root.mkdir(parents=True, exist_ok=True)
+    staging_root = Path(tempfile.mkdtemp(prefix=".staging_", dir=output_root))
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="credit_risk_matrices_") as tmp_dir:
+            write_shared_matrices(
+                tmp_dir,
+                X_train=np.asarray(X_train, dtype=np.float32),
+                y_train=np.asarray(y_train, dtype=np.int8),
+                X_val=np.asarray(X_val, dtype=np.float32),
+                y_val=np.asarray(y_val, dtype=np.int8),
+            )
+            del X_train, X_val
+
+            with worker_pool(n_jobs) as pool:
+                futures = {
+                    pool.submit(
+                        _train_and_evaluate, name, tmp_dir, str(staging_root / name)
+                    ): name
+                    for name in model_names
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    logger.info(
+                        f"{result['model']}: AUC={result['roc_auc']:.4f}, "
+                        f"KS={result['ks']:.4f} ({result['train_seconds']:.1f}s)"
+                    )
+                    results.append(result)
+
+        for result in results:
+            y_val_proba = result.pop("y_val_proba")
+            metrics = {k: v for k, v in result.items() if k != "model"}
+            publish_model_artifacts(
+                staging_root / result["model"],
+                feature_builder=feature_builder,
+                metrics=metrics,
+                y_val=y_val,
+                y_val_proba=y_val_proba,
+                train_df=train_df,
+            )
+        for name in model_names:
+            _publish(staging_root / name, output_root / name)
+    finally:
+        shutil.rmtree(staging_root, ignore_errors=True)
+
+    comparison_df = (
+        pd.DataFrame(results)[["model", "roc_auc", "ks", "train_seconds"]]
+        .sort_values(by="roc_auc", ascending=False)
+        .reset_index(drop=True)
+    )
+
+    logger.info(f"All models trained in {time.perf_counter() - start:.1f}s")
+    return comparison_df
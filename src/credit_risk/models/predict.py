@@ -1,5 +1,125 @@
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from credit_risk.evaluation.calibration import Calibrator
+from credit_risk.evaluation.thresholds import load_thresholds
+from credit_risk.monitoring.drift import DriftBaseline
+from credit_risk.models.artifacts import file_digest
+from credit_risk.models.serving import serving_model, serving_scorer
+from credit_risk.utils.config import (
+    calibration_config,
+    drift_config,
+    threshold_config,
+)
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
 def predict_scores(model, X):
     """
     Returns default probability scores.
     """
     return model.predict_proba(X)
+
+
+def load_calibrator(model_dir: Path):
+    """
+    calibrator.json from `model_dir`, or None if it is missing or was
+    fitted for a different model.pkl.
+    """
+
+    path = Path(model_dir) / calibration_config.FILENAME
+    if not path.exists():
+        return None
+
+    calibrator = Calibrator.load(path)
+    if calibrator.model_digest != file_digest(Path(model_dir) / "model.pkl"):
+        logger.warning(f"Ignoring {path}: it was fitted for a different model.pkl")
+        return None
+    return calibrator
+
+
+def load_decision_thresholds(model_dir: Path) -> dict:
+    """
+    {"low", "high"} band thresholds from thresholds.json, or {} (the
+    DecisionConfig defaults) if it is missing or belongs to another
+    model.pkl.
+    """
+
+    path = Path(model_dir) / threshold_config.FILENAME
+    if not path.exists():
+        return {}
+
+    stored = load_thresholds(path)
+    if stored.get("model_digest") != file_digest(Path(model_dir) / "model.pkl"):
+        logger.warning(f"Ignoring {path}: it was chosen for a different model.pkl")
+        return {}
+
+    logger.info(
+        f"Decision thresholds from {path}: low={stored['low_risk_threshold']:.4f}, "
+        f"high={stored['high_risk_threshold']:.4f}"
+    )
+    return {
+        "low": stored["low_risk_threshold"],
+        "high": stored["high_risk_threshold"],
+    }
+
+
+def load_drift_baseline(model_dir: Path):
+    """
+    drift_baseline.json from `model_dir`, or None if it is missing or was
+    built for a different model.pkl.
+    """
+
+    path = Path(model_dir) / drift_config.FILENAME
+    if not path.exists():
+        return None
+
+    baseline = DriftBaseline.load(path)
+    if baseline.model_digest != file_digest(Path(model_dir) / "model.pkl"):
+        logger.warning(f"Ignoring {path}: it was built for a different model.pkl")
+        return None
+    return baseline
+
+
+def load_serving_artifacts(model_dir: Path, n_threads: int = None) -> dict:
+    """
+    Load model.pkl / feature_builder.pkl (and calibrator.json,
+    thresholds.json, drift_baseline.json if present) and wrap them in the
+    fastest available serving path. `n_threads` is
+    the per-call thread count of the XGBoost predictor.
+    """
+
+    model_dir = Path(model_dir)
+    model = joblib.load(model_dir / "model.pkl")
+    feature_builder = joblib.load(model_dir / "feature_builder.pkl")
+
+    return {
+        "model": serving_model(model, n_threads=n_threads),
+        "feature_builder": feature_builder,
+        "scorer": serving_scorer(model, feature_builder),
+        "calibrator": load_calibrator(model_dir),
+        "thresholds": load_decision_thresholds(model_dir),
+        "drift_baseline": load_drift_baseline(model_dir),
+    }
+
+
+def predict_default_proba(df: pd.DataFrame, artifacts: dict) -> np.ndarray:
+    """
+    Default probability per raw loan row, using the fused scorer when
+    the artifacts provide one and calibrated when a calibrator is loaded.
+    """
+
+    scorer = artifacts.get("scorer")
+    if scorer is not None:
+        probs = scorer.predict_positive(df)
+    else:
+        X, _ = artifacts["feature_builder"].build_features(df, fit=False)
+        probs = artifacts["model"].predict_proba(X)[:, 1]
+
+    calibrator = artifacts.get("calibrator")
+    return calibrator.transform(probs) if calibrator is not None else probs
@@ -0,0 +1,19 @@
+from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.models.xgboost_model import XGBoostModel
+
+MODEL_REGISTRY = {
+    "logistic": LogisticSGDModel,
+    "xgboost": XGBoostModel,
+}
+
+
+def get_model(name: str):
+    """
+    Instantiate a registered model by name.
+    """
+
+    if name not in MODEL_REGISTRY:
+        raise ValueError(
+            f"Unknown model '{name}'. Available: {sorted(MODEL_REGISTRY)}"
+        )
+    return MODEL_REGISTRY[name]()
@@ -0,0 +1,304 @@
+"""
+Low-latency predictors used by the API.
+
+The sklearn wrappers validate their input and build a DMatrix on every
+call, which dominates latency for the small batches the API serves.
+BoosterPredictor scores the fitted booster directly with in-place
+prediction on a contiguous float32 buffer that is allocated once per
+serving thread.
+
+For the logistic model the whole FeatureBuilder → SGDClassifier path is
+linear, so FusedLinearScorer folds it into one NumPy kernel that needs
+no sklearn at inference.
+"""
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+from credit_risk.features.build_features import add_core_features
+from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.models.xgboost_model import XGBoostModel
+from credit_risk.utils.config import serving_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.threads import current_threads
+
+logger = get_logger(__name__)
+
+FUSED_SCORER_FILENAME = "fused_scorer.npz"
+
+
+class BoosterPredictor:
+    """
+    Serving predictor for a trained XGBoost booster.
+
+    `predict_proba` returns a view into a per-thread output buffer that is
+    overwritten by the next call on the same thread; copy it to keep it.
+    """
+
+    def __init__(
+        self,
+        booster: xgb.Booster,
+        n_threads: int = None,
+        max_batch: int = serving_config.MAX_BATCH,
+        iteration_range=None,
+    ):
+        if n_threads is None:
+            n_threads = min(serving_config.N_THREADS, current_threads())
+        self.booster = booster
+        self.booster.set_param({"nthread": n_threads})
+        self.n_threads = n_threads
+        self.max_batch = max_batch
+        self.n_features = booster.num_features()
+        self.iteration_range = iteration_range or (0, booster.num_boosted_rounds())
+        self._local = threading.local()
+
+    @classmethod
+    def from_model(cls, model: XGBoostModel, **kwargs) -> "BoosterPredictor":
+        # Copy so serving params never leak back into the training artifact
+        booster = model.model.get_booster().copy()
+        best_iteration = getattr(model.model, "best_iteration", None)
+        if best_iteration is not None:
+            kwargs.setdefault("iteration_range", (0, best_iteration + 1))
+        return cls(booster, **kwargs)
+
+    def _buffers(self):
+        if not hasattr(self._local, "X"):
+            self._local.X = np.empty((self.max_batch, self.n_features), np.float32)
+            self._local.proba = np.empty((self.max_batch, 2), np.float32)
+        return self._local.X, self._local.proba
+
+    def _predict_chunk(self, X) -> np.ndarray:
+        buffer, _ = self._buffers()
+        n = len(X)
+        buffer[:n] = X
+        return self.booster.inplace_predict(
+            buffer[:n], iteration_range=self.iteration_range
+        )
+
+    def predict_positive(self, X) -> np.ndarray:
+        """
+        Default probability per row (a new array).
+        """
+
+        X = np.asarray(X)
+        if len(X) <= self.max_batch:
+            return np.array(self._predict_chunk(X))
+        return np.concatenate(
+            [
+                self._predict_chunk(X[i : i + self.max_batch])
+                for i in range(0, len(X), self.max_batch)
+            ]
+        )
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = np.asarray(X)
+        if len(X) > self.max_batch:
+            p = self.predict_positive(X)
+            return np.column_stack([1 - p, p])
+
+        _, proba = self._buffers()
+        n = len(X)
+        proba[:n, 1] = self._predict_chunk(X)
+        np.subtract(1, proba[:n, 1], out=proba[:n, 0])
+        return proba[:n]
+
+    def predict(self, X) -> np.ndarray:
+        return (self.predict_positive(X) >= 0.5).astype(int)
+
+    def warm_up(self):
+        """
+        Run one prediction so the first request does not pay for setup.
+        """
+        self.predict_positive(np.zeros((1, self.n_features), np.float32))
+        return self
+
+
+class FusedLinearScorer:
+    """
+    Logistic model with the feature pipeline folded into its weights.
+
+    The StandardScaler is folded into the numeric weights and intercept
+    (w · (x - m) / s = (w / s) · x - sum(w m / s)) and every one-hot
+    column becomes a per-category weight that is gathered by lookup.
+    Imputation uses the fitted fill values; unseen categories contribute
+    0, as with OneHotEncoder(handle_unknown="ignore").
+    """
+
+    def __init__(
+        self,
+        num_cols,
+        num_weights,
+        num_fill,
+        bin_cols,
+        bin_weights,
+        bin_fill,
+        cat_cols,
+        cat_categories,
+        cat_weights,
+        cat_fill,
+        intercept: float,
+    ):
+        self.num_cols = list(num_cols)
+        self.num_weights = np.asarray(num_weights, dtype=np.float64)
+        self.num_fill = np.asarray(num_fill, dtype=np.float64)
+        self.bin_cols = list(bin_cols)
+        self.bin_weights = np.asarray(bin_weights, dtype=np.float64)
+        self.bin_fill = np.asarray(bin_fill, dtype=np.float64)
+        self.cat_cols = list(cat_cols)
+        self.cat_categories = [np.asarray(c, dtype=str) for c in cat_categories]
+        self.cat_weights = [np.asarray(w, dtype=np.float64) for w in cat_weights]
+        self.cat_fill = list(cat_fill)
+        self.intercept = float(intercept)
+
+    @classmethod
+    def from_artifacts(
+        cls, model: LogisticSGDModel, feature_builder
+    ) -> "FusedLinearScorer":
+        preprocessor = feature_builder.preprocessor
+        num_pipeline = preprocessor.named_transformers_["num"]
+        num_imputer = num_pipeline.named_steps["imputer"]
+        scaler = num_pipeline.named_steps["scaler"]
+        bin_imputer = preprocessor.named_transformers_["bin"]
+        cat_pipeline = preprocessor.named_transformers_["cat"]
+        cat_imputer = cat_pipeline.named_steps["imputer"]
+        encoder = cat_pipeline.named_steps["onehot"]
+
+        coef = model.model.coef_[0]
+        n_num = len(feature_builder.num_features)
+        n_bin = len(feature_builder.binary_features)
+
+        w_num = coef[:n_num]
+        w_bin = coef[n_num : n_num + n_bin]
+        w_cat = coef[n_num + n_bin :]
+
+        num_weights = w_num / scaler.scale_
+        intercept = model.model.intercept_[0] - np.sum(num_weights * scaler.mean_)
+
+        cat_categories, cat_weights = [], []
+        offset = 0
+        for categories in encoder.categories_:
+            categories = np.asarray(categories, dtype=str)
+            weights = w_cat[offset : offset + len(categories)]
+            order = np.argsort(categories)
+            cat_categories.append(categories[order])
+            cat_weights.append(weights[order])
+            offset += len(categories)
+
+        return cls(
+            num_cols=feature_builder.num_features,
+            num_weights=num_weights,
+            num_fill=num_imputer.statistics_,
+            bin_cols=feature_builder.binary_features,
+            bin_weights=w_bin,
+            bin_fill=bin_imputer.statistics_,
+            cat_cols=feature_builder.cat_features,
+            cat_categories=cat_categories,
+            cat_weights=cat_weights,
+            cat_fill=[str(v) for v in cat_imputer.statistics_],
+            intercept=intercept,
+        )
+
+    @staticmethod
+    def _filled(values: np.ndarray, fill: np.ndarray) -> np.ndarray:
+        return np.where(np.isnan(values), fill, values)
+
+    def decision_function(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Linear score for raw loan rows (the columns FeatureBuilder expects).
+        """
+
+        df = add_core_features(df)
+
+        X_num = df[self.num_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        X_bin = df[self.bin_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        score = self._filled(X_num, self.num_fill) @ self.num_weights
+        score += self._filled(X_bin, self.bin_fill) @ self.bin_weights
+        score += self.intercept
+
+        for col, categories, weights, fill in zip(
+            self.cat_cols, self.cat_categories, self.cat_weights, self.cat_fill
+        ):
+            values = df[col].to_numpy(dtype=object)
+            values = np.where(pd.isna(values), fill, values).astype(str)
+            idx = np.searchsorted(categories, values)
+            idx[idx == len(categories)] = 0
+            known = categories[idx] == values
+            score += np.where(known, weights[idx], 0.0)
+
+        return score
+
+    def predict_positive(self, df: pd.DataFrame) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-self.decision_function(df)))
+
+    def predict_proba(self, df: pd.DataFrame) -> np.ndarray:
+        p = self.predict_positive(df)
+        return np.column_stack([1 - p, p])
+
+    def save(self, path: Path):
+        """
+        Store as a plain .npz so loading needs neither pickle nor sklearn.
+        """
+
+        arrays = {
+            "num_cols": np.asarray(self.num_cols, dtype=str),
+            "num_weights": self.num_weights,
+            "num_fill": self.num_fill,
+            "bin_cols": np.asarray(self.bin_cols, dtype=str),
+            "bin_weights": self.bin_weights,
+            "bin_fill": self.bin_fill,
+            "cat_cols": np.asarray(self.cat_cols, dtype=str),
+            "cat_fill": np.asarray(self.cat_fill, dtype=str),
+            "intercept": np.asarray(self.intercept),
+        }
+        for i, (categories, weights) in enumerate(
+            zip(self.cat_categories, self.cat_weights)
+        ):
+            arrays[f"cat_categories_{i}"] = categories
+            arrays[f"cat_weights_{i}"] = weights
+
+        np.savez(path, **arrays)
+        logger.info(f"Fused linear scorer saved to {path}")
+
+    @classmethod
+    def load(cls, path: Path) -> "FusedLinearScorer":
+        with np.load(path, allow_pickle=False) as data:
+            n_cat = len(data["cat_cols"])
+            return cls(
+                num_cols=data["num_cols"].tolist(),
+                num_weights=data["num_weights"],
+                num_fill=data["num_fill"],
+                bin_cols=data["bin_cols"].tolist(),
+                bin_weights=data["bin_weights"],
+                bin_fill=data["bin_fill"],
+                cat_cols=data["cat_cols"].tolist(),
+                cat_categories=[data[f"cat_categories_{i}"] for i in range(n_cat)],
+                cat_weights=[data[f"cat_weights_{i}"] for i in range(n_cat)],
+                cat_fill=data["cat_fill"].tolist(),
+                intercept=float(data["intercept"]),
+            )
+
+
+def serving_model(model, n_threads: int = None):
+    """
+    Fast predictor for `model` if one exists, otherwise the model itself.
+    """
+
+    if isinstance(model, XGBoostModel):
+        logger.info("Serving XGBoost through in-place booster prediction")
+        return BoosterPredictor.from_model(model, n_threads=n_threads).warm_up()
+    return model
+
+
+def serving_scorer(model, feature_builder):
+    """
+    Fused raw-row scorer for `model` if it is linear, otherwise None.
+    """
+
+    if isinstance(model, LogisticSGDModel):
+        logger.info("Serving logistic model through the fused linear scorer")
+        return FusedLinearScorer.from_artifacts(model, feature_builder)
+    return None
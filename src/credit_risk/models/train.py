@@ -3,13 +3,13 @@ from credit_risk.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-def train_model(model, X_train, y_train, X_val=None, y_val=None):
+def train_model(model, X_train, y_train, X_val=None, y_val=None, **train_kwargs):
     logger.info("Starting model training")
 
     if X_val is not None and y_val is not None:
-        model.train(X_train, y_train, eval_set=[(X_val, y_val)])
+        model.train(X_train, y_train, eval_set=[(X_val, y_val)], **train_kwargs)
     else:
-        model.train(X_train, y_train)
+        model.train(X_train, y_train, **train_kwargs)
 
     logger.info("Training completed")
     return model
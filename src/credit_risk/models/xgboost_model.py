@@ -1,19 +1,254 @@
+import copy
+import re
+import tempfile
+import time
+from pathlib import Path
+
 import xgboost as xgb
 from credit_risk.models.base import BaseModel
 from credit_risk.utils.config import xgb_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.threads import resolve_n_jobs
+
+logger = get_logger(__name__)
+
+
+class ShardDataIter(xgb.DataIter):
+    """
+    Feeds (X, y) shards to XGBoost one at a time. `load_shard(i)` is called
+    for i in range(n_shards) on every pass XGBoost makes over the data.
+    """
+
+    def __init__(self, load_shard, n_shards: int, cache_prefix: str):
+        self.load_shard = load_shard
+        self.n_shards = n_shards
+        self._index = 0
+        super().__init__(cache_prefix=cache_prefix)
+
+    def next(self, input_data) -> bool:
+        if self._index == self.n_shards:
+            return False
+        X, y = self.load_shard(self._index)
+        input_data(data=X, label=y)
+        self._index += 1
+        return True
+
+    def reset(self):
+        self._index = 0
+
+
+def booster_params(params: dict) -> dict:
+    """
+    Translate sklearn-wrapper params into native xgb.train params.
+    """
+
+    params = dict(params)
+    params.pop("n_estimators", None)
+    if "random_state" in params:
+        params["seed"] = params.pop("random_state")
+    if "n_jobs" in params:
+        n_jobs = params.pop("n_jobs")
+        params["nthread"] = resolve_n_jobs(n_jobs)
+    return params
+
+
+def latest_checkpoint(checkpoint_dir) -> Path:
+    """
+    Most recent TrainingCheckPoint file in `checkpoint_dir`, or None.
+    """
+
+    if checkpoint_dir is None or not Path(checkpoint_dir).exists():
+        return None
+
+    checkpoints = [
+        (int(match.group(1)), path)
+        for path in Path(checkpoint_dir).glob("checkpoint_*.ubj")
+        if (match := re.fullmatch(r"checkpoint_(\d+)\.ubj", path.name))
+    ]
+    return max(checkpoints)[1] if checkpoints else None
 
 
 class XGBoostModel(BaseModel):
     def __init__(self):
-        self.model = xgb.XGBClassifier(**xgb_config.PARAMS)
-
-    def train(self, X, y, eval_set=None):
-        self.model.fit(
-            X,
-            y,
-            eval_set=eval_set,
-            verbose=False,
+        # n_jobs=-1 means "this process's thread budget", not every core
+        params = {**xgb_config.PARAMS}
+        params["n_jobs"] = resolve_n_jobs(params["n_jobs"])
+        self.model = xgb.XGBClassifier(**params)
+        self.training_summary = None
+
+    def __getstate__(self):
+        # Pickle the configured n_jobs, not the thread count resolved in the
+        # training process; loading resolves it against the loader's budget
+        state = dict(self.__dict__)
+        state["model"] = copy.copy(self.model)
+        state["model"].n_jobs = xgb_config.PARAMS["n_jobs"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.model.set_params(n_jobs=resolve_n_jobs(self.model.n_jobs))
+
+    def train(self, X, y, eval_set=None, checkpoint_dir=None, resume=False):
+        """
+        Fit the booster.
+
+        With an `eval_set`, training stops once validation AUC has not
+        improved for EARLY_STOPPING_ROUNDS rounds and only the trees up to
+        the best iteration are kept. With a `checkpoint_dir`, the booster is
+        saved every CHECKPOINT_INTERVAL rounds; `resume=True` continues from
+        the latest checkpoint there.
+        """
+
+        max_rounds = xgb_config.PARAMS["n_estimators"]
+
+        callbacks = []
+        if eval_set:
+            callbacks.append(
+                xgb.callback.EarlyStopping(
+                    rounds=xgb_config.EARLY_STOPPING_ROUNDS,
+                    metric_name="auc",
+                    data_name=f"validation_{len(eval_set) - 1}",
+                    maximize=True,
+                    save_best=True,
+                )
+            )
+        if checkpoint_dir is not None:
+            Path(checkpoint_dir).mkdir(parents=True, exist_ok=True)
+            callbacks.append(
+                xgb.callback.TrainingCheckPoint(
+                    directory=str(checkpoint_dir),
+                    name="checkpoint",
+                    interval=xgb_config.CHECKPOINT_INTERVAL,
+                )
+            )
+
+        init_booster = None
+        resumed_rounds = 0
+        checkpoint = latest_checkpoint(checkpoint_dir) if resume else None
+        if checkpoint is not None:
+            init_booster = xgb.Booster(model_file=str(checkpoint))
+            resumed_rounds = init_booster.num_boosted_rounds()
+            logger.info(f"Resuming from {checkpoint} ({resumed_rounds} rounds)")
+
+        self.model.set_params(
+            n_estimators=max(max_rounds - resumed_rounds, 1),
+            callbacks=callbacks or None,
+        )
+
+        start = time.perf_counter()
+        try:
+            self.model.fit(
+                X,
+                y,
+                eval_set=eval_set,
+                verbose=False,
+                xgb_model=init_booster,
+            )
+        finally:
+            # Callbacks hold file paths / state and should not be pickled
+            self.model.set_params(n_estimators=max_rounds, callbacks=None)
+        train_seconds = time.perf_counter() - start
+
+        booster = self.model.get_booster()
+        trees_kept = booster.num_boosted_rounds()
+        best_iteration = None
+        if eval_set:
+            best_iteration = getattr(self.model, "best_iteration", None)
+
+        self.training_summary = {
+            "max_rounds": max_rounds,
+            "resumed_from_round": resumed_rounds,
+            "best_iteration": best_iteration,
+            "trees_kept": trees_kept,
+            "trees_saved": max_rounds - trees_kept,
+            "train_seconds": train_seconds,
+        }
+        logger.info(
+            f"XGBoost kept {trees_kept}/{max_rounds} trees "
+            f"(best iteration {best_iteration}) in {train_seconds:.1f}s"
+        )
+        return self
+
+    def continue_training(self, X, y, n_rounds: int, eval_set=None):
+        """
+        Add `n_rounds` trees fitted on (X, y) on top of the current booster.
+        """
+
+        max_rounds = xgb_config.PARAMS["n_estimators"]
+        base_rounds = self.model.get_booster().num_boosted_rounds()
+
+        self.model.set_params(n_estimators=n_rounds)
+        try:
+            self.model.fit(
+                X,
+                y,
+                eval_set=eval_set,
+                verbose=False,
+                xgb_model=self.model.get_booster(),
+            )
+        finally:
+            self.model.set_params(n_estimators=max_rounds)
+
+        # Early stopping state of the base fit would cap predictions (and
+        # BoosterPredictor) at the old best iteration, hiding the new trees
+        self.model.get_booster().set_attr(best_iteration=None, best_score=None)
+
+        logger.info(
+            f"Continued boosting: {base_rounds} → "
+            f"{self.model.get_booster().num_boosted_rounds()} trees"
+        )
+        return self
+
+    def train_external_memory(
+        self,
+        load_shard,
+        n_shards: int,
+        eval_shards=None,
+        cache_dir=None,
+    ):
+        """
+        Train from shards without materializing the full matrix.
+
+        Shards are quantized into an external-memory QuantileDMatrix whose
+        pages live under `cache_dir` (a temporary directory by default).
+        `eval_shards` is an optional (load_shard, n_shards) pair for the
+        validation window. The trained booster is loaded back into the
+        sklearn wrapper so predict / predict_proba behave as after `train`.
+        """
+
+        params = xgb_config.PARAMS
+        with tempfile.TemporaryDirectory(dir=cache_dir) as tmp_dir:
+            tmp_dir = Path(tmp_dir)
+
+            dtrain = xgb.ExtMemQuantileDMatrix(
+                ShardDataIter(load_shard, n_shards, str(tmp_dir / "train")),
+                max_bin=xgb_config.MAX_BIN,
+            )
+            evals = [(dtrain, "train")]
+            if eval_shards is not None:
+                dval = xgb.ExtMemQuantileDMatrix(
+                    ShardDataIter(*eval_shards, str(tmp_dir / "val")),
+                    max_bin=xgb_config.MAX_BIN,
+                    ref=dtrain,
+                )
+                evals.append((dval, "validation"))
+
+            logger.info(
+                f"External-memory training: {dtrain.num_row():,} rows, "
+                f"{dtrain.num_col()} features, cache in {tmp_dir}"
+            )
+            booster = xgb.train(
+                booster_params(params),
+                dtrain,
+                num_boost_round=params["n_estimators"],
+                evals=evals,
+                verbose_eval=False,
+            )
+
+        self.model = xgb.XGBClassifier(
+            **{**params, "n_jobs": resolve_n_jobs(params["n_jobs"])}
         )
+        self.model.load_model(bytearray(booster.save_raw("json")))
         return self
 
     def predict(self, X):
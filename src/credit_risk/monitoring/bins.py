@@ -0,0 +1,117 @@
+"""
+Histogram bins for the FeatureBuilder inputs, shared by live monitoring
+and drift detection.
+"""
+
+from itertools import chain
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from credit_risk.data.split_data import parse_issue_date
+from credit_risk.features.build_features import add_core_features
+from credit_risk.utils.config import monitoring_config
+
+OTHER = "__other__"
+MISSING = "__missing__"
+
+# Raw columns add_core_features derives features from
+CORE_INPUTS = ("issue_d", "earliest_cr_line", "fico_range_low", "fico_range_high")
+
+
+class FeatureBins:
+    """
+    Bin edges (numeric) and categories (categorical) per monitored feature.
+
+    Numeric features get one bin per interval between `edges` plus a bin
+    for missing values; categorical features one bin per category plus
+    one for unseen or missing values.
+    """
+
+    def __init__(self, numeric: Dict[str, np.ndarray], categorical: Dict[str, list]):
+        self.numeric = {
+            name: np.asarray(edges, dtype=np.float64)
+            for name, edges in numeric.items()
+        }
+        self.categorical = {name: list(c) for name, c in categorical.items()}
+
+    @classmethod
+    def from_feature_builder(
+        cls, feature_builder, n_bins: int = monitoring_config.N_FEATURE_BINS
+    ) -> "FeatureBins":
+        """
+        Equal-width bins over mean +/- 4 std of the fitted scaler for
+        numeric inputs and the one-hot categories for categorical ones.
+        """
+
+        transformers = feature_builder.preprocessor.named_transformers_
+        scaler = transformers["num"].named_steps["scaler"]
+        numeric = {
+            name: np.linspace(mean - 4 * std, mean + 4 * std, n_bins + 1)
+            for name, mean, std in zip(
+                feature_builder.num_features, scaler.mean_, scaler.scale_
+            )
+        }
+        # 0 / 1 / 2+ for flags and small counts
+        numeric.update({name: [0.5, 1.5] for name in feature_builder.binary_features})
+
+        onehot = transformers["cat"].named_steps["onehot"]
+        categorical = dict(zip(feature_builder.cat_features, onehot.categories_))
+        return cls(numeric, categorical)
+
+    def labels(self, name: str) -> List[str]:
+        if name in self.categorical:
+            return [str(c) for c in self.categorical[name]] + [OTHER]
+
+        bounds = np.r_[-np.inf, self.numeric[name], np.inf]
+        intervals = [f"[{lo:.4g}, {hi:.4g})" for lo, hi in zip(bounds[:-1], bounds[1:])]
+        return intervals + [MISSING]
+
+    def empty(self) -> Dict[str, np.ndarray]:
+        return {
+            name: np.zeros(len(self.labels(name)), dtype=np.int64)
+            for name in chain(self.numeric, self.categorical)
+        }
+
+    def count(self, frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Histogram of every monitored feature present in `frame`.
+        """
+
+        counts = {}
+        for name, edges in self.numeric.items():
+            if name not in frame:
+                continue
+            values = pd.to_numeric(frame[name], errors="coerce").to_numpy(np.float64)
+            bins = np.searchsorted(edges, values, side="right")
+            bins[np.isnan(values)] = len(edges) + 1
+            counts[name] = np.bincount(bins, minlength=len(edges) + 2)
+
+        for name, categories in self.categorical.items():
+            if name not in frame:
+                continue
+            codes = pd.Categorical(frame[name], categories=categories).codes
+            codes = np.where(codes < 0, len(categories), codes)
+            counts[name] = np.bincount(codes, minlength=len(categories) + 1)
+
+        return counts
+
+
+def input_frame(data) -> pd.DataFrame:
+    """
+    FeatureBuilder inputs, including the derived ones (fico_avg, issue
+    year / month, ...), of raw loan rows (a DataFrame or a list of dicts).
+    Frames without the raw date / FICO columns are returned as they are.
+    """
+
+    frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+    if not all(column in frame for column in CORE_INPUTS):
+        return frame
+
+    # Loan dates are 'Mon-YYYY'; an explicit format avoids per-row parsing
+    frame = frame.assign(
+        issue_d=parse_issue_date(frame["issue_d"]),
+        earliest_cr_line=parse_issue_date(frame["earliest_cr_line"]),
+    )
+    return add_core_features(frame)
@@ -0,0 +1,243 @@
+"""
+Drift of the score (PSI) and of every FeatureBuilder input (CSI) against
+the training baseline.
+
+Training stores quantile bin edges and bin shares for each feature and
+for the validation scores (drift_baseline.json). Production data is
+reduced to counts in the same bins by a `DriftAccumulator`, which can be
+updated batch by batch (live predictions, streamed Parquet) and merged
+across shards, so no raw rows are kept and memory does not grow with
+the number of rows.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+
+from credit_risk.monitoring.bins import CORE_INPUTS, FeatureBins, input_frame
+from credit_risk.utils.config import drift_config
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SCORE = "score"
+STATUSES = ("stable", "warning", "alert")
+
+
+def _quantile_edges(values, n_bins: int) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return np.array([])
+    return np.unique(np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1]))
+
+
+def _score_counts(edges, scores) -> np.ndarray:
+    bins = np.searchsorted(edges, np.asarray(scores, dtype=np.float64), side="right")
+    return np.bincount(bins, minlength=len(edges) + 1)
+
+
+def population_stability(expected, actual, eps: float = drift_config.EPS) -> float:
+    """
+    PSI = sum((a - e) * ln(a / e)) over bin shares, shares floored at `eps`.
+    """
+
+    expected = np.maximum(np.asarray(expected, dtype=np.float64), 0)
+    actual = np.maximum(np.asarray(actual, dtype=np.float64), 0)
+    e = np.maximum(expected / expected.sum(), eps)
+    a = np.maximum(actual / actual.sum(), eps)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+class DriftBaseline:
+    def __init__(
+        self,
+        bins: FeatureBins,
+        expected: Dict[str, np.ndarray],
+        score_edges,
+        score_expected,
+        model_digest: Optional[str] = None,
+    ):
+        self.bins = bins
+        self.expected = {name: np.asarray(c) for name, c in expected.items()}
+        self.score_edges = np.asarray(score_edges, dtype=np.float64)
+        self.score_expected = np.asarray(score_expected)
+        self.model_digest = model_digest
+
+    @classmethod
+    def build(
+        cls,
+        df: pd.DataFrame,
+        scores,
+        feature_builder,
+        n_bins: int = drift_config.N_BINS,
+    ) -> "DriftBaseline":
+        """
+        Baseline from the training rows `df` (raw loan columns) and the
+        served (calibrated) scores of a reference window.
+        """
+
+        frame = input_frame(df)
+        numeric = {
+            name: _quantile_edges(frame[name], n_bins)
+            for name in feature_builder.num_features
+        }
+        # 0 / 1 / 2+ for flags and small counts
+        numeric.update({name: [0.5, 1.5] for name in feature_builder.binary_features})
+
+        onehot = feature_builder.preprocessor.named_transformers_["cat"]
+        categories = onehot.named_steps["onehot"].categories_
+        categorical = dict(zip(feature_builder.cat_features, categories))
+
+        bins = FeatureBins(numeric, categorical)
+        score_edges = _quantile_edges(scores, n_bins)
+        score_expected = _score_counts(score_edges, scores)
+        return cls(bins, bins.count(frame), score_edges, score_expected)
+
+    def score_counts(self, scores) -> np.ndarray:
+        return _score_counts(self.score_edges, scores)
+
+    def save(self, path: Path):
+        bins = self.bins
+        table = {
+            "model_digest": self.model_digest,
+            "numeric_edges": {n: e.tolist() for n, e in bins.numeric.items()},
+            "categories": {n: [str(c) for c in v] for n, v in bins.categorical.items()},
+            "expected": {n: c.tolist() for n, c in self.expected.items()},
+            "score_edges": self.score_edges.tolist(),
+            "score_expected": self.score_expected.tolist(),
+        }
+        with open(path, "w") as f:
+            json.dump(table, f)
+        logger.info(f"Drift baseline ({len(self.expected)} features) saved to {path}")
+
+    @classmethod
+    def load(cls, path: Path) -> "DriftBaseline":
+        with open(path) as f:
+            table = json.load(f)
+        bins = FeatureBins(table["numeric_edges"], table["categories"])
+        return cls(
+            bins,
+            table["expected"],
+            table["score_edges"],
+            table["score_expected"],
+            table.get("model_digest"),
+        )
+
+
+class DriftAccumulator:
+    """
+    Production counts in the baseline bins. `update` with batches, `merge`
+    accumulators from parallel shards, then `report`.
+    """
+
+    def __init__(self, baseline: DriftBaseline):
+        self.baseline = baseline
+        self.features = baseline.bins.empty()
+        self.scores = np.zeros(len(baseline.score_expected), dtype=np.int64)
+
+    def add_counts(self, feature_counts: Dict[str, np.ndarray]):
+        for name, counts in feature_counts.items():
+            self.features[name] += counts
+
+    def add_scores(self, scores):
+        self.scores += self.baseline.score_counts(scores)
+
+    def update(self, df: pd.DataFrame, scores=None) -> "DriftAccumulator":
+        """
+        Count a batch of raw loan rows and, if given, their scores.
+        """
+        self.add_counts(self.baseline.bins.count(input_frame(df)))
+        if scores is not None:
+            self.add_scores(scores)
+        return self
+
+    def merge(self, other: "DriftAccumulator") -> "DriftAccumulator":
+        self.add_counts(other.features)
+        self.scores += other.scores
+        return self
+
+    def report(
+        self,
+        warning: float = drift_config.PSI_WARNING,
+        alert: float = drift_config.PSI_ALERT,
+    ) -> pd.DataFrame:
+        """
+        One row per monitored series with observations: the score (PSI)
+        and every feature (CSI), worst first.
+        """
+
+        series = [(SCORE, "PSI", self.baseline.score_expected, self.scores)]
+        series += [
+            (name, "CSI", self.baseline.expected[name], counts)
+            for name, counts in self.features.items()
+        ]
+
+        rows = [
+            {
+                "feature": name,
+                "index": index,
+                "value": population_stability(expected, actual),
+                "n": int(actual.sum()),
+            }
+            for name, index, expected, actual in series
+            if actual.sum() and expected.sum()
+        ]
+        report = pd.DataFrame(rows, columns=["feature", "index", "value", "n"])
+        report["status"] = np.array(STATUSES)[
+            np.searchsorted([warning, alert], report["value"], side="right")
+        ]
+        return report.sort_values("value", ascending=False).reset_index(drop=True)
+
+
+def drift_from_parquet(
+    path: Path,
+    baseline: DriftBaseline,
+    score_col: Optional[str] = "default_probability",
+    score_fn=None,
+    batch_rows: int = drift_config.BATCH_ROWS,
+) -> DriftAccumulator:
+    """
+    Stream a Parquet file / dataset in batches of `batch_rows` into a
+    DriftAccumulator. Scores come from `score_col` when the data has it
+    (e.g. scripts/score.py output), otherwise from `score_fn(batch)` if
+    given. Only the monitored columns are read.
+    """
+
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    available = set(dataset.schema.names)
+    wanted = set(baseline.bins.numeric) | set(baseline.bins.categorical)
+    wanted |= set(CORE_INPUTS)
+    has_scores = score_col is not None and score_col in available
+    if has_scores:
+        wanted.add(score_col)
+    columns = sorted(wanted & available)
+
+    accumulator = DriftAccumulator(baseline)
+    n_rows = 0
+    # No readahead / pre-buffering: memory is bounded by one row group and
+    # a batch, whatever the number of rows
+    batches = dataset.to_batches(
+        columns=columns,
+        batch_size=batch_rows,
+        batch_readahead=1,
+        fragment_readahead=1,
+        fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=False),
+    )
+    for batch in batches:
+        df = batch.to_pandas()
+        if has_scores:
+            scores = df.pop(score_col).to_numpy()
+        elif score_fn is not None:
+            scores = score_fn(df)
+        else:
+            scores = None
+        accumulator.update(df, scores)
+        n_rows += len(df)
+
+    logger.info(f"Drift counts from {n_rows:,} rows of {path}")
+    return accumulator
@@ -0,0 +1,270 @@
+"""
+In-process monitoring of live predictions.
+
+The request path only appends (timestamp, probabilities, decision
+buckets, raw rows) to a deque: appends are atomic without a lock and
+cost well under a microsecond. A background thread, and every snapshot,
+drains the deque and bins the records into rolling time windows of
+score histograms, decision counts and histograms of the FeatureBuilder
+inputs. Closed windows are periodically flushed to a local Parquet
+dataset.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from credit_risk.models.decision import RECOMMENDATIONS
+from credit_risk.monitoring.bins import FeatureBins, input_frame
+from credit_risk.monitoring.drift import DriftAccumulator, DriftBaseline
+from credit_risk.utils.config import monitoring_config
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class WindowCounts:
+    """
+    Counts for one time window (or the whole run).
+    """
+
+    def __init__(self, start: float, feature_bins: FeatureBins, n_score_bins: int):
+        self.start = start
+        self.n = 0
+        self.score_sum = 0.0
+        self.scores = np.zeros(n_score_bins, dtype=np.int64)
+        self.decisions = np.zeros(len(RECOMMENDATIONS), dtype=np.int64)
+        self.features = feature_bins.empty()
+
+    def add(self, probs, buckets, feature_counts: Dict[str, np.ndarray]):
+        n_bins = len(self.scores)
+        bins = np.clip((probs * n_bins).astype(np.int64), 0, n_bins - 1)
+        self.n += len(probs)
+        self.score_sum += float(probs.sum())
+        self.scores += np.bincount(bins, minlength=n_bins)
+        self.decisions += np.bincount(buckets, minlength=len(self.decisions))
+        for name, counts in feature_counts.items():
+            self.features[name] += counts
+
+    def summary(self) -> dict:
+        return {
+            "n": self.n,
+            "mean_score": self.score_sum / self.n if self.n else None,
+            "score_counts": self.scores.tolist(),
+            "decisions": dict(zip(RECOMMENDATIONS.tolist(), self.decisions.tolist())),
+        }
+
+
+class PredictionMonitor:
+    def __init__(
+        self,
+        feature_bins: FeatureBins,
+        model_name: str = "",
+        output_dir: Optional[Path] = None,
+        window_seconds: int = monitoring_config.WINDOW_SECONDS,
+        n_windows: int = monitoring_config.N_WINDOWS,
+        n_score_bins: int = monitoring_config.N_SCORE_BINS,
+        drift_baseline: Optional[DriftBaseline] = None,
+    ):
+        self.feature_bins = feature_bins
+        self.model_name = model_name
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.window_seconds = window_seconds
+        self.n_windows = n_windows
+        self.n_score_bins = n_score_bins
+
+        self.started_at = time.time()
+        self._pending = deque()
+        self._lock = threading.Lock()  # taken by folds / reads, never by record
+        self._windows: "OrderedDict[float, WindowCounts]" = OrderedDict()
+        self._total = self._new_counts(self.started_at)
+        self._flushed_until = 0.0
+        # Needs feature_bins to be the baseline's bins
+        self._drift = DriftAccumulator(drift_baseline) if drift_baseline else None
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _new_counts(self, start: float) -> WindowCounts:
+        return WindowCounts(start, self.feature_bins, self.n_score_bins)
+
+    # ------------------------------------------------------------------
+    # Request path
+    # ------------------------------------------------------------------
+    def record(self, probs: np.ndarray, buckets: np.ndarray, rows: list):
+        """
+        Queue one request's predictions; `rows` are the raw input dicts.
+        """
+        # Copied: serving predictors return views into buffers that the
+        # thread's next request overwrites before the fold runs
+        self._pending.append((time.time(), np.array(probs, copy=True), buckets, rows))
+
+    # ------------------------------------------------------------------
+    # Background / read path
+    # ------------------------------------------------------------------
+    def fold(self) -> int:
+        """
+        Bin every queued record into its window. Returns the record count.
+        """
+
+        records = []
+        pending = self._pending
+        while pending:
+            records.append(pending.popleft())
+        if not records:
+            return 0
+
+        by_window: Dict[float, list] = {}
+        for record in records:
+            start = record[0] - record[0] % self.window_seconds
+            by_window.setdefault(start, []).append(record)
+
+        with self._lock:
+            for start, group in sorted(by_window.items()):
+                probs = np.concatenate([r[1] for r in group]).astype(np.float64)
+                buckets = np.concatenate([r[2] for r in group]).astype(np.int64)
+                rows = list(chain.from_iterable(r[3] for r in group))
+                feature_counts = self.feature_bins.count(input_frame(rows))
+
+                window = self._windows.get(start)
+                if window is None:
+                    window = self._windows[start] = self._new_counts(start)
+                window.add(probs, buckets, feature_counts)
+                self._total.add(probs, buckets, feature_counts)
+                if self._drift is not None:
+                    self._drift.add_counts(feature_counts)
+                    self._drift.add_scores(probs)
+
+            while len(self._windows) > self.n_windows:
+                self._windows.popitem(last=False)
+
+        return len(records)
+
+    def snapshot(self) -> dict:
+        """
+        Current totals and rolling windows, including queued records.
+        """
+
+        self.fold()
+        with self._lock:
+            total = self._total
+            return {
+                "model": self.model_name,
+                "started_at": _iso(self.started_at),
+                **total.summary(),
+                "score_bin_edges": np.linspace(0, 1, self.n_score_bins + 1).tolist(),
+                "features": {
+                    name: dict(zip(self.feature_bins.labels(name), counts.tolist()))
+                    for name, counts in total.features.items()
+                },
+                "windows": [
+                    {"start": _iso(start), **window.summary()}
+                    for start, window in self._windows.items()
+                ],
+            }
+
+    def drift_report(self, **thresholds) -> Optional[pd.DataFrame]:
+        """
+        PSI / CSI of everything seen since startup against the training
+        baseline, or None without a baseline.
+        """
+
+        if self._drift is None:
+            return None
+        self.fold()
+        with self._lock:
+            return self._drift.report(**thresholds)
+
+    def _window_rows(self, window: WindowCounts) -> list:
+        rows = [
+            ("score", f"{i / self.n_score_bins:.3f}", int(c))
+            for i, c in enumerate(window.scores)
+        ]
+        rows += [
+            ("decision", label, int(c))
+            for label, c in zip(RECOMMENDATIONS.tolist(), window.decisions)
+        ]
+        for name, counts in window.features.items():
+            labels = self.feature_bins.labels(name)
+            rows += [(name, label, int(c)) for label, c in zip(labels, counts) if c]
+        return rows
+
+    def flush(self, now: Optional[float] = None) -> Optional[Path]:
+        """
+        Write windows closed since the last flush to
+        `output_dir/windows-<first>-<last>.parquet`.
+        """
+
+        if self.output_dir is None:
+            return None
+
+        now = time.time() if now is None else now
+        self.fold()
+        with self._lock:
+            closed = [
+                w
+                for start, w in self._windows.items()
+                if start >= self._flushed_until and start + self.window_seconds <= now
+            ]
+            if not closed:
+                return None
+            self._flushed_until = closed[-1].start + self.window_seconds
+
+            frames = [
+                pd.DataFrame(
+                    self._window_rows(w), columns=["metric", "bin", "count"]
+                ).assign(window_start=pd.Timestamp(w.start, unit="s", tz="UTC"))
+                for w in closed
+            ]
+
+        table = pd.concat(frames, ignore_index=True).assign(model=self.model_name)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / (
+            f"windows-{int(closed[0].start)}-{int(closed[-1].start)}.parquet"
+        )
+        table.to_parquet(path, index=False)
+        logger.info(f"Flushed {len(closed)} monitoring windows to {path}")
+        return path
+
+    def _run(self, fold_seconds: float, flush_seconds: float):
+        last_flush = time.monotonic()
+        while not self._stop.wait(fold_seconds):
+            try:
+                self.fold()
+                if time.monotonic() - last_flush >= flush_seconds:
+                    self.flush()
+                    last_flush = time.monotonic()
+            except Exception:
+                logger.exception("Monitoring fold / flush failed")
+
+    def start(
+        self,
+        fold_seconds: float = monitoring_config.FOLD_SECONDS,
+        flush_seconds: float = monitoring_config.FLUSH_SECONDS,
+    ) -> "PredictionMonitor":
+        self._thread = threading.Thread(
+            target=self._run, args=(fold_seconds, flush_seconds), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop the background thread and flush every window, open or not.
+        """
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush(now=float("inf"))
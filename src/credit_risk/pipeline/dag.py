@@ -0,0 +1,237 @@
+"""
+Content-addressed pipeline runner.
+
+Every stage is fingerprinted from its own code, its config and the
+fingerprints of its inputs. A stage whose fingerprint already has a
+cached output is skipped, and cached outputs are only loaded when a
+downstream stage actually has to run. Independent stages execute
+concurrently.
+"""
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+import time
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import joblib
+
+from credit_risk.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    A pipeline step. `func` receives the outputs of `deps` as keyword
+    arguments (keyed by stage name) and returns the stage output.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    configs: Tuple[Any, ...] = ()
+    code: Tuple[ModuleType, ...] = ()
+    files: Tuple[Path, ...] = ()
+    cache: bool = True
+
+
+@dataclass
+class StageRun:
+    name: str
+    fingerprint: str
+    status: str  # "cached", "ran" or "skipped"
+    seconds: float = 0.0
+
+
+def _hash_file_contents(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _file_signature(path: Path) -> dict:
+    """
+    Cheap identity of a (possibly very large) input file.
+    """
+
+    path = Path(path)
+    if not path.exists():
+        return {"path": str(path), "missing": True}
+    stat = path.stat()
+    return {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _config_payload(config: Any) -> Any:
+    if dataclasses.is_dataclass(config):
+        return {
+            "type": type(config).__name__,
+            "fields": dataclasses.asdict(config),
+        }
+    return config
+
+
+def code_version(stage: Stage) -> str:
+    """
+    Hash of the stage function source plus the source files it relies on.
+    """
+
+    digest = hashlib.sha256(inspect.getsource(stage.func).encode())
+    for module in stage.code:
+        digest.update(_hash_file_contents(Path(inspect.getfile(module))).encode())
+    return digest.hexdigest()
+
+
+class Pipeline:
+    def __init__(self, stages: Iterable[Stage], cache_dir: Path, profiler=None):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage '{stage.name}'")
+            missing = [d for d in stage.deps if d not in self.stages]
+            if missing:
+                raise ValueError(
+                    f"Stage '{stage.name}' depends on undefined stages {missing} "
+                    "(stages must be declared after their dependencies)"
+                )
+            self.stages[stage.name] = stage
+
+        self.cache_dir = Path(cache_dir)
+        self.profiler = profiler
+        self._outputs: Dict[str, Any] = {}
+        self._fingerprints: Dict[str, str] = {}
+
+    # -------------------------------------------------
+    # Fingerprints and cache
+    # -------------------------------------------------
+    def fingerprint(self, name: str) -> str:
+        if name in self._fingerprints:
+            return self._fingerprints[name]
+
+        stage = self.stages[name]
+        payload = {
+            "stage": name,
+            "code": code_version(stage),
+            "configs": [_config_payload(c) for c in stage.configs],
+            "files": [_file_signature(p) for p in stage.files],
+            "inputs": {dep: self.fingerprint(dep) for dep in stage.deps},
+        }
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+
+        self._fingerprints[name] = digest
+        return digest
+
+    def _cache_path(self, name: str) -> Path:
+        return self.cache_dir / name / f"{self.fingerprint(name)}.joblib"
+
+    def is_cached(self, name: str) -> bool:
+        return self.stages[name].cache and self._cache_path(name).exists()
+
+    def output(self, name: str) -> Any:
+        """
+        Output of a stage, loaded from the cache on first access.
+        """
+
+        if name not in self._outputs:
+            path = self._cache_path(name)
+            if not path.exists():
+                raise KeyError(f"No output available for stage '{name}'")
+            self._outputs[name] = joblib.load(path)
+        return self._outputs[name]
+
+    def _store(self, name: str, output: Any):
+        self._outputs[name] = output
+        if not self.stages[name].cache:
+            return
+
+        path = self._cache_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+        joblib.dump(output, tmp_path)
+        os.replace(tmp_path, path)
+
+    # -------------------------------------------------
+    # Execution
+    # -------------------------------------------------
+    def _required(self, targets: List[str]) -> List[str]:
+        """
+        Stages that must execute to produce `targets`, in declaration order.
+        Traversal stops at stages with a cached output.
+        """
+
+        required = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in required or self.is_cached(name):
+                continue
+            required.add(name)
+            stack.extend(self.stages[name].deps)
+
+        return [name for name in self.stages if name in required]
+
+    def _execute(self, name: str) -> float:
+        stage = self.stages[name]
+        inputs = {dep: self.output(dep) for dep in stage.deps}
+
+        logger.info(f"Running stage '{name}' ({self.fingerprint(name)})")
+        profiled = self.profiler.stage(name) if self.profiler else nullcontext()
+        start = time.perf_counter()
+        with profiled:
+            output = stage.func(**inputs)
+        self._store(name, output)
+        return time.perf_counter() - start
+
+    def run(
+        self, targets: Optional[List[str]] = None, max_workers: int = 2
+    ) -> List[StageRun]:
+        if targets is None:
+            # Default to the sinks: stages no other stage depends on
+            upstream = {d for stage in self.stages.values() for d in stage.deps}
+            targets = [name for name in self.stages if name not in upstream]
+
+        to_run = self._required(targets)
+
+        runs = {
+            name: StageRun(
+                name=name,
+                fingerprint=self.fingerprint(name),
+                status="cached" if self.is_cached(name) else "skipped",
+            )
+            for name in self.stages
+        }
+
+        if not to_run:
+            logger.info("All requested stages are up to date")
+            return list(runs.values())
+
+        logger.info(f"Stages to run: {to_run}")
+        pending = set(to_run)
+        finished = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            running = {}
+            while pending or running:
+                for name in [n for n in to_run if n in pending]:
+                    deps = self.stages[name].deps
+                    if all(d in finished or d not in to_run for d in deps):
+                        running[pool.submit(self._execute, name)] = name
+                        pending.discard(name)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    runs[name].seconds = future.result()
+                    runs[name].status = "ran"
+                    finished.add(name)
+                    logger.info(f"Stage '{name}' done in {runs[name].seconds:.1f}s")
+
+        return list(runs.values())
@@ -0,0 +1,158 @@
+"""
+Stage definitions for the end-to-end training pipeline:
+
+load_raw → clean → split → features → train_logistic / train_xgboost → evaluate
+"""
+
+import time
+
+from credit_risk.data import clean_data, load_data, split_data
+from credit_risk.data.clean_data import DataCleaner
+from credit_risk.data.load_data import load_raw_data
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.evaluation import metrics as metrics_module
+from credit_risk.evaluation.metrics import evaluate_classification
+from credit_risk.features import build_features
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models import logistic_model, xgboost_model
+from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.models.xgboost_model import XGBoostModel
+from credit_risk.pipeline.dag import Pipeline, Stage
+from credit_risk.utils.config import (
+    data_config,
+    model_config,
+    split_config,
+    xgb_config,
+)
+from credit_risk.utils.paths import cache_dir, raw_dir
+
+PIPELINE_CACHE_DIR = cache_dir / "pipeline"
+
+MODEL_STAGES = {
+    "Logistic_SGD": "train_logistic",
+    "XGBoost": "train_xgboost",
+}
+
+
+def load_raw_stage():
+    return load_raw_data()
+
+
+def clean_stage(load_raw):
+    return DataCleaner().clean(load_raw)
+
+
+def split_stage(clean):
+    train_df, val_df, test_df = DataSplitter().split(clean)
+    return {"train": train_df, "val": val_df, "test": test_df}
+
+
+def features_stage(split):
+    feature_builder = FeatureBuilder()
+    X_train, y_train = feature_builder.build_features(split["train"], fit=True)
+    X_val, y_val = feature_builder.build_features(split["val"], fit=False)
+
+    return {
+        "feature_builder": feature_builder,
+        "X_train": X_train,
+        "y_train": y_train,
+        "X_val": X_val,
+        "y_val": y_val,
+    }
+
+
+def train_logistic_stage(features):
+    model = LogisticSGDModel()
+    start = time.perf_counter()
+    model.train(features["X_train"], features["y_train"])
+    return {"model": model, "train_seconds": time.perf_counter() - start}
+
+
+def train_xgboost_stage(features):
+    model = XGBoostModel()
+    start = time.perf_counter()
+    model.train(
+        features["X_train"],
+        features["y_train"],
+        eval_set=[(features["X_val"], features["y_val"])],
+    )
+    return {"model": model, "train_seconds": time.perf_counter() - start}
+
+
+def evaluate_stage(features, train_logistic, train_xgboost):
+    trained = {
+        "Logistic_SGD": train_logistic,
+        "XGBoost": train_xgboost,
+    }
+
+    results = {}
+    for model_name, output in trained.items():
+        y_prob = output["model"].predict_proba(features["X_val"])[:, 1]
+        metrics = evaluate_classification(
+            y_true=features["y_val"], y_prob=y_prob, threshold=0.5
+        )
+        results[model_name] = {
+            "roc_auc": metrics["roc_auc"],
+            "ks": metrics["ks"],
+            "confusion_matrix": metrics["confusion_matrix"].tolist(),
+        }
+
+    return results
+
+
+def build_training_pipeline(cache_dir=PIPELINE_CACHE_DIR, profiler=None) -> Pipeline:
+    return Pipeline(
+        [
+            Stage(
+                "load_raw",
+                load_raw_stage,
+                configs=(data_config,),
+                code=(load_data,),
+                files=(raw_dir / data_config.RAW_FILENAME,),
+                # The raw CSV is its own cache; only its signature is tracked
+                cache=False,
+            ),
+            Stage(
+                "clean",
+                clean_stage,
+                deps=("load_raw",),
+                configs=(data_config,),
+                code=(clean_data,),
+            ),
+            Stage(
+                "split",
+                split_stage,
+                deps=("clean",),
+                configs=(data_config, split_config),
+                code=(split_data,),
+            ),
+            Stage(
+                "features",
+                features_stage,
+                deps=("split",),
+                code=(build_features,),
+            ),
+            Stage(
+                "train_logistic",
+                train_logistic_stage,
+                deps=("features",),
+                configs=(model_config,),
+                code=(logistic_model,),
+            ),
+            Stage(
+                "train_xgboost",
+                train_xgboost_stage,
+                deps=("features",),
+                configs=(xgb_config,),
+                code=(xgboost_model,),
+            ),
+            Stage(
+                "evaluate",
+                evaluate_stage,
+                deps=("features", "train_logistic", "train_xgboost"),
+                code=(metrics_module,),
+            ),
+        ],
+        cache_dir=cache_dir,
+        profiler=profiler,
+    )
@@ -0,0 +1,125 @@
+"""
+SQLite persistence for hyperparameter studies.
+
+Every (trial, rung) evaluation is stored as soon as it finishes, so an
+interrupted search can be resumed without re-running completed work. The
+search settings (data key, seed, search space, ...) are stored with the
+study, and resuming it with different ones is refused.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    study TEXT NOT NULL,
+    trial_id INTEGER NOT NULL,
+    rung INTEGER NOT NULL,
+    resource INTEGER NOT NULL,
+    params TEXT NOT NULL,
+    score REAL,
+    seconds REAL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (study, trial_id, rung)
+);
+CREATE TABLE IF NOT EXISTS studies (
+    study TEXT PRIMARY KEY,
+    settings TEXT NOT NULL
+)
+"""
+
+
+class Study:
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def bind(self, settings: dict):
+        """
+        Store the search settings on first use; raise ValueError if the
+        study was started with different ones, since its trials would not
+        be comparable with new ones.
+        """
+
+        settings = json.dumps(settings, sort_keys=True)
+        row = self.conn.execute(
+            "SELECT settings FROM studies WHERE study = ?", (self.name,)
+        ).fetchone()
+        if row is None:
+            self.conn.execute(
+                "INSERT INTO studies VALUES (?, ?)", (self.name, settings)
+            )
+            self.conn.commit()
+        elif row[0] != settings:
+            raise ValueError(
+                f"Study '{self.name}' was started with different settings "
+                f"({row[0]}); use a new study name"
+            )
+
+    def completed(self) -> Dict[Tuple[int, int], float]:
+        """
+        Scores of finished evaluations keyed by (trial_id, rung).
+        """
+
+        rows = self.conn.execute(
+            "SELECT trial_id, rung, score FROM trials WHERE study = ?",
+            (self.name,),
+        )
+        return {(trial_id, rung): score for trial_id, rung, score in rows}
+
+    def record(
+        self,
+        trial_id: int,
+        rung: int,
+        resource: int,
+        params: dict,
+        score: float,
+        seconds: float,
+    ):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO trials VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.name,
+                trial_id,
+                rung,
+                resource,
+                json.dumps(params, sort_keys=True),
+                score,
+                seconds,
+                time.time(),
+            ),
+        )
+        self.conn.commit()
+
+    def best(self) -> Optional[dict]:
+        """
+        Best evaluation at the highest resource level reached.
+        """
+
+        row = self.conn.execute(
+            "SELECT trial_id, rung, resource, params, score FROM trials "
+            "WHERE study = ? ORDER BY resource DESC, score DESC LIMIT 1",
+            (self.name,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        trial_id, rung, resource, params, score = row
+        return {
+            "trial_id": trial_id,
+            "rung": rung,
+            "resource": resource,
+            "params": json.loads(params),
+            "score": score,
+        }
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,322 @@
+"""
+Parallel successive halving / Hyperband search on the time split.
+
+Features are built once and cached as .npy files. Each worker process
+memory-maps them and, for XGBoost, builds a single QuantileDMatrix that
+all of its trials reuse. Every trial gets an equal share of the cores so
+concurrent trials do not oversubscribe the machine.
+"""
+
+import hashlib
+import inspect
+import math
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import roc_auc_score
+
+from credit_risk.features import build_features
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.xgboost_model import booster_params
+from credit_risk.tuning.study import Study
+from credit_risk.utils.config import model_config, tuning_config, xgb_config
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.pool import (
+    load_shared_matrices,
+    worker_pool,
+    write_shared_matrices,
+)
+from credit_risk.utils.threads import current_threads
+
+logger = get_logger(__name__)
+
+SEARCH_SPACES = {
+    "xgboost": {
+        "max_depth": ("int", 3, 8),
+        "learning_rate": ("loguniform", 0.01, 0.3),
+        "subsample": ("uniform", 0.5, 1.0),
+        "colsample_bytree": ("uniform", 0.5, 1.0),
+        "min_child_weight": ("loguniform", 1.0, 20.0),
+        "reg_lambda": ("loguniform", 0.1, 10.0),
+    },
+    "logistic": {
+        "alpha": ("loguniform", 1e-6, 1e-2),
+        "penalty": ("choice", ["l2", "l1", "elasticnet"]),
+        "l1_ratio": ("uniform", 0.05, 0.95),
+    },
+}
+
+# (min, max) resource per trial: boosting rounds for XGBoost, epochs for SGD
+RESOURCES = {
+    "xgboost": (30, 810),
+    "logistic": (1, 27),
+}
+
+DATA_FILES = ("X_train", "y_train", "X_val", "y_val")
+
+# Per-worker state set up once by _init_worker
+_WORKER_STATE = {}
+
+
+def sample_configs(space: dict, n: int, seed: int) -> List[dict]:
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(n):
+        config = {}
+        for name, (kind, *args) in space.items():
+            if kind == "int":
+                config[name] = int(rng.integers(args[0], args[1] + 1))
+            elif kind == "uniform":
+                config[name] = float(rng.uniform(args[0], args[1]))
+            elif kind == "loguniform":
+                config[name] = float(
+                    math.exp(rng.uniform(math.log(args[0]), math.log(args[1])))
+                )
+            elif kind == "choice":
+                config[name] = args[0][int(rng.integers(len(args[0])))]
+            else:
+                raise ValueError(f"Unknown search space type '{kind}'")
+        configs.append(config)
+    return configs
+
+
+def rung_resources(min_resource: int, max_resource: int, eta: int) -> List[int]:
+    """
+    Geometric resource levels min_resource * eta^k, capped at max_resource.
+    """
+
+    resources = [min_resource]
+    while resources[-1] * eta <= max_resource:
+        resources.append(resources[-1] * eta)
+    if resources[-1] < max_resource:
+        resources.append(max_resource)
+    return resources
+
+
+def tuning_data_key(train_df: pd.DataFrame, val_df: pd.DataFrame) -> str:
+    """
+    Digest of the split frames and of the feature-building code.
+    """
+
+    digest = hashlib.sha256(Path(inspect.getfile(build_features)).read_bytes())
+    for df in (train_df, val_df):
+        digest.update(",".join(map(str, df.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().data)
+    return digest.hexdigest()[:16]
+
+
+def prepare_tuning_data(train_df, val_df, cache_root: Path) -> Path:
+    """
+    Build features once and cache them for every trial, in
+    cache_root/<tuning_data_key>. Returns that directory.
+    """
+
+    data_dir = Path(cache_root) / tuning_data_key(train_df, val_df)
+    if all((data_dir / f"{name}.npy").exists() for name in DATA_FILES):
+        logger.info(f"Reusing cached tuning features in {data_dir}")
+        return data_dir
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    feature_builder = FeatureBuilder()
+    X_train, y_train = feature_builder.build_features(train_df, fit=True)
+    X_val, y_val = feature_builder.build_features(val_df, fit=False)
+
+    write_shared_matrices(
+        data_dir,
+        X_train=np.asarray(X_train, dtype=np.float32),
+        y_train=np.asarray(y_train, dtype=np.int8),
+        X_val=np.asarray(X_val, dtype=np.float32),
+        y_val=np.asarray(y_val, dtype=np.int8),
+    )
+
+    logger.info(f"Cached tuning features in {data_dir}")
+    return data_dir
+
+
+def _init_worker(data_dir: str, model_name: str):
+    n_threads = current_threads()
+    data = load_shared_matrices(data_dir, DATA_FILES)
+
+    _WORKER_STATE.update(data)
+    _WORKER_STATE["model_name"] = model_name
+    _WORKER_STATE["n_threads"] = n_threads
+
+    if model_name == "xgboost":
+        dtrain = xgb.QuantileDMatrix(
+            data["X_train"],
+            label=data["y_train"],
+            max_bin=xgb_config.MAX_BIN,
+            nthread=n_threads,
+        )
+        _WORKER_STATE["dtrain"] = dtrain
+        _WORKER_STATE["dval"] = xgb.QuantileDMatrix(
+            data["X_val"], label=data["y_val"], ref=dtrain, nthread=n_threads
+        )
+
+
+def _score_xgboost(params: dict, resource: int) -> np.ndarray:
+    train_params = booster_params({**xgb_config.PARAMS, **params})
+    train_params["nthread"] = _WORKER_STATE["n_threads"]
+    train_params["max_bin"] = xgb_config.MAX_BIN
+
+    booster = xgb.train(
+        train_params, _WORKER_STATE["dtrain"], num_boost_round=resource
+    )
+    return booster.predict(_WORKER_STATE["dval"])
+
+
+def _score_logistic(params: dict, resource: int) -> np.ndarray:
+    sgd_params = {**model_config.SGD_LOGISTIC_PARAMS, **params}
+    sgd_params.update(max_iter=resource, tol=None)
+
+    model = SGDClassifier(**sgd_params)
+    model.fit(_WORKER_STATE["X_train"], _WORKER_STATE["y_train"])
+    return model.decision_function(_WORKER_STATE["X_val"])
+
+
+def _evaluate(trial_id: int, rung: int, resource: int, params: dict):
+    start = time.perf_counter()
+
+    if _WORKER_STATE["model_name"] == "xgboost":
+        scores = _score_xgboost(params, resource)
+    else:
+        scores = _score_logistic(params, resource)
+
+    if np.isfinite(scores).all():
+        auc = float(roc_auc_score(_WORKER_STATE["y_val"], scores))
+    else:
+        auc = float("nan")
+
+    return trial_id, rung, resource, auc, time.perf_counter() - start
+
+
+def _rank_key(score) -> float:
+    return -math.inf if score is None or math.isnan(score) else score
+
+
+class SuccessiveHalvingSearch:
+    def __init__(
+        self,
+        model_name: str,
+        data_dir: Path,
+        study: Study,
+        eta: int = tuning_config.ETA,
+        n_workers: int = tuning_config.N_WORKERS,
+        seed: int = tuning_config.SEED,
+    ):
+        if model_name not in SEARCH_SPACES:
+            raise ValueError(f"No search space for model '{model_name}'")
+
+        self.model_name = model_name
+        self.data_dir = Path(data_dir)
+        self.study = study
+        self.eta = eta
+        self.n_workers = n_workers
+        self.seed = seed
+        self.resources = rung_resources(*RESOURCES[model_name], eta)
+
+    def _run_bracket(
+        self, pool, bracket: int, n_configs: int, start_rung: int
+    ) -> Dict[int, float]:
+        configs = sample_configs(
+            SEARCH_SPACES[self.model_name], n_configs, self.seed + bracket
+        )
+        # Trial ids are unique across brackets so the study can be resumed
+        trial_ids = [bracket * 10_000 + i for i in range(n_configs)]
+        params = dict(zip(trial_ids, configs))
+
+        completed = self.study.completed()
+        survivors = trial_ids
+        scores = {}
+
+        for rung in range(start_rung, len(self.resources)):
+            resource = self.resources[rung]
+            scores = {}
+            futures = []
+
+            for trial_id in survivors:
+                if (trial_id, rung) in completed:
+                    scores[trial_id] = completed[(trial_id, rung)]
+                else:
+                    futures.append(
+                        pool.submit(
+                            _evaluate, trial_id, rung, resource, params[trial_id]
+                        )
+                    )
+
+            for future in as_completed(futures):
+                trial_id, rung_done, resource_done, score, seconds = future.result()
+                self.study.record(
+                    trial_id,
+                    rung_done,
+                    resource_done,
+                    params[trial_id],
+                    score,
+                    seconds,
+                )
+                scores[trial_id] = score
+
+            logger.info(
+                f"Bracket {bracket} rung {rung} (resource={resource}): "
+                f"{len(survivors)} trials, best AUC "
+                f"{max(map(_rank_key, scores.values())):.4f}"
+            )
+
+            n_keep = max(1, len(survivors) // self.eta)
+            survivors = sorted(
+                survivors, key=lambda t: _rank_key(scores[t]), reverse=True
+            )[:n_keep]
+
+        return scores
+
+    def settings(self) -> dict:
+        """
+        Everything the stored trial scores depend on. The data directory is
+        named after its tuning_data_key by prepare_tuning_data.
+        """
+
+        return {
+            "model": self.model_name,
+            "data_key": self.data_dir.name,
+            "seed": self.seed,
+            "eta": self.eta,
+            "resources": self.resources,
+            "search_space": SEARCH_SPACES[self.model_name],
+        }
+
+    def _pool(self):
+        self.study.bind(self.settings())
+
+        return worker_pool(
+            self.n_workers, _init_worker, (str(self.data_dir), self.model_name)
+        )
+
+    def run(self, n_configs: int = tuning_config.N_CONFIGS) -> dict:
+        """
+        A single successive-halving bracket starting at the minimum resource.
+        """
+
+        with self._pool() as pool:
+            self._run_bracket(pool, bracket=0, n_configs=n_configs, start_rung=0)
+        return self.study.best()
+
+    def run_hyperband(self) -> dict:
+        """
+        Hyperband: brackets trading number of configs against starting resource.
+        """
+
+        s_max = len(self.resources) - 1
+        with self._pool() as pool:
+            for s in range(s_max, -1, -1):
+                n_configs = int(math.ceil((s_max + 1) / (s + 1) * self.eta**s))
+                self._run_bracket(
+                    pool, bracket=s, n_configs=n_configs, start_rung=s_max - s
+                )
+        return self.study.best()
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 class DataConfig:
     RAW_FILENAME: str = "accepted_2007_to_2018Q4.csv"
     CLEANED_FILENAME: str = "cleaned_data.parquet"
+    PARTITIONED_DIRNAME: str = "cleaned_partitioned"
     TARGET_COL: str = "is_default"
     DATE_COL: str = "issue_d"
     MISSING_THRESHOLD: float = 0.30
@@ -46,6 +47,10 @@ model_config = ModelConfig()
 @dataclass(frozen=True)
 class XGBoostConfig:
     PARAMS: dict = None
+    MAX_BIN: int = 256
+    EARLY_STOPPING_ROUNDS: int = 30
+    CHECKPOINT_INTERVAL: int = 50
+    EXTMEM_CACHE_DIRNAME: str = "xgb_extmem"
 
     def __post_init__(self):
         object.__setattr__(
@@ -66,3 +71,193 @@ class XGBoostConfig:
 
 
 xgb_config = XGBoostConfig()
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    MODE: str = "expanding"  # "expanding" or "sliding"
+    TRAIN_MONTHS: int = 36
+    TEST_MONTHS: int = 3
+    STEP_MONTHS: int = 3
+    N_JOBS: int = 4
+    RESULTS_FILENAME: str = "backtest_results.csv"
+
+
+backtest_config = BacktestConfig()
+
+
+@dataclass(frozen=True)
+class StreamingConfig:
+    N_EPOCHS: int = 5
+    FIT_SAMPLE_ROWS: int = 500_000
+    PREFETCH_DEPTH: int = 1
+    SHARD_DIRNAME: str = "feature_shards"
+    SEED: int = 42
+
+
+streaming_config = StreamingConfig()
+
+
+@dataclass(frozen=True)
+class TuningConfig:
+    N_CONFIGS: int = 27
+    ETA: int = 3
+    N_WORKERS: int = 4
+    SEED: int = 42
+
+
+tuning_config = TuningConfig()
+
+
+@dataclass(frozen=True)
+class RetrainConfig:
+    N_BOOST_ROUNDS: int = 50
+    N_EPOCHS: int = 3
+    SCALER_UPDATE_WEIGHT: float = 0.1
+    HOLDOUT_MONTHS: int = 3
+
+
+retrain_config = RetrainConfig()
+
+
+@dataclass(frozen=True)
+class ServingConfig:
+    N_THREADS: int = 1  # per prediction call; the API serves requests concurrently
+    MAX_BATCH: int = 1000
+    MODEL_DIR_ENV: str = "CREDIT_RISK_MODEL_DIR"  # overrides models/<MODEL_NAME>
+
+
+serving_config = ServingConfig()
+
+
+@dataclass(frozen=True)
+class DecisionConfig:
+    LOW_RISK_THRESHOLD: float = 0.30
+    HIGH_RISK_THRESHOLD: float = 0.60
+    DEFAULT_THRESHOLD: float = 0.5
+
+
+decision_config = DecisionConfig()
+
+
+@dataclass(frozen=True)
+class BatchScoringConfig:
+    N_JOBS: int = 4
+    CSV_BLOCK_BYTES: int = 64 << 20
+    MAX_IN_FLIGHT_PER_WORKER: int = 2
+
+
+batch_scoring_config = BatchScoringConfig()
+
+
+@dataclass(frozen=True)
+class CalibrationConfig:
+    METHOD: str = "isotonic"  # "isotonic" or "platt"
+    N_GRID: int = 1001  # interpolation table size for Platt scaling
+    N_BINS: int = 10
+    FILENAME: str = "calibrator.json"
+
+
+calibration_config = CalibrationConfig()
+
+
+@dataclass(frozen=True)
+class ThreadingConfig:
+    CPUS_ENV: str = "CREDIT_RISK_CPUS"  # overrides detected core count
+    WORKERS_ENV: str = "WEB_CONCURRENCY"  # uvicorn worker processes
+    API_WORKERS: int = 1
+
+
+threading_config = ThreadingConfig()
+
+
+@dataclass(frozen=True)
+class BootstrapConfig:
+    N_REPLICATES: int = 1000
+    METHOD: str = "poisson"  # "poisson" or "multinomial"
+    BLOCK_SIZE: int = 25  # replicates per task
+    N_JOBS: int = 4
+    ALPHA: float = 0.05
+    SEED: int = 42
+
+
+bootstrap_config = BootstrapConfig()
+
+
+@dataclass(frozen=True)
+class SegmentConfig:
+    COLUMNS: tuple = ("sub_grade", "addr_state", "purpose", "term", "issue_vintage")
+    VINTAGE_FREQ: str = "Y"  # pandas period alias for issue_vintage
+    MIN_COUNT: int = 500  # segments below this many loans are flagged
+    MIN_CLASS_COUNT: int = 30  # ... or with fewer defaults / non-defaults
+    FILENAME: str = "segment_metrics.csv"
+
+
+segment_config = SegmentConfig()
+
+
+@dataclass(frozen=True)
+class ThresholdConfig:
+    LOSS_GIVEN_DEFAULT: float = 0.6  # share of loan_amnt lost on a default
+    INTEREST_YEARS: float = 1.0  # years of int_rate earned on a repaid loan
+    REVIEW_COST: float = 50.0  # cost of one manual review
+    MAX_REVIEW_RATE: float = 0.15  # review capacity, share of applications
+    N_CANDIDATES: int = 1001  # candidate cut points per threshold
+    FILENAME: str = "thresholds.json"
+
+
+threshold_config = ThresholdConfig()
+
+
+@dataclass(frozen=True)
+class MonitoringConfig:
+    N_SCORE_BINS: int = 20
+    N_FEATURE_BINS: int = 20  # numeric features without a drift baseline
+    WINDOW_SECONDS: int = 60
+    N_WINDOWS: int = 60  # rolling windows kept in memory
+    FOLD_SECONDS: float = 1.0  # how often pending predictions are binned
+    FLUSH_SECONDS: float = 300.0  # how often closed windows go to Parquet
+    DIRNAME: str = "monitoring"
+    DIR_ENV: str = "CREDIT_RISK_MONITORING_DIR"  # overrides data/monitoring
+
+
+monitoring_config = MonitoringConfig()
+
+
+@dataclass(frozen=True)
+class DriftConfig:
+    N_BINS: int = 10  # quantile bins per numeric feature / for the score
+    PSI_WARNING: float = 0.10
+    PSI_ALERT: float = 0.25
+    EPS: float = 1e-4  # floor on bin shares in the PSI log ratio
+    BATCH_ROWS: int = 100_000  # rows per streamed Parquet batch
+    FILENAME: str = "drift_baseline.json"
+    REPORT_FILENAME: str = "drift_report.csv"
+
+
+drift_config = DriftConfig()
+
+
+@dataclass(frozen=True)
+class PermutationConfig:
+    N_REPEATS: int = 5  # shuffles per field
+    N_JOBS: int = 4
+    CHUNK_ROWS: int = 50_000  # rows scored per predict_proba call
+    SEED: int = 42
+    FILENAME: str = "permutation_importance.csv"
+    CACHE_DIRNAME: str = "permutation_cache"
+
+
+permutation_config = PermutationConfig()
+
+
+@dataclass(frozen=True)
+class LoggingConfig:
+    MODE_ENV: str = "CREDIT_RISK_LOG_MODE"  # "plain" (default) or "json"
+    LEVEL_ENV: str = "CREDIT_RISK_LOG_LEVEL"
+    SAMPLE_ENV: str = "CREDIT_RISK_LOG_SAMPLE"  # "/predict=0.01,/predict/batch=0.1"
+    LEVEL: str = "INFO"
+    QUEUE_SIZE: int = 10_000  # records waiting for the writer; more are dropped
+
+
+logging_config = LoggingConfig()
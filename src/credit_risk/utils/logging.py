@@ -1,5 +1,194 @@
+"""
+Package loggers.
+
+"plain" mode (the default) formats and writes each record to stdout on
+the calling thread. "json" mode (CREDIT_RISK_LOG_MODE=json) only puts
+the record on a bounded queue: a QueueListener thread renders it as one
+JSON object per line and writes it, so neither message formatting nor
+the stdout write happens on a request thread. When the queue is full,
+records are dropped instead of blocking; the count is reported by
+`dropped_log_records()` and as a warning when the listener stops.
+
+`sampled_logger(logger, route)` keeps only a fraction of a route's
+debug / info messages (CREDIT_RISK_LOG_SAMPLE, e.g.
+"/predict=0.01"). With %-style arguments, a disabled or sampled-out
+message costs a dict lookup and a level check or random draw.
+"""
+
+import atexit
+import json
 import logging
+import os
+import queue
+import random
 import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from credit_risk.utils.config import logging_config
+
+MODES = ("plain", "json")
+
+PLAIN_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+PLAIN_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Attributes every LogRecord has; anything else came in through `extra`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_STATE = {
+    "mode": None,
+    "level": None,
+    "sample_rates": {},
+    "handler": None,
+    "listener": None,
+}
+_LOGGERS = set()  # names configured by get_logger
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """
+    "/predict=0.01,/predict/batch=0.1" -> {"/predict": 0.01, ...}
+    """
+
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        route, rate = item.rsplit("=", 1)
+        rates[route.strip()] = float(rate)
+    return rates
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record: ts, level, logger, message, any `extra`
+    fields and the formatted exception, if any.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        payload.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in _RECORD_ATTRS
+        )
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queues records unformatted (the listener thread formats them) and
+    drops them when the queue is full. Log arguments must not be mutated
+    after the call.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def dropped_log_records() -> int:
+    """
+    Records dropped by the current json-mode queue (0 in plain mode).
+    """
+
+    return getattr(_STATE["handler"], "dropped", 0)
+
+
+def _stop_listener():
+    listener = _STATE["listener"]
+    if listener is not None:
+        # Writes out everything still queued
+        listener.stop()
+        _STATE["listener"] = None
+
+        dropped = dropped_log_records()
+        if dropped:
+            # The queue is no longer drained: write straight to its handlers
+            record = logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": "Log queue was full: %d records were dropped",
+                    "args": (dropped,),
+                }
+            )
+            for handler in listener.handlers:
+                handler.handle(record)
+
+
+atexit.register(_stop_listener)
+
+
+def _build_handler(mode: str) -> logging.Handler:
+    stream = logging.StreamHandler(sys.stdout)
+    if mode == "plain":
+        stream.setFormatter(logging.Formatter(fmt=PLAIN_FORMAT, datefmt=PLAIN_DATEFMT))
+        return stream
+
+    stream.setFormatter(JsonFormatter())
+    handler = DroppingQueueHandler(queue.Queue(logging_config.QUEUE_SIZE))
+    listener = QueueListener(handler.queue, stream)
+    listener.start()
+    _STATE["listener"] = listener
+    return handler
+
+
+def _attach(logger: logging.Logger, previous: Optional[logging.Handler] = None):
+    if previous is not None:
+        logger.removeHandler(previous)
+    logger.setLevel(_STATE["level"])
+    logger.addHandler(_STATE["handler"])
+
+
+def configure_logging(
+    mode: Optional[str] = None,
+    level: Optional[str] = None,
+    sample_rates: Optional[Dict[str, float]] = None,
+) -> logging.Handler:
+    """
+    (Re)configure every logger created by get_logger. Arguments default
+    to CREDIT_RISK_LOG_MODE / _LEVEL / _SAMPLE, then LoggingConfig.
+    """
+
+    mode = mode or os.environ.get(logging_config.MODE_ENV) or "plain"
+    if mode not in MODES:
+        raise ValueError(f"Unknown log mode '{mode}', expected one of {MODES}")
+    level = level or os.environ.get(logging_config.LEVEL_ENV) or logging_config.LEVEL
+    if sample_rates is None:
+        sample_rates = parse_sample_rates(
+            os.environ.get(logging_config.SAMPLE_ENV, "")
+        )
+
+    _stop_listener()
+    previous = _STATE["handler"]
+    _STATE.update(
+        mode=mode,
+        level=level.upper(),
+        sample_rates=dict(sample_rates),
+        handler=_build_handler(mode),
+    )
+    for name in _LOGGERS:
+        _attach(logging.getLogger(name), previous)
+    return _STATE["handler"]
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -11,20 +200,54 @@ def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
 
     # Prevent duplicate logs in notebooks / repeated imports
-    if logger.handlers:
+    if name in _LOGGERS or logger.handlers:
         return logger
 
-    logger.setLevel(logging.INFO)
+    if _STATE["handler"] is None:
+        configure_logging()
+    _LOGGERS.add(name)
+    _attach(logger)
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    return logger
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(logging.INFO)
-    handler.setFormatter(formatter)
 
-    logger.addHandler(handler)
+class SampledLogger:
+    """
+    Logs debug / info messages of `route` with probability equal to its
+    sample rate (1 if it has none) and tags them with the route.
+    Warnings and errors are never sampled out.
+    """
 
-    return logger
+    __slots__ = ("logger", "route")
+
+    def __init__(self, logger: logging.Logger, route: str):
+        self.logger = logger
+        self.route = route
+
+    def _log(self, level: int, msg: str, args, kwargs):
+        if not self.logger.isEnabledFor(level):
+            return
+        rate = _STATE["sample_rates"].get(self.route, 1.0)
+        sampled = level < logging.WARNING and rate < 1.0
+        if sampled and random.random() >= rate:
+            return
+        extra = {**(kwargs.pop("extra", None) or {}), "route": self.route}
+        if sampled:
+            extra["sample_rate"] = rate
+        self.logger.log(level, msg, *args, extra=extra, stacklevel=3, **kwargs)
+
+    def debug(self, msg: str, *args, **kwargs):
+        self._log(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: str, *args, **kwargs):
+        self._log(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: str, *args, **kwargs):
+        self._log(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg: str, *args, **kwargs):
+        self._log(logging.ERROR, msg, args, kwargs)
+
+
+def sampled_logger(logger: logging.Logger, route: str) -> SampledLogger:
+    return SampledLogger(logger, route)
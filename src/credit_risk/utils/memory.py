@@ -0,0 +1,27 @@
+import os
+import resource
+import sys
+
+
+def current_rss_mb() -> float:
+    """
+    Current resident set size of this process in MB.
+    """
+
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+    except (OSError, ValueError):
+        # No procfs (e.g. macOS): fall back to the peak
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of this process in MB.
+    """
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
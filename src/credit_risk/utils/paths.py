@@ -16,6 +16,8 @@ data_dir = project_root / "data"
 raw_dir = data_dir / "raw"
 processed_dir = data_dir / "processed"
 samples_dir = data_dir / "samples"
+cache_dir = data_dir / "cache"
+monitoring_dir = data_dir / "monitoring"
 
 
 def create_dirs():
@@ -0,0 +1,65 @@
+"""
+Process pools for the parallel evaluation / training paths.
+
+`worker_pool` starts `n_jobs` workers that each apply their share of the
+thread budget before running the caller's initializer, which usually
+fills a module-level `_WORKER_STATE` dict. Large read-only arrays are
+written once with `write_shared_matrices` and memory-mapped by every
+worker with `load_shared_matrices`, so they are never pickled per task.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+
+from credit_risk.utils.threads import apply_thread_budget, thread_budget
+
+
+def write_shared_matrices(directory: Path, **arrays) -> Path:
+    """
+    Save each array as `directory/<name>.npy` (in its own dtype).
+    """
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(directory / f"{name}.npy", np.asarray(array))
+    return directory
+
+
+def load_shared_matrices(directory: Path, names: Iterable[str]) -> dict:
+    """
+    Read-only memory maps of the arrays written by `write_shared_matrices`.
+    """
+
+    return {
+        name: np.load(Path(directory) / f"{name}.npy", mmap_mode="r")
+        for name in names
+    }
+
+
+def _init_worker(n_threads: int, initializer: Optional[Callable], initargs: tuple):
+    apply_thread_budget(n_threads)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def worker_pool(
+    n_jobs: int,
+    initializer: Optional[Callable] = None,
+    initargs: tuple = (),
+    mp_context=None,
+) -> ProcessPoolExecutor:
+    """
+    Pool of `n_jobs` processes, each limited to `cores // n_jobs` native
+    threads before `initializer(*initargs)` runs in it.
+    """
+
+    return ProcessPoolExecutor(
+        max_workers=n_jobs,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(thread_budget(n_jobs).threads, initializer, initargs),
+    )
@@ -0,0 +1,254 @@
+"""
+Per-stage profiling for training runs.
+
+Each stage records wall time, CPU time, peak RSS (sampled on a
+background thread), optionally Python-tracked allocated bytes
+(tracemalloc, which slows allocation-heavy stages several-fold and so
+is off by default) and the row / column count of its output. With
+`profile_slowest`, a background thread also samples each stage's stack
+(`sys._current_frames`, 100 times a second) instead of tracing every
+call, so the timings stay comparable with unprofiled runs. The report
+is plain JSON, records the profiler settings, and two runs with the
+same settings can be diffed automatically with `diff_profiles`.
+"""
+
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from credit_risk.utils.logging import get_logger
+from credit_risk.utils.memory import current_rss_mb
+
+logger = get_logger(__name__)
+
+
+def _shape_of(obj) -> Optional[dict]:
+    if isinstance(obj, (tuple, list)) and obj:
+        obj = obj[0]
+    shape = getattr(obj, "shape", None)
+    if shape is None:
+        return None
+    return {"rows": int(shape[0]), "cols": int(shape[1]) if len(shape) > 1 else 1}
+
+
+class _RssSampler:
+    """
+    Tracks the highest RSS seen while a stage runs.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = current_rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss_mb())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss_mb())
+
+
+def _frame_key(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+
+
+class _StackSampler:
+    """
+    Counts the functions on one thread's stack at a fixed interval.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.01):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.cumulative = Counter()  # function anywhere on the stack
+        self.own = Counter()  # function at the top of the stack
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.own[_frame_key(frame)] += 1
+            on_stack = set()
+            while frame is not None:
+                on_stack.add(_frame_key(frame))
+                frame = frame.f_back
+            self.cumulative.update(on_stack)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def top(self, n: int) -> List[dict]:
+        return [
+            {
+                "function": key,
+                "cumulative_share": count / self.samples,
+                "own_share": self.own[key] / self.samples,
+            }
+            for key, count in self.cumulative.most_common(n)
+        ]
+
+
+class StageRecord:
+    def __init__(self, name: str):
+        self.name = name
+        self.stats: dict = {"stage": name}
+
+    def record(self, obj):
+        """
+        Attach the row / column count of a stage output.
+        """
+        shape = _shape_of(obj)
+        if shape is not None:
+            self.stats.update(shape)
+        return obj
+
+
+class StageProfiler:
+    def __init__(self, trace_allocations: bool = False, profile_slowest: bool = False):
+        self.trace_allocations = trace_allocations
+        self.profile_slowest = profile_slowest
+        self.stages: List[dict] = []
+        self._profiles: Dict[str, _StackSampler] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Profile the enclosed block as stage `name`.
+
+        Memory and CPU figures are process-wide, so they are only exact
+        when stages do not overlap.
+        """
+
+        record = StageRecord(name)
+        owns_tracing = False
+        if self.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                owns_tracing = True
+            tracemalloc.reset_peak()
+            traced_start = tracemalloc.get_traced_memory()[0]
+
+        profile = _StackSampler(threading.get_ident()) if self.profile_slowest else None
+        rss_start = current_rss_mb()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+        with _RssSampler() as sampler, profile or nullcontext():
+            yield record
+
+        record.stats.update(
+            {
+                "wall_seconds": time.perf_counter() - wall_start,
+                "cpu_seconds": time.process_time() - cpu_start,
+                "rss_start_mb": rss_start,
+                "rss_end_mb": current_rss_mb(),
+                "peak_rss_mb": sampler.peak,
+            }
+        )
+        if self.trace_allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            record.stats["allocated_peak_bytes"] = peak - traced_start
+            record.stats["allocated_net_bytes"] = current - traced_start
+            if owns_tracing:
+                tracemalloc.stop()
+
+        with self._lock:
+            self.stages.append(record.stats)
+            if profile is not None:
+                self._profiles[name] = profile
+
+        logger.info(
+            f"[profile] {name}: {record.stats['wall_seconds']:.2f}s wall, "
+            f"{record.stats['cpu_seconds']:.2f}s cpu, "
+            f"peak RSS {record.stats['peak_rss_mb']:.0f} MB"
+        )
+
+    def _slowest_profile(self, top: int = 25) -> Optional[dict]:
+        if not self._profiles:
+            return None
+
+        slowest = max(
+            (s for s in self.stages if s["stage"] in self._profiles),
+            key=lambda s: s["wall_seconds"],
+        )
+        profile = self._profiles[slowest["stage"]]
+        return {
+            "stage": slowest["stage"],
+            "samples": profile.samples,
+            "top_functions": profile.top(top),
+        }
+
+    @property
+    def settings(self) -> dict:
+        return {
+            "trace_allocations": self.trace_allocations,
+            "profile_slowest": self.profile_slowest,
+        }
+
+    def report(self) -> dict:
+        report = {
+            "settings": self.settings,
+            "total_wall_seconds": time.perf_counter() - self._started,
+            "stages": self.stages,
+        }
+        slowest = self._slowest_profile()
+        if slowest is not None:
+            report["slowest_stage_profile"] = slowest
+        return report
+
+    def write(self, path: Path) -> dict:
+        report = self.report()
+        with open(path, "w") as f:
+            json.dump(report, f, indent=4)
+        logger.info(f"Profile written to {path}")
+        return report
+
+
+def diff_profiles(baseline: dict, current: dict, metric: str = "wall_seconds") -> list:
+    """
+    Per-stage change of `metric` between two profile reports. Reports
+    recorded with different profiler settings are refused, since
+    allocation tracing and stack sampling change the timings.
+    """
+
+    if baseline.get("settings") != current.get("settings"):
+        raise ValueError(
+            f"Profiles were recorded with different settings: "
+            f"{baseline.get('settings')} vs {current.get('settings')}"
+        )
+
+    before = {s["stage"]: s.get(metric) for s in baseline["stages"]}
+    rows = []
+    for stage in current["stages"]:
+        old, new = before.get(stage["stage"]), stage.get(metric)
+        ratio = new / old if old else None
+        rows.append(
+            {"stage": stage["stage"], "baseline": old, "current": new, "ratio": ratio}
+        )
+    return rows
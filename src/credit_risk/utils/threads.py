@@ -0,0 +1,113 @@
+"""
+Thread budget for everything that runs native code.
+
+XGBoost (OpenMP) and NumPy / sklearn (BLAS, OpenMP) each default to one
+thread per core. Several worker processes (process pools, uvicorn
+workers) then oversubscribe the machine. The budget splits the available
+cores evenly between worker processes, and each worker applies its share
+to every native thread pool, including XGBoost's `nthread`.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from threadpoolctl import threadpool_limits
+
+from credit_risk.utils.config import serving_config, threading_config
+
+NATIVE_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# Budget applied in this process (None until apply_thread_budget is called)
+_STATE = {"threads": None, "limits": None}
+
+
+@dataclass(frozen=True)
+class ThreadBudget:
+    cores: int
+    n_workers: int
+    threads: int  # native threads per worker
+
+
+def _cgroup_cpu_limit() -> Optional[int]:
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+    except (OSError, ValueError):
+        return None
+    if quota == "max":
+        return None
+    return max(1, int(quota) // int(period))
+
+
+def available_cores() -> int:
+    """
+    Cores this process may use: CPU affinity, capped by a cgroup CPU quota,
+    unless CREDIT_RISK_CPUS is set.
+    """
+
+    override = os.environ.get(threading_config.CPUS_ENV)
+    if override:
+        return max(1, int(override))
+
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+
+    limit = _cgroup_cpu_limit()
+    return min(cores, limit) if limit else cores
+
+
+def thread_budget(n_workers: int = 1, cores: Optional[int] = None) -> ThreadBudget:
+    cores = cores or available_cores()
+    n_workers = max(1, n_workers)
+    return ThreadBudget(
+        cores=cores, n_workers=n_workers, threads=max(1, cores // n_workers)
+    )
+
+
+def apply_thread_budget(threads: int) -> int:
+    """
+    Limit every native thread pool in this process to `threads`.
+
+    The limit is also exported through the usual environment variables so
+    that child processes start with it.
+    """
+
+    for var in NATIVE_THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    _STATE["limits"] = threadpool_limits(limits=threads)
+    _STATE["threads"] = threads
+    return threads
+
+
+def current_threads() -> int:
+    return _STATE["threads"] or available_cores()
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Map "all cores" (None / -1) to this process's budget.
+    """
+    return current_threads() if n_jobs is None or n_jobs < 0 else n_jobs
+
+
+def api_workers() -> int:
+    workers = os.environ.get(threading_config.WORKERS_ENV)
+    return int(workers) if workers else threading_config.API_WORKERS
+
+
+def serving_threads() -> int:
+    """
+    Native threads per API process. Requests already run concurrently, so
+    each call gets at most ServingConfig.N_THREADS threads.
+    """
+    return min(thread_budget(api_workers()).threads, serving_config.N_THREADS)
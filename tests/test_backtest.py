@@ -0,0 +1,97 @@
+from credit_risk.evaluation import backtest
+from credit_risk.evaluation.backtest import generate_windows, run_backtest
+
+
+def test_sliding_windows_are_contiguous(sample_cleaned_df):
+    windows = generate_windows(
+        sample_cleaned_df["issue_d"],
+        mode="sliding",
+        train_months=120,
+        test_months=60,
+        step_months=60,
+    )
+
+    assert len(windows) > 1
+    for prev, curr in zip(windows, windows[1:]):
+        assert curr.train_start > prev.train_start
+        assert prev.train_end < prev.test_end <= curr.test_end
+
+
+def test_backtest_resumes_from_checkpoint(sample_cleaned_df, tmp_path):
+    windows = generate_windows(
+        sample_cleaned_df["issue_d"],
+        mode="expanding",
+        train_months=240,
+        test_months=120,
+        step_months=120,
+    )
+    output_path = tmp_path / "backtest.csv"
+
+    first = run_backtest(
+        sample_cleaned_df, "logistic", windows[:1], output_path, n_jobs=1
+    )
+    results = run_backtest(
+        sample_cleaned_df, "logistic", windows, output_path, n_jobs=2
+    )
+
+    assert len(results) == len(windows)
+    assert results.loc[0, "roc_auc"] == first.loc[0, "roc_auc"]
+    assert results["roc_auc"].between(0, 1).all()
+
+
+def test_checkpoint_is_ignored_when_the_data_changes(sample_cleaned_df, tmp_path):
+    windows = generate_windows(
+        sample_cleaned_df["issue_d"],
+        mode="expanding",
+        train_months=240,
+        test_months=120,
+        step_months=120,
+    )
+    output_path = tmp_path / "backtest.csv"
+    checkpoint_path = output_path.with_suffix(".jsonl")
+
+    run_backtest(sample_cleaned_df, "logistic", windows, output_path, n_jobs=1)
+    n_rows = len(checkpoint_path.read_text().splitlines())
+    assert n_rows == len(windows)
+
+    changed = sample_cleaned_df.assign(int_rate=sample_cleaned_df["int_rate"] + 1)
+    results = run_backtest(changed, "logistic", windows, output_path, n_jobs=1)
+
+    assert len(checkpoint_path.read_text().splitlines()) == 2 * n_rows
+    assert "run" not in results.columns
+
+
+_run_window = backtest._run_window
+
+
+def _first_window_fails(window, model_name):
+    if window.window_id == 0:
+        raise RuntimeError("boom")
+    return _run_window(window, model_name)
+
+
+def test_failed_window_is_reported_without_losing_the_others(
+    sample_cleaned_df, tmp_path, monkeypatch
+):
+    windows = generate_windows(
+        sample_cleaned_df["issue_d"],
+        mode="expanding",
+        train_months=240,
+        test_months=120,
+        step_months=120,
+    )
+    output_path = tmp_path / "backtest.csv"
+
+    monkeypatch.setattr(backtest, "_run_window", _first_window_fails)
+    results = run_backtest(sample_cleaned_df, "logistic", windows, output_path)
+
+    assert len(results) == len(windows)
+    assert results.loc[0, "status"] == "failed"
+    assert "boom" in results.loc[0, "error"]
+    assert (results.loc[1:, "status"] == "ok").all()
+    assert results.loc[1:, "roc_auc"].between(0, 1).all()
+
+    # Failed windows are not checkpointed, so the next run retries them
+    monkeypatch.setattr(backtest, "_run_window", _run_window)
+    retried = run_backtest(sample_cleaned_df, "logistic", windows, output_path)
+    assert (retried["status"] == "ok").all()
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.artifacts import save_artifacts
+from credit_risk.models.batch_scoring import score_file
+from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.models.predict import load_serving_artifacts, predict_default_proba
+
+
+def _portfolio(sample_cleaned_df):
+    df = sample_cleaned_df.drop(columns=["is_default"])
+    return df.assign(loan_id=np.arange(len(df)))
+
+
+def test_score_file_parquet_and_csv_match_direct_scoring(sample_cleaned_df, tmp_path):
+    train_df, _, _ = DataSplitter().split(sample_cleaned_df)
+    fb = FeatureBuilder()
+    X, y = fb.build_features(train_df, fit=True)
+    save_artifacts(tmp_path / "model", LogisticSGDModel().train(X, y), fb)
+
+    portfolio = _portfolio(sample_cleaned_df)
+    expected = predict_default_proba(
+        portfolio, load_serving_artifacts(tmp_path / "model")
+    )
+
+    pq.write_table(
+        pa.Table.from_pandas(portfolio), tmp_path / "in.parquet", row_group_size=100
+    )
+    portfolio.to_csv(tmp_path / "in.csv", index=False)
+
+    for name, block_bytes in (("in.parquet", None), ("in.csv", 16 << 10)):
+        kwargs = {"csv_block_bytes": block_bytes} if block_bytes else {}
+        report = score_file(
+            tmp_path / name,
+            tmp_path / f"out_{name}",
+            tmp_path / "model",
+            n_jobs=2,
+            id_col="loan_id",
+            **kwargs,
+        )
+        assert report["rows"] == len(portfolio) and report["shards"] > 1
+
+        scored = pd.read_parquet(tmp_path / f"out_{name}").sort_values("loan_id")
+        np.testing.assert_allclose(
+            scored["default_probability"], expected, rtol=0, atol=1e-9
+        )
+        assert set(scored["recommendation"]) <= {"Approve", "Review", "Reject"}
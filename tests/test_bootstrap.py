@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from credit_risk.evaluation.bootstrap import (
+    _replicate_weights,
+    _SortedScores,
+    _weighted_metrics,
+    bootstrap_metrics,
+    paired_difference,
+)
+from credit_risk.evaluation.metrics import evaluate_classification
+from credit_risk.evaluation.model_comparison import compare_models
+
+
+def _scores(n=5_000, seed=0):
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, n)
+    strong = np.clip(rng.normal(0.4 + 0.2 * y, 0.15), 0, 1).round(3)
+    weak = np.clip(rng.normal(0.45 + 0.05 * y, 0.15), 0, 1).round(3)
+    return y, strong, weak
+
+
+def test_weighted_metrics_match_evaluation_on_expanded_rows():
+    y, strong, _ = _scores(2_000)
+    weights = _replicate_weights(len(y), 0, 3, "poisson", seed=1)
+
+    auc_ks = _weighted_metrics(weights, y.astype(np.int32), _SortedScores(strong))
+
+    for replicate, row in zip(weights, auc_ks):
+        idx = np.repeat(np.arange(len(y)), replicate)
+        expected = evaluate_classification(y[idx], strong[idx])
+        assert row[0] == pytest.approx(expected["roc_auc"], abs=1e-12)
+        assert row[1] == pytest.approx(expected["ks"], abs=1e-12)
+
+
+def test_weighted_metrics_with_large_tie_groups():
+    y, strong, _ = _scores(300_000)
+    tied = strong.round(1)
+    weights = np.ones((1, len(y)), dtype=np.uint8)
+
+    auc_ks = _weighted_metrics(weights, y.astype(np.int32), _SortedScores(tied))
+
+    expected = evaluate_classification(y, tied)
+    assert auc_ks[0, 0] == pytest.approx(expected["roc_auc"], abs=1e-12)
+    assert auc_ks[0, 1] == pytest.approx(expected["ks"], abs=1e-12)
+
+
+def test_bootstrap_is_reproducible_and_detects_paired_difference():
+    y, strong, weak = _scores()
+    scores = {"strong": strong, "weak": weak}
+
+    first = bootstrap_metrics(y, scores, n_replicates=60, n_jobs=2, block_size=20)
+    second = bootstrap_metrics(y, scores, n_replicates=60, n_jobs=1, block_size=20)
+
+    np.testing.assert_array_equal(
+        first["strong"]["roc_auc"], second["strong"]["roc_auc"]
+    )
+    assert paired_difference(first, "strong", "weak")["p_value"] < 0.05
+
+
+class _FixedScores:
+    def __init__(self, prob):
+        self.prob = prob
+
+    def predict_proba(self, X):
+        return np.column_stack([1 - self.prob, self.prob])
+
+
+def test_compare_models_adds_ci_columns():
+    y, strong, weak = _scores()
+    table = compare_models(
+        {"strong": _FixedScores(strong), "weak": _FixedScores(weak)},
+        X=np.zeros((len(y), 1)),
+        y=pd.Series(y),
+        n_bootstrap=40,
+        n_jobs=1,
+    )
+
+    assert list(table["model"]) == ["strong", "weak"]
+    assert (table["roc_auc_ci_low"] <= table["roc_auc"]).all()
+    assert (table["roc_auc"] <= table["roc_auc_ci_high"]).all()
+    assert table.loc[1, "p_value_vs_best"] < 0.05
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.monitoring.drift import (
+    DriftAccumulator,
+    DriftBaseline,
+    drift_from_parquet,
+    population_stability,
+)
+from credit_risk.monitoring.monitor import PredictionMonitor
+
+
+def _baseline(df):
+    feature_builder = FeatureBuilder()
+    feature_builder.build_features(df, fit=True)
+    scores = np.random.default_rng(0).beta(2, 5, len(df))
+    return DriftBaseline.build(df, scores, feature_builder), scores
+
+
+def test_no_drift_against_the_baseline_data(sample_cleaned_df, tmp_path):
+    df = sample_cleaned_df
+    baseline, scores = _baseline(df)
+    baseline.save(tmp_path / "drift_baseline.json")
+    baseline = DriftBaseline.load(tmp_path / "drift_baseline.json")
+
+    # Two shards merged == the whole baseline population
+    halves = np.array_split(np.arange(len(df)), 2)
+    accumulators = [
+        DriftAccumulator(baseline).update(df.iloc[idx], scores[idx]) for idx in halves
+    ]
+    report = accumulators[0].merge(accumulators[1]).report()
+
+    assert set(report["feature"]) >= {"score", "loan_amnt", "fico_avg", "sub_grade"}
+    assert np.allclose(report["value"], 0)
+    assert (report["status"] == "stable").all()
+
+
+def test_shifted_parquet_batches_raise_alerts(sample_cleaned_df, tmp_path):
+    df = sample_cleaned_df
+    baseline, scores = _baseline(df)
+
+    shifted = df.assign(
+        loan_amnt=df["loan_amnt"] * 3,
+        term="60 months",
+        default_probability=scores + 0.3,
+    )
+    shifted.to_parquet(tmp_path / "scored.parquet")
+
+    report = drift_from_parquet(
+        tmp_path / "scored.parquet", baseline, batch_rows=100
+    ).report()
+    status = report.set_index("feature")["status"]
+
+    assert status["loan_amnt"] == "alert"
+    assert status["term"] == "alert"
+    assert status["score"] == "alert"
+    assert status["dti"] == "stable"
+    assert report.set_index("feature").loc["score", "n"] == len(df)
+
+
+def test_population_stability_matches_formula():
+    expected, actual = np.array([50, 30, 20]), np.array([30, 30, 40])
+    e, a = expected / 100, actual / 100
+    assert population_stability(expected, actual) == pytest.approx(
+        np.sum((a - e) * np.log(a / e))
+    )
+
+
+def test_monitor_reports_drift_of_live_predictions(sample_cleaned_df):
+    df = sample_cleaned_df
+    baseline, scores = _baseline(df)
+    monitor = PredictionMonitor(baseline.bins, drift_baseline=baseline)
+
+    rows = df.drop(columns=["is_default"]).to_dict("records")
+    monitor.record(scores, np.zeros(len(rows), dtype=np.int64), rows)
+
+    report = monitor.drift_report().set_index("feature")
+    assert report.loc["score", "n"] == len(rows)
+    assert np.allclose(report["value"], 0)
@@ -0,0 +1,71 @@
+import joblib
+import numpy as np
+import pytest
+
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.incremental import incremental_retrain, rebase_logistic_scaler
+from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.models.xgboost_model import XGBoostModel
+
+
+def _base_artifacts(model, sample_cleaned_df, tmp_path):
+    train_df, new_df, holdout_df = DataSplitter().split(sample_cleaned_df)
+
+    fb = FeatureBuilder()
+    X_train, y_train = fb.build_features(train_df, fit=True)
+    model.train(X_train, y_train)
+
+    joblib.dump(model, tmp_path / "model.pkl")
+    joblib.dump(fb, tmp_path / "feature_builder.pkl")
+    return new_df, holdout_df
+
+
+def test_xgboost_incremental_retrain_adds_trees(sample_cleaned_df, tmp_path):
+    new_df, holdout_df = _base_artifacts(XGBoostModel(), sample_cleaned_df, tmp_path)
+
+    model, _, metrics = incremental_retrain(
+        tmp_path, new_df, holdout_df, n_boost_rounds=10
+    )
+
+    assert model.model.get_booster().num_boosted_rounds() == 310
+    assert 0.0 <= metrics["roc_auc"] <= 1.0
+
+    with pytest.raises(ValueError):
+        incremental_retrain(tmp_path, new_df, holdout_df, feature_mode="update")
+
+
+def test_scaler_rebase_preserves_logistic_scores(sample_cleaned_df, tmp_path):
+    new_df, holdout_df = _base_artifacts(
+        LogisticSGDModel(), sample_cleaned_df, tmp_path
+    )
+    model = joblib.load(tmp_path / "model.pkl")
+    fb = joblib.load(tmp_path / "feature_builder.pkl")
+
+    X_before, _ = fb.build_features(holdout_df, fit=False)
+    before = model.predict_proba(X_before)[:, 1]
+
+    rebase_logistic_scaler(model, fb, new_df, weight=0.5)
+
+    X_after, _ = fb.build_features(holdout_df, fit=False)
+    after = model.predict_proba(X_after)[:, 1]
+
+    assert not np.allclose(X_before, X_after)
+    np.testing.assert_allclose(before, after, rtol=1e-9, atol=1e-12)
+
+
+def test_continue_training_after_early_stopping_uses_new_trees(sample_cleaned_df):
+    train_df, val_df, holdout_df = DataSplitter().split(sample_cleaned_df)
+
+    fb = FeatureBuilder()
+    X_train, y_train = fb.build_features(train_df, fit=True)
+    X_val, y_val = fb.build_features(val_df, fit=False)
+    X_holdout, _ = fb.build_features(holdout_df, fit=False)
+
+    model = XGBoostModel().train(X_train, y_train, eval_set=[(X_val, y_val)])
+    before = model.predict_proba(X_holdout)[:, 1]
+
+    model.continue_training(X_train, 1 - y_train, n_rounds=20)
+    after = model.predict_proba(X_holdout)[:, 1]
+
+    assert not np.allclose(before, after)
@@ -0,0 +1,141 @@
+import io
+import json
+import logging
+import queue
+import sys
+import threading
+
+import pytest
+
+from credit_risk.utils.logging import (
+    DroppingQueueHandler,
+    configure_logging,
+    dropped_log_records,
+    get_logger,
+    parse_sample_rates,
+    sampled_logger,
+)
+
+
+class FormatProbe:
+    """
+    Log argument that records which threads formatted it.
+    """
+
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.get_ident())
+        return "probe"
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """
+    configure_logging writing to a StringIO; plain logging is restored after.
+    """
+
+    stream = io.StringIO()
+
+    def _configure(**kwargs):
+        # Set in the test body: pytest swaps sys.stdout after fixture setup
+        monkeypatch.setattr(sys, "stdout", stream)
+        configure_logging(level="INFO", **kwargs)
+        return stream
+
+    yield _configure
+    monkeypatch.undo()
+    configure_logging(mode="plain", level="INFO", sample_rates={})
+
+
+def test_json_mode_formats_on_the_writer_thread(configure, monkeypatch):
+    logger = get_logger("credit_risk.tests.json")
+    # pytest's log capture handlers on the root logger format on this thread
+    monkeypatch.setattr(logger, "propagate", False)
+    log_stream = configure(mode="json", sample_rates={})
+
+    probe = FormatProbe()
+    logger.info("value %s", probe, extra={"request_id": 7})
+    configure_logging(mode="plain", level="INFO", sample_rates={})  # drains the queue
+
+    record = json.loads(log_stream.getvalue().splitlines()[0])
+    assert record["message"] == "value probe"
+    assert record["level"] == "INFO"
+    assert record["logger"] == "credit_risk.tests.json"
+    assert record["request_id"] == 7
+    assert probe.threads and threading.get_ident() not in probe.threads
+
+
+def test_sampled_out_and_disabled_messages_are_never_formatted(configure):
+    logger = get_logger("credit_risk.tests.sampling")
+    log_stream = configure(mode="plain", sample_rates={"/quiet": 0.0})
+
+    probe = FormatProbe()
+    quiet = sampled_logger(logger, "/quiet")
+    quiet.info("dropped %s", probe)
+    quiet.debug("disabled %s", probe)
+    assert probe.threads == []
+
+    # Warnings are never sampled out; unconfigured routes log everything
+    quiet.warning("kept %s", probe)
+    sampled_logger(logger, "/other").info("kept too")
+    output = log_stream.getvalue()
+    assert "kept probe" in output and "kept too" in output
+    assert "dropped" not in output
+
+
+def test_sampled_logger_merges_caller_extra(configure):
+    logger = get_logger("credit_risk.tests.extra")
+    log_stream = configure(mode="plain", sample_rates={})
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+    try:
+        sampled_logger(logger, "/predict").info("scored", extra={"request_id": 7})
+    finally:
+        logger.removeHandler(handler)
+
+    assert "scored" in log_stream.getvalue()
+    assert records[0].request_id == 7
+    assert records[0].route == "/predict"
+
+
+def test_full_queue_drops_records():
+    handler = DroppingQueueHandler(queue.Queue(1))
+    logger = logging.getLogger("credit_risk.tests.dropping")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        for i in range(3):
+            logger.warning("record %d", i)
+    finally:
+        logger.removeHandler(handler)
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 2
+
+
+def test_dropped_records_are_reported_when_the_listener_stops(configure, monkeypatch):
+    logger = get_logger("credit_risk.tests.dropped")
+    monkeypatch.setattr(logger, "propagate", False)
+    log_stream = configure(mode="json", sample_rates={})
+
+    handler = logger.handlers[0]
+    handler.dropped = 3
+    assert dropped_log_records() == 3
+    configure_logging(mode="plain", level="INFO", sample_rates={})
+
+    record = json.loads(log_stream.getvalue().splitlines()[-1])
+    assert record["level"] == "WARNING"
+    assert "3 records were dropped" in record["message"]
+    assert dropped_log_records() == 0
+
+
+def test_parse_sample_rates():
+    assert parse_sample_rates("/predict=0.01, /predict/batch=0.5,") == {
+        "/predict": 0.01,
+        "/predict/batch": 0.5,
+    }
+    assert parse_sample_rates("") == {}
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from sklearn.metrics import confusion_matrix, roc_auc_score, roc_curve
+
+from credit_risk.evaluation.metrics import MetricsAccumulator, evaluate_classification
+
+
+def _scores(n=50_000, seed=0):
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, n)
+    # Rounded scores create many ties
+    prob = np.clip(rng.normal(0.4 + 0.2 * y, 0.2), 0, 1).round(3)
+    return y, prob
+
+
+def test_evaluate_classification_matches_sklearn():
+    y, prob = _scores()
+    metrics = evaluate_classification(y, prob, threshold=0.5)
+
+    fpr, tpr, _ = roc_curve(y, prob)
+    assert metrics["roc_auc"] == pytest.approx(roc_auc_score(y, prob), abs=1e-12)
+    assert metrics["ks"] == pytest.approx(np.max(tpr - fpr), abs=1e-12)
+    assert metrics["gini"] == pytest.approx(2 * metrics["roc_auc"] - 1)
+    np.testing.assert_array_equal(
+        metrics["confusion_matrix"], confusion_matrix(y, (prob >= 0.5).astype(int))
+    )
+
+
+def test_histogram_accumulator_merges_chunks_within_error_bound():
+    y, prob = _scores(seed=1)
+    exact = evaluate_classification(y, prob)
+
+    shards = [
+        MetricsAccumulator(n_bins=1000).update(y[idx], prob[idx])
+        for idx in np.array_split(np.arange(len(y)), 4)
+    ]
+    merged = shards[0] + shards[1] + shards[2] + shards[3]
+    approx = merged.compute(threshold=0.5)
+
+    assert merged.count == len(y)
+    assert abs(approx["roc_auc"] - exact["roc_auc"]) <= approx["auc_error_bound"]
+    assert abs(approx["ks"] - exact["ks"]) <= approx["ks_error_bound"]
+    np.testing.assert_array_equal(
+        approx["confusion_matrix"], exact["confusion_matrix"]
+    )
+
+
+def test_single_class_raises():
+    with pytest.raises(ValueError):
+        evaluate_classification(np.zeros(10), np.linspace(0, 1, 10))
+
+
+def test_non_finite_scores_raise():
+    y, prob = _scores(100)
+    prob[3] = np.nan
+
+    with pytest.raises(ValueError, match="NaN"):
+        evaluate_classification(y, prob)
+    with pytest.raises(ValueError, match="NaN"):
+        MetricsAccumulator().update(y, prob)
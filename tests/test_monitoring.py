@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from api.app import create_app
+from api.dependencies import get_artifacts
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.decision import risk_bucket
+from credit_risk.models.serving import BoosterPredictor
+from credit_risk.models.xgboost_model import XGBoostModel
+from credit_risk.monitoring.bins import FeatureBins
+from credit_risk.monitoring.monitor import PredictionMonitor
+
+
+def _monitor(df, **kwargs):
+    feature_builder = FeatureBuilder()
+    feature_builder.build_features(df, fit=True)
+    bins = FeatureBins.from_feature_builder(feature_builder)
+    return PredictionMonitor(bins, **kwargs)
+
+
+def test_monitor_counts_scores_decisions_and_inputs(sample_cleaned_df, tmp_path):
+    df = sample_cleaned_df.drop(columns=["is_default"])
+    monitor = _monitor(df, output_dir=tmp_path, window_seconds=60)
+    rows = df.to_dict("records")
+    probs = np.random.default_rng(0).random(len(rows))
+    buckets = risk_bucket(probs)
+
+    # One request per row, as the /predict route records them
+    for i, row in enumerate(rows):
+        monitor.record(probs[i : i + 1], buckets[i : i + 1], [row])
+
+    snapshot = monitor.snapshot()
+    assert snapshot["n"] == len(rows)
+    assert sum(snapshot["score_counts"]) == len(rows)
+    assert snapshot["decisions"]["Approve"] == int((probs < 0.30).sum())
+    assert snapshot["features"]["term"]["36 months"] == int(
+        (df["term"] == "36 months").sum()
+    )
+    assert sum(snapshot["features"]["loan_amnt"].values()) == len(rows)
+    assert sum(w["n"] for w in snapshot["windows"]) == len(rows)
+
+    path = monitor.flush(now=float("inf"))
+    flushed = pd.read_parquet(path)
+    decisions = flushed[flushed["metric"] == "decision"]
+    assert decisions["count"].sum() == len(rows)
+    assert monitor.flush(now=float("inf")) is None
+
+
+def test_record_keeps_scores_of_reused_predictor_buffers(sample_cleaned_df):
+    df = sample_cleaned_df.drop(columns=["is_default"])
+    feature_builder = FeatureBuilder()
+    X, y = feature_builder.build_features(sample_cleaned_df, fit=True)
+    predictor = BoosterPredictor.from_model(XGBoostModel().train(X, y))
+    monitor = PredictionMonitor(FeatureBins.from_feature_builder(feature_builder))
+
+    # Two requests in a row on one thread share the predictor's buffer
+    expected = []
+    for rows in (slice(0, 3), slice(3, 6)):
+        probs = predictor.predict_proba(X[rows])[:, 1]
+        expected.append(probs.copy())
+        monitor.record(probs, risk_bucket(probs), df.iloc[rows].to_dict("records"))
+
+    expected = np.concatenate(expected).astype(np.float64)
+    assert not np.allclose(expected[:3], expected[3:])
+    snapshot = monitor.snapshot()
+    assert snapshot["n"] == 6
+    assert np.isclose(snapshot["mean_score"], expected.mean())
+
+
+def test_snapshot_endpoint_sees_predictions(sample_cleaned_df):
+    df = sample_cleaned_df.drop(columns=["is_default"])
+    monitor = _monitor(df)
+
+    class ConstantScorer:
+        def predict_positive(self, frame):
+            return np.full(len(frame), 0.45)
+
+    app = create_app()
+    app.dependency_overrides[get_artifacts] = lambda: {
+        "scorer": ConstantScorer(),
+        "model_name": "logistic",
+        "monitor": monitor,
+    }
+    client = TestClient(app)
+
+    payload = df.iloc[0].to_dict()
+    payload["grade"] = payload["sub_grade"][0]
+    assert client.post("/predict", json=payload).status_code == 200
+
+    snapshot = client.get("/monitoring/snapshot").json()
+    assert snapshot["n"] == 1
+    assert snapshot["decisions"] == {"Approve": 0, "Review": 1, "Reject": 0}
+    assert snapshot["dropped_log_records"] == 0
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.models.orchestrator import train_models
+from credit_risk.models.predict import load_calibrator, load_drift_baseline
+from credit_risk.utils.config import threshold_config
+
+
+def test_train_models_shares_one_feature_pass(sample_cleaned_df, tmp_path):
+    train_df, val_df, _ = DataSplitter().split(sample_cleaned_df)
+    # Thresholds chosen for a previous model.pkl
+    (tmp_path / "xgboost").mkdir()
+    (tmp_path / "xgboost" / threshold_config.FILENAME).write_text("{}")
+
+    comparison_df = train_models(
+        ["logistic", "xgboost"], train_df, val_df, n_jobs=2, output_root=tmp_path
+    )
+
+    assert set(comparison_df["model"]) == {"logistic", "xgboost"}
+    assert comparison_df["roc_auc"].is_monotonic_decreasing
+
+    for name in ("logistic", "xgboost"):
+        model_dir = tmp_path / name
+        assert (model_dir / "model.pkl").exists()
+        assert (model_dir / "feature_builder.pkl").exists()
+        metrics = json.loads((model_dir / "metrics.json").read_text())
+        assert "roc_auc" in metrics and "calibration" in metrics
+        assert load_calibrator(model_dir) is not None
+        assert load_drift_baseline(model_dir) is not None
+        assert not (model_dir / threshold_config.FILENAME).exists()
+
+
+def test_failed_model_leaves_existing_artifacts_untouched(sample_cleaned_df, tmp_path):
+    train_df, val_df, _ = DataSplitter().split(sample_cleaned_df)
+    (tmp_path / "logistic").mkdir()
+    (tmp_path / "logistic" / "model.pkl").write_bytes(b"previous run")
+
+    with pytest.raises(ValueError):
+        train_models(
+            ["logistic", "unknown"], train_df, val_df, n_jobs=2, output_root=tmp_path
+        )
+
+    assert (tmp_path / "logistic" / "model.pkl").read_bytes() == b"previous run"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["logistic"]
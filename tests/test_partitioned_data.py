@@ -0,0 +1,41 @@
+import pandas as pd
+
+from credit_risk.data.partitioned_data import (
+    PartitionedDataset,
+    write_partitioned_dataset,
+)
+
+
+def test_partitioned_splits_are_time_ordered(sample_cleaned_df, tmp_path):
+    write_partitioned_dataset(sample_cleaned_df, tmp_path / "cleaned")
+    dataset = PartitionedDataset(tmp_path / "cleaned")
+
+    assert dataset.partitions()["num_rows"].sum() == len(sample_cleaned_df)
+
+    train_df, val_df, test_df = dataset.load_splits()
+
+    assert len(train_df) + len(val_df) + len(test_df) == len(sample_cleaned_df)
+    assert train_df["issue_d"].max() < val_df["issue_d"].min()
+    assert val_df["issue_d"].max() < test_df["issue_d"].min()
+
+
+def test_rewrite_drops_partitions_missing_from_new_data(sample_cleaned_df, tmp_path):
+    path = tmp_path / "cleaned"
+    write_partitioned_dataset(sample_cleaned_df, path)
+
+    latest = sample_cleaned_df[sample_cleaned_df["issue_d"].str.endswith("2018")]
+    write_partitioned_dataset(latest, path)
+
+    partitions = PartitionedDataset(path).partitions()
+    assert partitions["num_rows"].sum() == len(latest)
+    assert set(partitions["issue_year"]) == {2018}
+
+
+def test_load_split_reads_only_requested_columns(sample_cleaned_df, tmp_path):
+    write_partitioned_dataset(sample_cleaned_df, tmp_path / "cleaned")
+    dataset = PartitionedDataset(tmp_path / "cleaned")
+
+    val_df = dataset.load_split("val", columns=["issue_d", "is_default"])
+
+    assert list(val_df.columns) == ["issue_d", "is_default"]
+    assert pd.api.types.is_datetime64_any_dtype(val_df["issue_d"])
@@ -0,0 +1,63 @@
+import numpy as np
+
+from credit_risk.evaluation.permutation import feature_groups, permutation_importance
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.logistic_model import LogisticSGDModel
+
+
+def _fitted(df):
+    # Defaults driven by sub_grade, so its one-hot block matters most
+    df = df.assign(is_default=(df["sub_grade"] == "D4").astype(int))
+    feature_builder = FeatureBuilder()
+    X, y = feature_builder.build_features(df, fit=True)
+    model = LogisticSGDModel().train(X, y)
+    return model, feature_builder, X, y
+
+
+def test_feature_groups_cover_every_column_once(sample_cleaned_df):
+    _, feature_builder, X, _ = _fitted(sample_cleaned_df)
+    groups = feature_groups(feature_builder)
+
+    columns = np.concatenate(list(groups.values()))
+    assert sorted(columns) == list(range(X.shape[1]))
+    assert len(groups["sub_grade"]) == 4
+    assert len(groups["fico_avg"]) == 1
+
+
+def test_permutation_importance_ranks_the_informative_field(sample_cleaned_df):
+    model, feature_builder, X, y = _fitted(sample_cleaned_df)
+
+    table = permutation_importance(
+        model, feature_builder, X, y, n_repeats=3, n_jobs=2, chunk_rows=250
+    )
+
+    assert table.loc[0, "field"] == "sub_grade"
+    assert table.loc[0, "kind"] == "categorical"
+    assert table.loc[0, "auc_drop"] > 0.2
+    assert len(table) == len(feature_groups(feature_builder))
+
+    # Same result whatever the number of workers
+    serial = permutation_importance(model, feature_builder, X, y, n_repeats=3, n_jobs=1)
+    merged = table.merge(serial, on="field")
+    assert np.allclose(merged["auc_drop_x"], merged["auc_drop_y"])
+
+
+def test_permutation_importance_is_cached_per_model_digest(
+    sample_cleaned_df, tmp_path
+):
+    model, feature_builder, X, y = _fitted(sample_cleaned_df)
+    kwargs = dict(n_repeats=2, n_jobs=1, cache_dir=tmp_path)
+
+    first = permutation_importance(
+        model, feature_builder, X, y, model_digest="abc", **kwargs
+    )
+    assert len(list(tmp_path.glob("*.csv"))) == 1
+
+    # A cache hit never scores, so a model that cannot predict still works
+    cached = permutation_importance(
+        None, feature_builder, X, y, model_digest="abc", **kwargs
+    )
+    assert np.allclose(cached["auc_drop"], first["auc_drop"])
+
+    permutation_importance(model, feature_builder, X, y, model_digest="def", **kwargs)
+    assert len(list(tmp_path.glob("*.csv"))) == 2
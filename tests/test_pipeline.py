@@ -0,0 +1,62 @@
+from credit_risk.pipeline.dag import Pipeline, Stage
+from credit_risk.utils.config import SplitConfig
+
+CALLS = []
+
+
+def source_stage():
+    CALLS.append("source")
+    return 2
+
+
+def double_stage(source):
+    CALLS.append("double")
+    return source * 2
+
+
+def square_stage(source):
+    CALLS.append("square")
+    return source**2
+
+
+def total_stage(double, square):
+    CALLS.append("total")
+    return double + square
+
+
+def _pipeline(cache_dir, split_config):
+    return Pipeline(
+        [
+            Stage("source", source_stage),
+            Stage("double", double_stage, deps=("source",), configs=(split_config,)),
+            Stage("square", square_stage, deps=("source",)),
+            Stage("total", total_stage, deps=("double", "square")),
+        ],
+        cache_dir=cache_dir,
+    )
+
+
+def test_pipeline_skips_cached_stages(tmp_path):
+    CALLS.clear()
+    pipeline = _pipeline(tmp_path, SplitConfig())
+    pipeline.run()
+
+    assert pipeline.output("total") == 8
+    assert sorted(CALLS) == ["double", "source", "square", "total"]
+
+    CALLS.clear()
+    runs = _pipeline(tmp_path, SplitConfig()).run()
+
+    assert CALLS == []
+    assert {run.status for run in runs} == {"cached"}
+
+
+def test_config_change_reruns_downstream_only(tmp_path):
+    _pipeline(tmp_path, SplitConfig()).run()
+
+    CALLS.clear()
+    pipeline = _pipeline(tmp_path, SplitConfig(TRAIN_FRAC=0.6))
+    pipeline.run()
+
+    assert sorted(CALLS) == ["double", "total"]
+    assert pipeline.output("total") == 8
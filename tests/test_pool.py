@@ -0,0 +1,33 @@
+import numpy as np
+
+from credit_risk.utils import threads
+from credit_risk.utils.pool import (
+    load_shared_matrices,
+    worker_pool,
+    write_shared_matrices,
+)
+
+_WORKER_STATE = {}
+
+
+def _init_worker(matrix_dir):
+    _WORKER_STATE.update(load_shared_matrices(matrix_dir, ("X", "y")))
+
+
+def _read_worker_state(row):
+    X = _WORKER_STATE["X"]
+    return threads.current_threads(), X.flags.writeable, float(X[row].sum())
+
+
+def test_worker_pool_applies_budget_and_shares_matrices(tmp_path, monkeypatch):
+    monkeypatch.setenv("CREDIT_RISK_CPUS", "4")
+    X = np.arange(12, dtype=np.float32).reshape(4, 3)
+    write_shared_matrices(tmp_path, X=X, y=np.array([0, 1, 0, 1], dtype=np.int8))
+
+    with worker_pool(2, _init_worker, (str(tmp_path),)) as pool:
+        results = list(pool.map(_read_worker_state, range(4)))
+
+    assert [n_threads for n_threads, _, _ in results] == [2] * 4
+    assert not any(writeable for _, writeable, _ in results)
+    assert [total for _, _, total in results] == X.sum(axis=1).tolist()
+    assert load_shared_matrices(tmp_path, ("y",))["y"].dtype == np.int8
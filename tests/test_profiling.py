@@ -0,0 +1,52 @@
+import time
+
+import numpy as np
+import pytest
+
+from credit_risk.utils.profiling import StageProfiler, diff_profiles
+
+
+def test_stage_profiler_records_time_memory_and_shape(tmp_path):
+    profiler = StageProfiler(trace_allocations=True, profile_slowest=True)
+
+    with profiler.stage("allocate") as stage:
+        stage.record(np.ones((1000, 50)))
+    with profiler.stage("noop"):
+        pass
+
+    report = profiler.write(tmp_path / "profile.json")
+    allocate, noop = report["stages"]
+
+    assert allocate["rows"] == 1000 and allocate["cols"] == 50
+    assert allocate["allocated_peak_bytes"] >= 1000 * 50 * 8
+    assert allocate["peak_rss_mb"] > 0
+    assert report["slowest_stage_profile"]["stage"] in {"allocate", "noop"}
+    assert (tmp_path / "profile.json").exists()
+
+    diff = diff_profiles(report, report)
+    assert [row["ratio"] for row in diff if row["baseline"]] == [1.0] * len(
+        [row for row in diff if row["baseline"]]
+    )
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_slowest_stage_is_sampled_and_settings_gate_the_diff():
+    profiler = StageProfiler(profile_slowest=True)
+    with profiler.stage("busy"):
+        _busy(0.3)
+
+    report = profiler.report()
+    profile = report["slowest_stage_profile"]
+    assert profile["stage"] == "busy" and profile["samples"] > 0
+    assert any("(_busy)" in row["function"] for row in profile["top_functions"])
+
+    unprofiled = StageProfiler()
+    with unprofiled.stage("busy"):
+        _busy(0.01)
+    with pytest.raises(ValueError, match="different settings"):
+        diff_profiles(unprofiled.report(), report)
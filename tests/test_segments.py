@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from credit_risk.evaluation.metrics import evaluate_classification
+from credit_risk.evaluation.segments import segment_metrics
+
+
+def _scored(df, seed=0):
+    rng = np.random.default_rng(seed)
+    y = df["is_default"].to_numpy()
+    scores = {
+        "strong": np.clip(rng.normal(0.3 + 0.3 * y, 0.2), 0, 1).round(2),
+        "weak": rng.random(len(y)),
+    }
+    return y, scores
+
+
+def test_segment_metrics_match_per_segment_evaluation(sample_cleaned_df):
+    df = sample_cleaned_df
+    y, scores = _scored(df)
+
+    table = segment_metrics(
+        df,
+        y,
+        scores,
+        by=["sub_grade", "term", "issue_vintage"],
+        min_count=50,
+        min_class_count=1,
+    )
+
+    for (model, column, segment), row in table.set_index(
+        ["model", "column", "segment"]
+    ).iterrows():
+        if column == "all":
+            mask = np.ones(len(df), dtype=bool)
+        elif column == "issue_vintage":
+            mask = df["issue_d"].str[-4:].to_numpy() == segment
+        else:
+            mask = df[column].to_numpy() == segment
+
+        assert row["n"] == mask.sum()
+        assert row["default_rate"] == pytest.approx(y[mask].mean())
+        assert row["small_segment"] == (
+            mask.sum() < 50 or y[mask].min() == y[mask].max()
+        )
+        if y[mask].min() == y[mask].max():
+            assert np.isnan(row["roc_auc"])
+            continue
+
+        expected = evaluate_classification(y[mask], scores[model][mask])
+        assert row["roc_auc"] == pytest.approx(expected["roc_auc"])
+        assert row["ks"] == pytest.approx(expected["ks"])
+
+
+def test_single_class_segment_is_flagged(sample_cleaned_df):
+    df = sample_cleaned_df.copy()
+    df.loc[df["term"] == "60 months", "is_default"] = 0
+    y, scores = _scored(df)
+
+    table = segment_metrics(df, y, scores["strong"], by=["term"])
+    row = table[table["segment"] == "60 months"].iloc[0]
+
+    assert np.isnan(row["roc_auc"]) and np.isnan(row["ks"])
+    assert row["small_segment"]
@@ -0,0 +1,65 @@
+import numpy as np
+
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.logistic_model import LogisticSGDModel
+from credit_risk.models.serving import (
+    BoosterPredictor,
+    FusedLinearScorer,
+    serving_model,
+)
+from credit_risk.models.xgboost_model import XGBoostModel
+
+
+def test_booster_predictor_matches_sklearn_wrapper(sample_cleaned_df):
+    train_df, val_df, _ = DataSplitter().split(sample_cleaned_df)
+
+    fb = FeatureBuilder()
+    X_train, y_train = fb.build_features(train_df, fit=True)
+    X_val, y_val = fb.build_features(val_df, fit=False)
+
+    model = XGBoostModel().train(X_train, y_train, eval_set=[(X_val, y_val)])
+    predictor = serving_model(model)
+    expected = model.predict_proba(X_val)
+
+    assert isinstance(predictor, BoosterPredictor)
+    np.testing.assert_allclose(predictor.predict_proba(X_val), expected, atol=1e-6)
+    np.testing.assert_allclose(
+        predictor.predict_proba(X_val[:1]), expected[:1], atol=1e-6
+    )
+
+    # Batches larger than the buffer are scored in chunks
+    small = BoosterPredictor.from_model(model, max_batch=7)
+    np.testing.assert_allclose(
+        small.predict_positive(X_val), expected[:, 1], atol=1e-6
+    )
+
+
+def test_fused_linear_scorer_matches_sklearn_pipeline(sample_cleaned_df, tmp_path):
+    train_df, val_df, _ = DataSplitter().split(sample_cleaned_df)
+
+    fb = FeatureBuilder()
+    X_train, y_train = fb.build_features(train_df, fit=True)
+    model = LogisticSGDModel().train(X_train, y_train)
+
+    # Missing values and an unseen category go through imputation / ignore
+    raw = val_df.drop(columns=["is_default"]).reset_index(drop=True)
+    raw.loc[0, "dti"] = np.nan
+    raw.loc[1, "pub_rec"] = np.nan
+    raw.loc[2, "purpose"] = None
+    raw.loc[3, "addr_state"] = "ZZ"
+
+    X_val, _ = fb.build_features(raw, fit=False)
+    expected = model.model.decision_function(X_val)
+
+    scorer = FusedLinearScorer.from_artifacts(model, fb)
+    scorer.save(tmp_path / "fused.npz")
+    loaded = FusedLinearScorer.load(tmp_path / "fused.npz")
+
+    for fused in (scorer, loaded):
+        np.testing.assert_allclose(
+            fused.decision_function(raw), expected, rtol=0, atol=1e-9
+        )
+        np.testing.assert_allclose(
+            fused.predict_proba(raw), model.predict_proba(X_val), rtol=0, atol=1e-9
+        )
@@ -0,0 +1,65 @@
+import numpy as np
+
+from credit_risk.data.partitioned_data import write_partitioned_dataset
+from credit_risk.data.shards import (
+    ParquetShardSource,
+    cached_feature_shards,
+    prefetch,
+    write_feature_shards,
+)
+from credit_risk.features.build_features import FeatureBuilder
+from credit_risk.models.logistic_model import LogisticSGDModel
+
+
+def test_prefetch_preserves_order_and_stops_early():
+    items = list(range(200))
+    assert list(prefetch(lambda x: x * 2, items, depth=4)) == [x * 2 for x in items]
+
+    seen = []
+    for value in prefetch(lambda x: x, range(1000)):
+        seen.append(value)
+        if value == 3:
+            break
+    assert seen == [0, 1, 2, 3]
+
+
+def test_logistic_streaming_training_and_warm_start(sample_cleaned_df, tmp_path):
+    write_partitioned_dataset(sample_cleaned_df, tmp_path / "cleaned")
+    source = ParquetShardSource(tmp_path / "cleaned")
+
+    fb = FeatureBuilder()
+    fb.build_features(source.sample(200, seed=0), fit=True)
+    shards = write_feature_shards(source, fb, tmp_path / "shards")
+
+    assert len(shards) == len(source)
+
+    model = LogisticSGDModel().train_streaming(shards.read, len(shards), n_epochs=2)
+    steps = model.model.t_
+
+    X, _ = fb.build_features(sample_cleaned_df, fit=False)
+    assert model.predict_proba(X).shape == (len(sample_cleaned_df), 2)
+
+    model.train_streaming(shards.read, len(shards), n_epochs=1)
+    assert model.model.t_ > steps
+
+
+def test_cached_feature_shards_follow_the_feature_builder(sample_cleaned_df, tmp_path):
+    df = sample_cleaned_df.head(300)
+    write_partitioned_dataset(df, tmp_path / "cleaned")
+    source = ParquetShardSource(tmp_path / "cleaned")
+    cache_root = tmp_path / "shards"
+
+    fb = FeatureBuilder()
+    fb.build_features(source.sample(200, seed=0), fit=True)
+    shards = cached_feature_shards(source, fb, cache_root)
+    assert cached_feature_shards(source, fb, cache_root).shard_dir == shards.shard_dir
+
+    # A builder refit on another sample gets its own shards; the old ones go
+    refit = FeatureBuilder()
+    refit.build_features(df.head(100), fit=True)
+    refit_shards = cached_feature_shards(source, refit, cache_root)
+
+    assert refit_shards.shard_dir != shards.shard_dir
+    assert [p.name for p in cache_root.iterdir()] == [refit_shards.shard_dir.name]
+    X, _ = refit.build_features(source.read(0), fit=False)
+    np.testing.assert_allclose(refit_shards.read(0)[0], X.astype(np.float32))
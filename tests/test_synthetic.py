@@ -0,0 +1,55 @@
+import numpy as np
+
+from api.schemas import LoanRequest
+from credit_risk.data.clean_data import DataCleaner
+from credit_risk.data.load_data import USE_COLS, load_raw_data
+from credit_risk.data.synthetic import (
+    request_rows,
+    synthetic_cleaned_loans,
+    synthetic_raw_loans,
+    write_synthetic_csv,
+)
+from credit_risk.features.build_features import FeatureBuilder
+
+
+def test_raw_loans_follow_the_csv_schema():
+    raw = synthetic_raw_loans(20_000, seed=1)
+
+    assert list(raw.columns) == USE_COLS
+    assert raw.equals(synthetic_raw_loans(20_000, seed=1))
+    assert set(raw["term"]) == {" 36 months", " 60 months"}
+    assert raw["issue_d"].str.match(r"^[A-Z][a-z]{2}-\d{4}$").all()
+    assert (raw["fico_range_high"] >= raw["fico_range_low"]).all()
+
+    # Defaults rise with the grade
+    finished = raw[raw["loan_status"].isin(["Fully Paid", "Charged Off"])]
+    default = finished["loan_status"] == "Charged Off"
+    by_grade = default.groupby(finished["sub_grade"].str[0]).mean()
+    assert 0.15 < default.mean() < 0.25
+    assert by_grade["A"] < by_grade["C"] < by_grade["E"]
+
+    cleaned = DataCleaner().clean(raw)
+    assert len(cleaned) == len(finished)
+
+
+def test_cleaned_loans_build_features(sample_cleaned_df):
+    df = synthetic_cleaned_loans(5000)
+
+    assert len(df) == 5000
+    assert set(sample_cleaned_df.columns) <= set(df.columns)
+    X, y = FeatureBuilder().build_features(df, fit=True)
+    assert X.shape[0] == 5000
+    assert not np.isnan(X).any()
+
+
+def test_csv_round_trip_and_request_rows(tmp_path):
+    path = write_synthetic_csv(tmp_path / "raw.csv", 2500, chunk_rows=1000)
+    raw = load_raw_data(path=path)
+    assert raw.shape == (2500, len(USE_COLS))
+
+    rows = request_rows(synthetic_cleaned_loans(10))
+    assert len(rows) == 10
+    assert rows[0]["term"] in {"36 months", "60 months"}
+    assert "is_default" not in rows[0]
+    for row in rows:
+        LoanRequest(**row)
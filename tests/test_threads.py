@@ -0,0 +1,60 @@
+import os
+import pickle
+
+import numpy as np
+from threadpoolctl import threadpool_info
+
+from credit_risk.models.xgboost_model import XGBoostModel
+from credit_risk.utils import threads
+
+
+def test_thread_budget_splits_cores_between_workers(monkeypatch):
+    monkeypatch.setenv("CREDIT_RISK_CPUS", "8")
+
+    assert threads.available_cores() == 8
+    assert threads.thread_budget(1).threads == 8
+    assert threads.thread_budget(3).threads == 2
+    assert threads.thread_budget(16).threads == 1
+
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    assert threads.api_workers() == 4
+    assert threads.serving_threads() == 1
+
+
+def test_apply_thread_budget_limits_native_pools_and_xgboost(monkeypatch):
+    for var in threads.NATIVE_THREAD_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(threads, "_STATE", {"threads": None, "limits": None})
+
+    try:
+        threads.apply_thread_budget(1)
+
+        assert all(pool["num_threads"] == 1 for pool in threadpool_info())
+        assert threads.resolve_n_jobs(-1) == 1
+        assert threads.resolve_n_jobs(3) == 3
+        assert XGBoostModel().model.get_params()["n_jobs"] == 1
+    finally:
+        threads._STATE["limits"].restore_original_limits()
+
+
+def test_pickled_xgboost_resolves_threads_in_the_loading_process(monkeypatch):
+    X = np.random.default_rng(0).random((200, 3))
+    model = XGBoostModel()
+    model.model.fit(X, (X[:, 0] > 0.5).astype(int))
+
+    monkeypatch.setattr(threads, "_STATE", {"threads": 3, "limits": None})
+    loaded = pickle.loads(pickle.dumps(model))
+
+    assert loaded.model.n_jobs == 3
+    np.testing.assert_allclose(loaded.predict_proba(X), model.predict_proba(X))
+
+
+def test_importing_the_app_leaves_thread_pools_alone():
+    def native_env():
+        return {var: os.environ.get(var) for var in threads.NATIVE_THREAD_ENV_VARS}
+
+    before = native_env()
+    from api.app import create_app
+
+    create_app()
+    assert native_env() == before
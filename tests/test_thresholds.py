@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from credit_risk.evaluation.thresholds import optimize_thresholds, save_thresholds
+from credit_risk.models.artifacts import file_digest
+from credit_risk.models.predict import load_decision_thresholds
+
+
+def _portfolio(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    y = rng.random(n) < 0.2
+    prob = np.clip(rng.normal(0.25 + 0.3 * y, 0.15), 0, 1).round(2)
+    amount = rng.uniform(1000, 35000, n)
+    rate = rng.uniform(5, 25, n)
+    return y, prob, amount, rate
+
+
+def _profit(low, high, y, prob, amount, rate, review_cost, lgd=0.6):
+    approve, review = prob < low, (prob >= low) & (prob < high)
+    gain = amount * rate / 100
+    return (
+        np.sum(np.where(y, -lgd * amount, gain)[approve])
+        + np.sum(gain[review & ~y])
+        - review_cost * review.sum()
+    )
+
+
+def test_chosen_bands_match_brute_force_search():
+    y, prob, amount, rate = _portfolio()
+    chosen, curve = optimize_thresholds(
+        y, prob, amount, rate, review_cost=200.0, max_review_rate=0.2
+    )
+
+    candidates = np.r_[np.unique(prob), 1.0]
+    best = max(
+        _profit(low, high, y, prob, amount, rate, 200.0)
+        for low in candidates
+        for high in candidates
+        if low <= high and ((prob >= low) & (prob < high)).mean() <= 0.2
+    )
+
+    low, high = chosen["low_risk_threshold"], chosen["high_risk_threshold"]
+    assert chosen["metrics"]["profit"] == pytest.approx(best)
+    assert _profit(low, high, y, prob, amount, rate, 200.0) == pytest.approx(best)
+    assert chosen["metrics"]["review_rate"] <= 0.2
+    assert curve["profit"].max() == pytest.approx(best)
+
+
+def test_thresholds_are_tied_to_the_model(tmp_path):
+    (tmp_path / "model.pkl").write_bytes(b"model")
+    chosen, _ = optimize_thresholds(*_portfolio())
+    digest = file_digest(tmp_path / "model.pkl")
+    save_thresholds(chosen, tmp_path / "thresholds.json", digest)
+
+    assert load_decision_thresholds(tmp_path) == {
+        "low": chosen["low_risk_threshold"],
+        "high": chosen["high_risk_threshold"],
+    }
+
+    (tmp_path / "model.pkl").write_bytes(b"retrained")
+    assert load_decision_thresholds(tmp_path) == {}
+
+
+def test_undefined_metrics_are_stored_as_null(tmp_path):
+    y, prob, amount, rate = _portfolio()
+    # Every loan defaults, so the best band approves nobody
+    chosen, curve = optimize_thresholds(
+        np.ones_like(y), prob, amount, rate, max_review_rate=0.0
+    )
+
+    assert chosen["metrics"]["approval_rate"] == 0.0
+    assert chosen["metrics"]["approved_default_rate"] is None
+    assert curve["approved_default_rate"].iloc[1:].between(0, 1).all()
+
+    save_thresholds(chosen, tmp_path / "thresholds.json")
+    assert "NaN" not in (tmp_path / "thresholds.json").read_text()
@@ -0,0 +1,61 @@
+import pytest
+
+from credit_risk.data.split_data import DataSplitter
+from credit_risk.tuning.study import Study
+from credit_risk.tuning.successive_halving import (
+    SuccessiveHalvingSearch,
+    prepare_tuning_data,
+    rung_resources,
+)
+
+
+def test_rung_resources_are_geometric():
+    assert rung_resources(1, 27, 3) == [1, 3, 9, 27]
+    assert rung_resources(30, 100, 3) == [30, 90, 100]
+
+
+def test_successive_halving_resumes_from_study(sample_cleaned_df, tmp_path):
+    train_df, val_df, _ = DataSplitter().split(sample_cleaned_df)
+    data_dir = prepare_tuning_data(train_df, val_df, tmp_path / "data")
+
+    study = Study("logistic_test", tmp_path / "study.sqlite3")
+    search = SuccessiveHalvingSearch("logistic", data_dir, study, n_workers=2)
+    search.resources = [1, 3]
+
+    best = search.run(n_configs=4)
+    n_evaluations = len(study.completed())
+
+    assert n_evaluations == 4 + 4 // 3
+    assert best["resource"] == 3
+
+    search.run(n_configs=4)
+    assert len(study.completed()) == n_evaluations
+
+
+def test_study_refuses_to_resume_on_other_data(sample_cleaned_df, tmp_path):
+    train_df, val_df, _ = DataSplitter().split(sample_cleaned_df)
+    data_dir = prepare_tuning_data(train_df, val_df, tmp_path / "data")
+    changed = train_df.assign(int_rate=train_df["int_rate"] + 1)
+    other_dir = prepare_tuning_data(changed, val_df, tmp_path / "data")
+
+    study = Study("logistic_test", tmp_path / "study.sqlite3")
+    study.bind(SuccessiveHalvingSearch("logistic", data_dir, study).settings())
+    study.bind(SuccessiveHalvingSearch("logistic", data_dir, study).settings())
+
+    for search in (
+        SuccessiveHalvingSearch("logistic", other_dir, study),
+        SuccessiveHalvingSearch("logistic", data_dir, study, seed=7),
+    ):
+        with pytest.raises(ValueError, match="different settings"):
+            search.run(n_configs=4)
+    assert study.completed() == {}
+
+
+def test_tuning_data_cache_is_keyed_by_the_data(sample_cleaned_df, tmp_path):
+    train_df, val_df, _ = DataSplitter().split(sample_cleaned_df)
+
+    data_dir = prepare_tuning_data(train_df, val_df, tmp_path)
+    assert prepare_tuning_data(train_df, val_df, tmp_path) == data_dir
+
+    changed = train_df.assign(int_rate=train_df["int_rate"] + 1)
+    assert prepare_tuning_data(changed, val_df, tmp_path) != data_dir
@@ -1,3 +1,6 @@
+import numpy as np
+from sklearn.metrics import roc_auc_score
+
 from credit_risk.models.xgboost_model import XGBoostModel
 from credit_risk.features.build_features import FeatureBuilder
 from credit_risk.data.split_data import DataSplitter
@@ -19,3 +22,50 @@ def test_xgboost_model_train_predict(sample_cleaned_df):
     preds = model.predict_proba(X_val)
 
     assert len(preds) == len(X_val)
+
+
+def test_xgboost_external_memory_matches_in_memory(sample_cleaned_df, tmp_path):
+    df = sample_cleaned_df.head(5000)
+
+    splitter = DataSplitter()
+    train_df, val_df, _ = splitter.split(df)
+
+    fb = FeatureBuilder()
+    X_train, y_train = fb.build_features(train_df, fit=True)
+    X_val, y_val = fb.build_features(val_df, fit=False)
+
+    X_train = X_train.astype(np.float32)
+    shards = np.array_split(np.arange(len(X_train)), 4)
+
+    def load_shard(i):
+        return X_train[shards[i]], y_train.to_numpy()[shards[i]]
+
+    external = XGBoostModel().train_external_memory(
+        load_shard, len(shards), cache_dir=tmp_path
+    )
+    in_memory = XGBoostModel().train(X_train, y_train)
+
+    auc_external = roc_auc_score(y_val, external.predict_proba(X_val)[:, 1])
+    auc_in_memory = roc_auc_score(y_val, in_memory.predict_proba(X_val)[:, 1])
+
+    assert external.predict_proba(X_val).shape == (len(X_val), 2)
+    assert abs(auc_external - auc_in_memory) < 0.05
+
+
+def test_xgboost_early_stopping_keeps_best_iteration(sample_cleaned_df, tmp_path):
+    splitter = DataSplitter()
+    train_df, val_df, _ = splitter.split(sample_cleaned_df)
+
+    fb = FeatureBuilder()
+    X_train, y_train = fb.build_features(train_df, fit=True)
+    X_val, y_val = fb.build_features(val_df, fit=False)
+
+    model = XGBoostModel()
+    model.train(
+        X_train, y_train, eval_set=[(X_val, y_val)], checkpoint_dir=tmp_path
+    )
+
+    summary = model.training_summary
+    assert summary["trees_kept"] == summary["best_iteration"] + 1
+    assert summary["trees_kept"] <= summary["max_rounds"]
+    assert model.model.get_params()["callbacks"] is None